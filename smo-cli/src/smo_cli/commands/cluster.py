@@ -1,9 +1,16 @@
+import threading
+
 import click
 from dishka.integrations.click import FromDishka
 from rich.table import Table
+from sqlalchemy import Engine
+from sqlalchemy.orm import sessionmaker
 
+from smo_cli.config import Config
 from smo_cli.console import Console
+from smo_core.helpers import GrafanaHelper, KarmadaHelper
 from smo_core.services.cluster_service import ClusterService
+from smo_core.services.cluster_sync import ClusterInventorySync
 
 
 @click.group
@@ -27,6 +34,43 @@ def sync(
     console.print(table)
 
 
+@cluster.command
+def watch(
+    console: FromDishka[Console],
+    karmada: FromDishka[KarmadaHelper],
+    grafana: FromDishka[GrafanaHelper],
+    config: FromDishka[Config],
+    engine: FromDishka[Engine],
+):
+    """Keeps the local DB in sync with Karmada, following cluster changes."""
+
+    def show_events(events):
+        for event in events:
+            changes = ", ".join(
+                f"{name}: {old} -> {new}"
+                for name, (old, new) in event["changes"].items()
+            )
+            console.print(
+                f"[cyan]{event['cluster']}[/cyan] {event['type']} {changes}".rstrip()
+            )
+
+    cluster_sync = ClusterInventorySync(
+        karmada,
+        grafana,
+        config.data,
+        sessionmaker(autocommit=False, autoflush=False, bind=engine),
+        listeners=[show_events],
+    )
+    console.info("Watching cluster changes from Karmada (Ctrl-C to stop)...")
+    cluster_sync.start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        console.print("Cluster watch stopped.")
+    finally:
+        cluster_sync.stop()
+
+
 @cluster.command(name="list")
 def list_clusters(
     console: FromDishka[Console],
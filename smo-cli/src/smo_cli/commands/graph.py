@@ -1,4 +1,5 @@
 import sys
+import threading
 from collections.abc import Iterable
 
 import click
@@ -7,11 +8,16 @@ from dishka.integrations.click import FromDishka
 from rich.panel import Panel
 from rich.syntax import Syntax
 from rich.table import Table
+from sqlalchemy import Engine
+from sqlalchemy.orm import sessionmaker
 
+from smo_cli.config import Config
 from smo_cli.console import Console
+from smo_core.helpers import GrafanaHelper, KarmadaHelper, PrometheusHelper
 from smo_core.models.graph import Graph
-from smo_core.services.graph_service import GraphService
-from smo_core.utils import get_graph_from_artifact
+from smo_core.services.graph_service import TRIGGER_MODE_SMO, GraphService
+from smo_core.services.trigger_evaluator import TriggerEvaluator
+from smo_core.utils import ArtifactCache, get_graph_from_artifact
 
 from .exceptions import CliException
 
@@ -33,7 +39,7 @@ def deploy(
 ):
     """Deploys a new HDAG from a file or OCI URL."""
     console.info(f"Deploying graph from '{descriptor}' into project '{project}'...")
-    graph_data = get_graph_data(descriptor)
+    graph_data = get_graph_data(descriptor, graph_service.artifact_cache)
 
     if not graph_data or "hdaGraph" not in graph_data:
         console.error("Error: Invalid HDAG descriptor format.")
@@ -47,6 +53,32 @@ def deploy(
     console.info("Use 'smo-cli graph list' to check status.")
 
 
+@graph.command()
+@click.argument("descriptor", type=click.STRING)
+def update(
+    descriptor: str,
+    console: FromDishka[Console],
+    graph_service: FromDishka[GraphService],
+):
+    """Updates a graph from a new version of its descriptor (file or OCI URL)."""
+    graph_data = get_graph_data(descriptor, graph_service.artifact_cache)
+
+    if not graph_data or "hdaGraph" not in graph_data:
+        console.error("Error: Invalid HDAG descriptor format.")
+        sys.exit(1)
+
+    name = graph_data["hdaGraph"]["id"]
+    console.info(f"Updating graph '{name}' from '{descriptor}'...")
+    diff = graph_service.update_graph(name, graph_data["hdaGraph"])
+
+    for change in ("added", "removed", "changed"):
+        if diff[change]:
+            console.print(f"  {change.capitalize()}: {', '.join(diff[change])}")
+    if not any(diff[change] for change in ("added", "removed", "changed")):
+        console.print("  No service changed.")
+    console.success(f"Graph '{name}' updated successfully.")
+
+
 @graph.command(name="list")
 @click.option("--project", help="Filter graphs by project.")
 def list_graphs(
@@ -164,15 +196,61 @@ def start(
     console.success(f"Graph '{name}' started successfully.")
 
 
+@graph.command()
+@click.option(
+    "--interval",
+    type=float,
+    default=None,
+    help="Seconds between evaluations (default: triggers.interval_seconds).",
+)
+def triggers(
+    interval: float | None,
+    console: FromDishka[Console],
+    config: FromDishka[Config],
+    engine: FromDishka[Engine],
+    karmada: FromDishka[KarmadaHelper],
+    grafana: FromDishka[GrafanaHelper],
+    prometheus: FromDishka[PrometheusHelper],
+):
+    """Evaluates the triggers of conditional services and deploys them."""
+    if config.get("triggers.mode") != TRIGGER_MODE_SMO:
+        console.warning(
+            "The 'triggers.mode' config is not 'smo': conditional services "
+            "may also be deployed by Prometheus alerts."
+        )
+    if interval is None:
+        interval = float(config.get("triggers.interval_seconds", 5))
+
+    def show_trigger(name, elapsed):
+        console.success(f"Service '{name}' deployed (condition held {elapsed:.0f}s).")
+
+    evaluator = TriggerEvaluator(
+        karmada,
+        grafana,
+        prometheus,
+        config.data,
+        sessionmaker(autocommit=False, autoflush=False, bind=engine),
+        interval=interval,
+        on_trigger=show_trigger,
+    )
+    console.info(f"Evaluating triggers every {interval}s (Ctrl-C to stop)...")
+    stop_event = threading.Event()
+    try:
+        evaluator.run(stop_event)
+    except KeyboardInterrupt:
+        stop_event.set()
+        console.print("Trigger evaluation stopped.")
+
+
 #
 # Utilities
 #
-def get_graph_data(descriptor: str) -> dict:
+def get_graph_data(descriptor: str, cache: ArtifactCache | None = None) -> dict:
     if descriptor.startswith("oci://"):
-        return get_graph_from_artifact(descriptor)
+        return get_graph_from_artifact(descriptor, cache)
 
     if descriptor.startswith("http://") or descriptor.startswith("https://"):
-        return get_graph_from_artifact(descriptor)
+        return get_graph_from_artifact(descriptor, cache)
 
     if descriptor.endswith(".yaml") or descriptor.endswith(".yml"):
         with open(descriptor) as f:
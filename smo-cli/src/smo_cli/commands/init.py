@@ -4,7 +4,7 @@ from sqlalchemy import Engine
 
 from smo_cli.config import Config, DefaultConfig
 from smo_cli.console import Console
-from smo_core.models.base import Base
+from smo_core.models import init_db
 
 
 @click.command
@@ -33,7 +33,7 @@ def do_init(engine: Engine, console: Console):
         )
 
     # Initialize the database
-    Base.metadata.create_all(bind=engine)
+    init_db(engine)
     url = engine.url
     console.info(f"  -> Ensured local database is created: [green]{url}[/green]")
 
@@ -1,10 +1,31 @@
+import threading
 import time
 
 import click
 from dishka.integrations.click import FromDishka
+from sqlalchemy.orm import Session
 
+from smo_cli.config import Config
 from smo_cli.console import Console
+from smo_core.helpers import KarmadaHelper, PrometheusHelper
+from smo_core.models import Cluster
+from smo_core.services.calibration_service import CalibrationService
+from smo_core.services.graph_service import GraphService
+from smo_core.services.scaler_daemon import (
+    ScalerDaemon,
+    load_policies_from_db,
+    load_policies_from_yaml,
+)
 from smo_core.services.scaler_service import ScalerService
+from smo_core.utils.placement import swap_placement
+from smo_core.utils.queueing import capacity_table
+from smo_core.utils.scaling import (
+    backtest_forecaster,
+    forecast_lead_time_from_intent,
+    scaling_loop,
+)
+
+from .exceptions import CliException
 
 
 @click.group()
@@ -21,19 +42,41 @@ def scaler():
     "--target-namespace", default="default", help="Namespace of the target deployment."
 )
 @click.option(
-    "--up-threshold", type=float, required=True, help="RPS threshold to scale up."
+    "--policy",
+    type=click.Choice(["threshold", "queueing"]),
+    default="threshold",
+    help="Scaling policy: RPS thresholds, or M/M/c queueing model (Erlang-C).",
+)
+@click.option("--up-threshold", type=float, help="RPS threshold to scale up.")
+@click.option("--down-threshold", type=float, help="RPS threshold to scale down.")
+@click.option("--up-replicas", type=int, help="Number of replicas to scale up to.")
+@click.option(
+    "--down-replicas",
+    type=int,
+    help="Number of replicas to scale down to.",
 )
 @click.option(
-    "--down-threshold", type=float, required=True, help="RPS threshold to scale down."
+    "--service-rate",
+    type=float,
+    help="Requests per second a single replica handles (queueing policy).",
 )
 @click.option(
-    "--up-replicas", type=int, required=True, help="Number of replicas to scale up to."
+    "--target-wait",
+    type=float,
+    help="Target waiting time in queue, in seconds (queueing policy).",
 )
 @click.option(
-    "--down-replicas",
-    type=int,
-    required=True,
-    help="Number of replicas to scale down to.",
+    "--percentile",
+    type=float,
+    default=None,
+    help="Percentile of the waiting time to keep under the target, e.g. 0.95 "
+    "(queueing policy, default: mean waiting time).",
+)
+@click.option(
+    "--min-replicas", type=int, default=1, help="Minimum replicas (queueing policy)."
+)
+@click.option(
+    "--max-replicas", type=int, default=20, help="Maximum replicas (queueing policy)."
 )
 @click.option(
     "--poll-interval", type=int, default=15, help="Seconds between scaling checks."
@@ -46,62 +89,368 @@ def scaler():
 )
 def run(
     scaler_service: FromDishka[ScalerService],
+    karmada: FromDishka[KarmadaHelper],
     console: FromDishka[Console],
     target_deployment: str,
     target_namespace: str,
-    up_threshold: float,
-    down_threshold: float,
-    up_replicas: int,
-    down_replicas: int,
+    policy: str,
+    up_threshold: float | None,
+    down_threshold: float | None,
+    up_replicas: int | None,
+    down_replicas: int | None,
+    service_rate: float | None,
+    target_wait: float | None,
+    percentile: float | None,
+    min_replicas: int,
+    max_replicas: int,
     poll_interval: int,
     cooldown_period: int,
 ):
-    """Run the threshold-based autoscaler in a continuous loop."""
+    """Run the threshold-based (or queueing) autoscaler in a continuous loop."""
+    if policy == "threshold":
+        required = {
+            "--up-threshold": up_threshold,
+            "--down-threshold": down_threshold,
+            "--up-replicas": up_replicas,
+            "--down-replicas": down_replicas,
+        }
+    else:
+        required = {"--service-rate": service_rate, "--target-wait": target_wait}
+    missing = [option for option, value in required.items() if value is None]
+    if missing:
+        msg = f"Missing option(s) for the {policy} policy: {', '.join(missing)}"
+        raise click.UsageError(msg)
+
     console.print("H3NI Modular Scaler (via SMO-CLI) Starting", style="bold green")
     console.print(f"  - Target: [cyan]{target_namespace}/{target_deployment}[/cyan]")
-    console.print(
-        f"  - Scale Up: > [bold magenta]{up_threshold}[/bold magenta] RPS -> [bold green]{up_replicas}[/bold green] replicas"
-    )
-    console.print(
-        f"  - Scale Down: < [bold magenta]{down_threshold}[/bold magenta] RPS -> [bold red]{down_replicas}[/bold red] replicas"
-    )
+    if policy == "threshold":
+        console.print(
+            f"  - Scale Up: > [bold magenta]{up_threshold}[/bold magenta] RPS -> [bold green]{up_replicas}[/bold green] replicas"
+        )
+        console.print(
+            f"  - Scale Down: < [bold magenta]{down_threshold}[/bold magenta] RPS -> [bold red]{down_replicas}[/bold red] replicas"
+        )
+    else:
+        table = capacity_table(
+            service_rate, target_wait, percentile, maximum_replicas=max_replicas
+        )
+        console.print(
+            f"  - Queueing model: [bold magenta]{service_rate}[/bold magenta] RPS per replica, "
+            f"wait < [bold magenta]{target_wait}[/bold magenta]s, "
+            f"{min_replicas}-{max_replicas} replicas"
+        )
     console.print(
         f"  - Timings: Poll every {poll_interval}s, Cooldown {cooldown_period}s"
     )
     console.print("-" * 50)
 
-    last_scale_time = 0
+    # Replica counts are served by the watch-fed deployment cache
+    karmada.start_deployment_cache()
+    try:
+        last_scale_time = 0
+
+        while True:
+            now = time.time()
+            if (now - last_scale_time) < cooldown_period:
+                console.print(
+                    f"In cooldown period. Waiting for {cooldown_period - (now - last_scale_time):.0f} more seconds.",
+                    style="dim",
+                )
+            else:
+                if policy == "threshold":
+                    result = scaler_service.run_threshold_scaler_iteration(
+                        target_deployment=target_deployment,
+                        target_namespace=target_namespace,
+                        scale_up_threshold=up_threshold,
+                        scale_down_threshold=down_threshold,
+                        scale_up_replicas=up_replicas,
+                        scale_down_replicas=down_replicas,
+                    )
+                else:
+                    result = scaler_service.run_queueing_scaler_iteration(
+                        target_deployment=target_deployment,
+                        target_namespace=target_namespace,
+                        capacity_table=table,
+                        min_replicas=min_replicas,
+                    )
+
+                action = result.get("action")
+                if action in ("scale_up", "scale_down"):
+                    console.print(
+                        f"[bold green]SCALING ACTION TAKEN:[/] {result['reason']}"
+                    )
+                    last_scale_time = time.time()
+                elif action == "none":
+                    console.print(
+                        f"No action needed. Replicas: {result.get('current_replicas')}, Rate: {result.get('request_rate', 0):.2f} RPS"
+                    )
+                else:  # error
+                    console.print(
+                        f"[bold red]Error in scaling iteration:[/] {result.get('reason')}"
+                    )
+
+            time.sleep(poll_interval)
+    finally:
+        karmada.stop_deployment_cache()
+
+
+@scaler.command()
+@click.option(
+    "--policies",
+    "policies_file",
+    type=click.Path(exists=True, dir_okay=False),
+    help="YAML file with the scaling policies (default: policies from the database).",
+)
+@click.option(
+    "--max-workers",
+    type=int,
+    default=8,
+    help="Maximum number of concurrent scaling actions.",
+)
+def daemon(
+    karmada: FromDishka[KarmadaHelper],
+    prometheus: FromDishka[PrometheusHelper],
+    db_session: FromDishka[Session],
+    console: FromDishka[Console],
+    policies_file: str | None,
+    max_workers: int,
+):
+    """Run the threshold-based autoscaler for many deployments at once."""
+    if policies_file:
+        policies = load_policies_from_yaml(policies_file)
+    else:
+        policies = load_policies_from_db(db_session)
 
-    while True:
-        now = time.time()
-        if (now - last_scale_time) < cooldown_period:
+    if not policies:
+        console.print("No scaling policies found.", style="yellow")
+        return
+
+    console.print(
+        "H3NI Modular Scaler Daemon (via SMO-CLI) Starting", style="bold green"
+    )
+    for policy in policies:
+        console.print(
+            f"  - [cyan]{policy.target_namespace}/{policy.target_deployment}[/cyan]: "
+            f"> {policy.up_threshold} RPS -> {policy.up_replicas}, "
+            f"< {policy.down_threshold} RPS -> {policy.down_replicas} "
+            f"(poll {policy.poll_interval}s, cooldown {policy.cooldown_period}s)"
+        )
+    console.print("-" * 50)
+
+    def show_result(policy, result):
+        target = f"{policy.target_namespace}/{policy.target_deployment}"
+        if result["action"] in ("scale_up", "scale_down"):
             console.print(
-                f"In cooldown period. Waiting for {cooldown_period - (now - last_scale_time):.0f} more seconds.",
-                style="dim",
+                f"[bold green]SCALING ACTION TAKEN[/] ({target}): {result['reason']}"
             )
+        elif result["action"] == "error":
+            console.print(f"[bold red]Error[/] ({target}): {result['reason']}")
         else:
-            result = scaler_service.run_threshold_scaler_iteration(
-                target_deployment=target_deployment,
-                target_namespace=target_namespace,
-                scale_up_threshold=up_threshold,
-                scale_down_threshold=down_threshold,
-                scale_up_replicas=up_replicas,
-                scale_down_replicas=down_replicas,
-            )
+            console.print(f"{target}: {result['reason']}", style="dim")
 
-            action = result.get("action")
-            if action in ("scale_up", "scale_down"):
-                console.print(
-                    f"[bold green]SCALING ACTION TAKEN:[/] {result['reason']}"
-                )
-                last_scale_time = time.time()
-            elif action == "none":
-                console.print(
-                    f"No action needed. Replicas: {result.get('current_replicas')}, Rate: {result.get('request_rate', 0):.2f} RPS"
-                )
-            else:  # error
-                console.print(
-                    f"[bold red]Error in scaling iteration:[/] {result.get('reason')}"
-                )
+    scaler_daemon = ScalerDaemon(
+        karmada,
+        prometheus,
+        policies,
+        max_workers=max_workers,
+        on_result=show_result,
+    )
+    stop_event = threading.Event()
+    try:
+        scaler_daemon.run(stop_event)
+    except KeyboardInterrupt:
+        stop_event.set()
+        console.print("Scaler daemon stopped.")
+
+
+@scaler.command("graph")
+@click.argument("name", type=click.STRING)
+@click.option(
+    "--lead-time",
+    type=float,
+    default=None,
+    help="Forecast lead time in seconds (default: from the graph's hdaGraphIntent).",
+)
+@click.option(
+    "--maximum-replicas",
+    type=int,
+    default=5,
+    help="Maximum number of replicas of each service.",
+)
+@click.option(
+    "--policy",
+    type=click.Choice(["linear", "queueing"]),
+    default="linear",
+    help="Capacity model: calibrated alpha/beta, or M/M/c queueing model (Erlang-C).",
+)
+@click.option(
+    "--service-rate",
+    type=float,
+    help="Requests per second a single replica handles (queueing policy).",
+)
+@click.option(
+    "--target-wait",
+    type=float,
+    help="Target waiting time in queue, in seconds (queueing policy).",
+)
+@click.option(
+    "--percentile",
+    type=float,
+    default=None,
+    help="Percentile of the waiting time to keep under the target, e.g. 0.95 "
+    "(queueing policy, default: mean waiting time).",
+)
+def scale_graph(
+    name: str,
+    graph_service: FromDishka[GraphService],
+    karmada: FromDishka[KarmadaHelper],
+    prometheus: FromDishka[PrometheusHelper],
+    db_session: FromDishka[Session],
+    config: FromDishka[Config],
+    console: FromDishka[Console],
+    lead_time: float | None,
+    maximum_replicas: int,
+    policy: str,
+    service_rate: float | None,
+    target_wait: float | None,
+    percentile: float | None,
+):
+    """Run the replica scaling algorithm for the services of a graph."""
+    table = None
+    if policy == "queueing":
+        required = {"--service-rate": service_rate, "--target-wait": target_wait}
+        missing = [option for option, value in required.items() if value is None]
+        if missing:
+            msg = f"Missing option(s) for the {policy} policy: {', '.join(missing)}"
+            raise click.UsageError(msg)
+        table = capacity_table(
+            service_rate, target_wait, percentile, maximum_replicas=maximum_replicas
+        )
+
+    graph_obj = graph_service.get_graph(name)
+    if not graph_obj:
+        msg = f"Graph '{name}' not found."
+        raise CliException(msg)
+
+    placement = swap_placement(
+        {s.name: s.cluster_affinity for s in graph_obj.services if s.cluster_affinity}
+    )
+    if not placement:
+        console.print("No service placements found.", style="yellow")
+        return
+
+    if lead_time is None:
+        lead_time = forecast_lead_time_from_intent(graph_obj.graph_descriptor)
+    interval = int(config.get("scaling.interval_seconds", 30))
+    gpus = {s.name: int(s.gpu or 0) for s in graph_obj.services}
+    # Coefficients fitted from the latest history, where available
+    calibration_service = CalibrationService(db_session, karmada, prometheus)
+    calibration_service.refresh([s.name for s in graph_obj.services])
 
-        time.sleep(poll_interval)
+    console.print(f"Scaling graph '{name}'", style="bold green")
+    if lead_time:
+        console.print(f"  - Predictive scaling, lead time {lead_time:.0f}s")
+    if table is not None:
+        console.print(
+            f"  - Queueing model: {service_rate} RPS per replica, wait < {target_wait}s"
+        )
+
+    stop_event = threading.Event()
+    threads = []
+    for cluster_name, managed_services in placement.items():
+        cluster = db_session.query(Cluster).filter_by(name=cluster_name).first()
+        if cluster is None:
+            console.warning(f"Cluster '{cluster_name}' not found, skipping.")
+            continue
+        console.print(f"  - [cyan]{cluster_name}[/cyan]: {', '.join(managed_services)}")
+
+        alpha, beta = calibration_service.get_coefficients(managed_services)
+        thread = threading.Thread(
+            target=scaling_loop,
+            args=(
+                name,
+                [gpus.get(s, 0) for s in managed_services],
+                alpha,
+                beta,
+                cluster.available_cpu,
+                cluster.acceleration,
+                [maximum_replicas] * len(managed_services),
+                managed_services,
+                interval,
+                config.get("karmada_kubeconfig"),
+                config.get("prometheus_host"),
+                stop_event,
+            ),
+            kwargs={
+                "forecast_lead_time": lead_time,
+                "capacity_tables": (
+                    [table] * len(managed_services) if table is not None else None
+                ),
+            },
+            name=f"smo-scaler-{cluster_name}",
+            daemon=True,
+        )
+        thread.start()
+        threads.append(thread)
+
+    try:
+        for thread in threads:
+            while thread.is_alive():
+                thread.join(1)
+    except KeyboardInterrupt:
+        stop_event.set()
+        console.print("Graph scaler stopped.")
+
+
+@scaler.command()
+@click.option(
+    "--target-deployment", required=True, help="Name of the deployment to backtest."
+)
+@click.option(
+    "--lead-time", type=float, required=True, help="Forecast lead time in seconds."
+)
+@click.option(
+    "--lookback",
+    type=float,
+    default=3600,
+    help="Seconds of request-rate history to replay.",
+)
+@click.option(
+    "--step", type=float, default=30, help="Seconds between two history samples."
+)
+@click.option("--level-smoothing", type=float, default=0.5)
+@click.option("--trend-smoothing", type=float, default=0.3)
+def backtest(
+    prometheus: FromDishka[PrometheusHelper],
+    console: FromDishka[Console],
+    target_deployment: str,
+    lead_time: float,
+    lookback: float,
+    step: float,
+    level_smoothing: float,
+    trend_smoothing: float,
+):
+    """Replay the request-rate history of a deployment through the forecaster."""
+    now = time.time()
+    history = prometheus.get_request_rate_history(
+        target_deployment, now - lookback, now, step
+    )
+    metrics = backtest_forecaster(
+        [value for _ts, value in history],
+        interval=step,
+        lead_time=lead_time,
+        level_smoothing=level_smoothing,
+        trend_smoothing=trend_smoothing,
+    )
+    if not metrics["samples"]:
+        console.print("Not enough history to backtest the forecaster.", style="yellow")
+        return
+
+    console.print(
+        f"Forecast of {target_deployment} {lead_time:.0f}s ahead "
+        f"({metrics['samples']} samples):"
+    )
+    console.print(f"  - MAE:  {metrics['mae']:.2f} RPS")
+    console.print(f"  - RMSE: {metrics['rmse']:.2f} RPS")
+    if metrics["mape"] is not None:
+        console.print(f"  - MAPE: {metrics['mape']:.1%}")
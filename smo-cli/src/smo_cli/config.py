@@ -117,18 +117,52 @@ class DefaultConfig(BaseConfig):
             "karmada_kubeconfig": str(
                 Path.home() / ".kube" / "karmada-apiserver.config"
             ),
+            "kubernetes": {
+                "pool_size": 16,
+                "qps": 50,
+                "burst": 100,
+            },
             "grafana": {
                 "host": "http://localhost:3000",
                 "username": "admin",
                 "password": "prom-operator",  # A more realistic default
             },
             "prometheus_host": "http://localhost:9090",
+            # Prometheus reloads are coalesced within this window (seconds)
+            "prometheus_reload_window": 1.0,
             "helm": {
                 "insecure_registry": True,
+                # Maximum number of concurrent helm operations per graph
+                "max_parallel": 8,
+                # Helm commands taking longer than this are killed
+                "timeout_seconds": 300,
+                # "helm" runs helm for each operation, "native" renders the
+                # charts once and applies the manifests with server-side apply
+                "engine": "helm",
+            },
+            # Re-placement: the moved services are brought up on their new
+            # cluster, and ready, before they are removed from the old one
+            "migration": {
+                "max_concurrent": 2,
+                "readiness_timeout_seconds": 300,
             },
             "scaling": {
                 "interval_seconds": 30,
             },
+            # Local cache of the pulled Helm charts and HDAG descriptors
+            "artifact_cache": {
+                "enabled": True,
+                "dir": str(self.get_smo_dir() / "cache" / "artifacts"),
+                "max_size_mb": 2048,
+                # Charts and descriptors pulled by tag are refreshed after this
+                "tag_ttl_seconds": 3600,
+            },
+            # Conditional services: triggered by Prometheus alerts
+            # ("prometheus") or evaluated by `smo-cli graph triggers` ("smo")
+            "triggers": {
+                "mode": "prometheus",
+                "interval_seconds": 5,
+            },
         }
 
     def write_default_config(self, path: Path | str | None = None) -> None:
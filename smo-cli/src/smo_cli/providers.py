@@ -12,11 +12,17 @@ from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 # --- Core Helpers and Services ---
-from smo_core.helpers import GrafanaHelper, KarmadaHelper, PrometheusHelper
+from smo_core.helpers import (
+    GrafanaHelper,
+    KarmadaHelper,
+    KubeClientSettings,
+    PrometheusHelper,
+)
+from smo_core.models import upgrade_schema
 from smo_core.services import ClusterService, GraphService, ScalerService
 
 # --- Core Application Components ---
-from .config import Config
+from .config import Config, DefaultConfig
 from .console import Console
 
 
@@ -56,7 +62,12 @@ class DbProvider(Provider):
     @provide
     def get_db_engine(self, config: Config) -> Engine:
         db_url = config.get("db.url")
-        return create_engine(db_url)
+        engine = create_engine(db_url)
+        # Databases created by earlier versions lack the columns added since.
+        # Without a config file, 'smo-cli init' has not run yet and creates it.
+        if not isinstance(config, DefaultConfig):
+            upgrade_schema(engine)
+        return engine
 
     @provide
     def get_db_session(self, engine: Engine) -> Iterable[Session]:
@@ -77,7 +88,10 @@ class InfraProvider(Provider):
     @provide
     def get_karmada(self, config: Config, console: Console) -> KarmadaHelper:
         console.debug("Initializing KarmadaHelper...")
-        return KarmadaHelper(config.get("karmada_kubeconfig"))
+        return KarmadaHelper(
+            config.get("karmada_kubeconfig"),
+            settings=KubeClientSettings.from_dict(config.get("kubernetes")),
+        )
 
     @provide
     def get_prometheus(self, config: Config, console: Console) -> PrometheusHelper:
@@ -85,6 +99,7 @@ class InfraProvider(Provider):
         return PrometheusHelper(
             config.get("prometheus_host"),
             time_window=str(config.get("scaling.interval_seconds")),
+            reload_window=float(config.get("prometheus_reload_window", 1.0)),
         )
 
     @provide
@@ -40,3 +40,29 @@ def test_make_table_with_model_objects(client: CliRunner, mock_cluster_service):
     result = client.invoke(main, ["-v", "cluster", "list"])
     assert result.exit_code == 0, result.output
     assert "model-cluster" in result.output
+
+
+def test_cluster_watch(client: CliRunner, mocker):
+    """Tests 'smo-cli cluster watch' until it is interrupted."""
+    mocker.patch("kubernetes.config.load_kube_config")
+    mock_sync = mocker.patch("smo_cli.commands.cluster.ClusterInventorySync")
+    mock_event = mocker.patch("smo_cli.commands.cluster.threading.Event")
+    mock_event.return_value.wait.side_effect = KeyboardInterrupt
+
+    result = client.invoke(main, ["cluster", "watch"])
+
+    assert result.exit_code == 0, result.output
+    assert "Cluster watch stopped." in result.output
+    mock_sync.return_value.start.assert_called_once()
+    mock_sync.return_value.stop.assert_called_once()
+
+    show_events = mock_sync.call_args.kwargs["listeners"][0]
+    show_events(
+        [
+            {
+                "type": "updated",
+                "cluster": "cluster-1",
+                "changes": {"available_cpu": [4.0, 2.0]},
+            }
+        ]
+    )
@@ -22,6 +22,19 @@ def test_graph_deploy_invalid_file(client: CliRunner, tmp_path):
     assert "Error: Invalid HDAG descriptor format" in result.output
 
 
+def test_graph_update_from_file(client: CliRunner, hdag_file: str, mock_graph_service):
+    mock_graph_service.update_graph.return_value = {
+        "added": [],
+        "removed": [],
+        "changed": ["service-a"],
+        "unchanged": [],
+    }
+    result = client.invoke(main, ["-v", "graph", "update", hdag_file])
+    assert result.exit_code == 0, result.output
+    mock_graph_service.update_graph.assert_called_once()
+    assert "Changed: service-a" in result.output
+
+
 def test_graph_list_no_project(client: CliRunner):
     """Tests `graph list` without the --project flag. Should use the mock db_session."""
     result = client.invoke(main, ["-v", "graph", "list"])
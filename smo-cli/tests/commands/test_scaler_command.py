@@ -1,6 +1,11 @@
+from unittest.mock import MagicMock
+
 from click.testing import CliRunner
+from sqlalchemy.orm import Session
 
 from smo_cli.cli import main
+from smo_core.models import Cluster, ServiceCapacity
+from smo_core.services.graph_service import GraphService
 
 
 def test_scaler_run(client: CliRunner, mocker):
@@ -9,6 +14,9 @@ def test_scaler_run(client: CliRunner, mocker):
     We patch `time.sleep` to raise KeyboardInterrupt to break the infinite loop.
     """
     mocker.patch("time.sleep", side_effect=KeyboardInterrupt)
+    mocker.patch("kubernetes.config.load_kube_config")
+    start_cache = mocker.patch("smo_core.helpers.KarmadaHelper.start_deployment_cache")
+    stop_cache = mocker.patch("smo_core.helpers.KarmadaHelper.stop_deployment_cache")
 
     result = client.invoke(
         main,
@@ -35,3 +43,150 @@ def test_scaler_run(client: CliRunner, mocker):
     # We can still check that the service was called before the interruption.
     assert "SCALING ACTION TAKEN" in result.output
     assert "Mocked scaling action" in result.output
+    start_cache.assert_called_once()
+    stop_cache.assert_called_once()
+
+
+def test_scaler_run_queueing(client: CliRunner, mocker):
+    mocker.patch("time.sleep", side_effect=KeyboardInterrupt)
+    mocker.patch("kubernetes.config.load_kube_config")
+    mocker.patch("smo_core.helpers.KarmadaHelper.start_deployment_cache")
+    mocker.patch("smo_core.helpers.KarmadaHelper.stop_deployment_cache")
+
+    result = client.invoke(
+        main,
+        [
+            "scaler",
+            "run",
+            "--target-deployment",
+            "test-deploy",
+            "--policy",
+            "queueing",
+            "--service-rate",
+            "10",
+            "--target-wait",
+            "0.1",
+            "--max-replicas",
+            "5",
+        ],
+    )
+
+    assert "Mocked queueing action (5 rows)" in result.output
+
+
+def test_scaler_run_missing_options(client: CliRunner):
+    result = client.invoke(
+        main, ["scaler", "run", "--target-deployment", "test-deploy"]
+    )
+
+    assert result.exit_code == 2
+    assert "--up-threshold" in result.output
+
+
+def test_scaler_daemon(client: CliRunner, mocker, tmp_path):
+    """Tests the 'smo-cli scaler daemon' command with a policies file."""
+    mocker.patch("kubernetes.config.load_kube_config")
+    mock_daemon = mocker.patch("smo_cli.commands.scaler.ScalerDaemon")
+    policies_file = tmp_path / "policies.yaml"
+    policies_file.write_text(
+        "policies:\n"
+        "  - target_deployment: svc-a\n"
+        "    up_threshold: 10\n"
+        "    down_threshold: 2\n"
+        "    up_replicas: 3\n"
+        "    down_replicas: 1\n"
+    )
+
+    result = client.invoke(main, ["scaler", "daemon", "--policies", str(policies_file)])
+
+    assert result.exit_code == 0, result.output
+    assert "default/svc-a" in result.output
+    policies = mock_daemon.call_args.args[2]
+    assert [p.target_deployment for p in policies] == ["svc-a"]
+    mock_daemon.return_value.run.assert_called_once()
+
+
+def test_scaler_graph(client: CliRunner, mocker, dishka_container):
+    """The lead time of the scaling loop comes from the graph's intent."""
+    session = dishka_container.get(Session)
+    session.add(
+        Cluster(
+            name="cluster-1",
+            available_cpu=8.0,
+            available_ram="16 GiB",
+            availability=True,
+            acceleration=False,
+        )
+    )
+    session.commit()
+
+    graph_obj = MagicMock()
+    graph_obj.services = [
+        MagicMock(cluster_affinity="cluster-1", gpu="0"),
+        MagicMock(cluster_affinity="cluster-1", gpu="1"),
+    ]
+    graph_obj.services[0].name = "svc-a"
+    graph_obj.services[1].name = "svc-b"
+    graph_obj.graph_descriptor = {
+        "hdaGraphIntent": {"predictiveScaling": {"enabled": True, "leadTime": 60}}
+    }
+    mocker.patch.object(
+        dishka_container.get(GraphService), "get_graph", return_value=graph_obj
+    )
+    mock_loop = mocker.patch("smo_cli.commands.scaler.scaling_loop")
+    mocker.patch("smo_cli.commands.scaler.CalibrationService.refresh")
+    session.add(ServiceCapacity(service_name="svc-b", alpha=2.0, beta=1.0))
+    session.commit()
+
+    result = client.invoke(main, ["scaler", "graph", "my-graph"])
+
+    assert result.exit_code == 0, result.output
+    args = mock_loop.call_args.args
+    assert args[0] == "my-graph"
+    assert args[1] == [0, 1]
+    assert (args[2], args[3]) == ([1, 2.0], [0, 1.0])
+    assert args[7] == ["svc-a", "svc-b"]
+    assert mock_loop.call_args.kwargs["forecast_lead_time"] == 60.0
+    assert mock_loop.call_args.kwargs["capacity_tables"] is None
+
+    result = client.invoke(
+        main,
+        [
+            "scaler",
+            "graph",
+            "my-graph",
+            "--policy",
+            "queueing",
+            "--service-rate",
+            "10",
+            "--target-wait",
+            "0.5",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    tables = mock_loop.call_args.kwargs["capacity_tables"]
+    assert len(tables) == 2
+    # One entry per replica count, up to --maximum-replicas
+    assert len(tables[0]) == 5
+
+    result = client.invoke(
+        main, ["scaler", "graph", "my-graph", "--policy", "queueing"]
+    )
+    assert result.exit_code != 0
+    assert "--service-rate" in result.output
+
+
+def test_scaler_backtest(client: CliRunner, mocker):
+    mocker.patch(
+        "smo_core.helpers.PrometheusHelper.get_request_rate_history",
+        return_value=[(t * 30.0, 5.0) for t in range(20)],
+    )
+
+    result = client.invoke(
+        main,
+        ["scaler", "backtest", "--target-deployment", "svc-a", "--lead-time", "60"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "MAE:  0.00 RPS" in result.output
@@ -53,9 +53,11 @@ class MockGraphService:
     def __init__(self):
         self.deploy_graph = MagicMock()
         self.remove_graph = MagicMock()
+        self.update_graph = MagicMock()
         self.trigger_placement = MagicMock()
         self.start_graph = MagicMock()
         self.stop_graph = MagicMock()
+        self.artifact_cache = None
 
         self.db_session = MagicMock()
         self.db_session.query.return_value.all.return_value = [
@@ -106,6 +108,14 @@ class MockScalerService:
             "current_replicas": 2,
         }
 
+    def run_queueing_scaler_iteration(self, **kwargs):
+        return {
+            "action": "scale_up",
+            "new_replicas": 4,
+            "reason": f"Mocked queueing action ({len(kwargs['capacity_table'])} rows).",
+            "current_replicas": 2,
+        }
+
 
 #
 # --- MOCK DISHKA PROVIDER ---
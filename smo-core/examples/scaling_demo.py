@@ -1,5 +1,6 @@
 from smo_core.context import SmoCoreContext
 from smo_core.models import Cluster
+from smo_core.services.calibration_service import CalibrationService
 from smo_core.services.graph_service import GraphService
 from smo_core.utils.placement import swap_placement
 from smo_core.utils.scaling import decide_replicas
@@ -54,6 +55,11 @@ def run_scaling_iteration(context: SmoCoreContext, db_session, name):
         "image-detection": -0.01,
     }
 
+    # Fitted coefficients are used when available, the hand-tuned tables above
+    # are only a fallback for services that have not been calibrated yet.
+    calibration_service = CalibrationService(db_session, karmada, prometheus)
+    calibration_service.refresh([s.name for s in graph.services])
+
     for cluster_name, managed_services in placement.items():
         print(f"Scaling services on cluster {cluster_name}:")
 
@@ -61,8 +67,9 @@ def run_scaling_iteration(context: SmoCoreContext, db_session, name):
         cpu_limits = [karmada.get_cpu_limit(s) for s in managed_services]
 
         acceleration = [ACCELERATION.get(s, 0) for s in managed_services]
-        alpha = [ALPHA.get(s, 1) for s in managed_services]
-        beta = [BETA.get(s, 0) for s in managed_services]
+        alpha, beta = calibration_service.get_coefficients(
+            managed_services, default_alpha=ALPHA, default_beta=BETA
+        )
         maximum_replicas = [MAXIMUM_REPLICAS.get(s, 5) for s in managed_services]
 
         request_rates = [prometheus.get_request_rate(s) for s in managed_services]
@@ -1,9 +1,15 @@
+from .async_helpers import AsyncKarmadaHelper, AsyncPrometheusHelper
 from .grafana.grafana_helper import GrafanaHelper
 from .karmada_helper import KarmadaHelper
+from .kube_client import KubeClientSettings, get_api_client
 from .prometheus_helper import PrometheusHelper
 
 __all__ = [
+    "AsyncKarmadaHelper",
+    "AsyncPrometheusHelper",
     "GrafanaHelper",
     "KarmadaHelper",
+    "KubeClientSettings",
     "PrometheusHelper",
+    "get_api_client",
 ]
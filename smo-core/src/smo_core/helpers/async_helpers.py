@@ -0,0 +1,111 @@
+"""
+Asyncio variants of the Karmada and Prometheus helpers.
+
+The Kubernetes and Prometheus clients are blocking, and calling them from an
+`async def` handler stalls the event loop of the whole worker. These wrappers
+expose the same methods as awaitables, running the blocking calls on a
+thread pool, so that one worker can serve many requests while they wait on
+the Kubernetes API or Prometheus.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from .karmada_helper import KarmadaHelper
+from .prometheus_helper import PrometheusHelper
+
+# Shared by all the async helpers that are not given their own executor
+_default_executor: ThreadPoolExecutor | None = None
+
+
+def get_default_executor() -> ThreadPoolExecutor:
+    global _default_executor
+    if _default_executor is None:
+        _default_executor = ThreadPoolExecutor(
+            max_workers=32, thread_name_prefix="smo-helpers"
+        )
+    return _default_executor
+
+
+class _AsyncWrapper:
+    """Runs the methods of a blocking helper on an executor."""
+
+    def __init__(self, helper, executor: Executor | None = None):
+        self.helper = helper
+        self.executor = executor or get_default_executor()
+
+    async def _run(self, method, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(method, *args, **kwargs)
+        )
+
+
+class AsyncKarmadaHelper(_AsyncWrapper):
+    """Async counterpart of `KarmadaHelper`."""
+
+    helper: KarmadaHelper
+
+    @property
+    def namespace(self) -> str:
+        return self.helper.namespace
+
+    async def get_cluster_info(self) -> dict:
+        return await self._run(self.helper.get_cluster_info)
+
+    async def get_deployment(self, name, namespace=None):
+        return await self._run(self.helper.get_deployment, name, namespace)
+
+    async def get_replicas(self, name):
+        return await self._run(self.helper.get_replicas, name)
+
+    async def get_desired_replicas(self, name, namespace=None):
+        return await self._run(self.helper.get_desired_replicas, name, namespace)
+
+    async def get_desired_replicas_in_namespace(self, namespace=None) -> dict:
+        return await self._run(self.helper.get_desired_replicas_in_namespace, namespace)
+
+    async def get_deployments_status(
+        self, namespace=None, label_selector=None, names=None
+    ) -> dict:
+        return await self._run(
+            self.helper.get_deployments_status, namespace, label_selector, names
+        )
+
+    async def get_cpu_limit(self, name):
+        return await self._run(self.helper.get_cpu_limit, name)
+
+    async def scale_deployment(self, name, replicas, namespace=None):
+        return await self._run(self.helper.scale_deployment, name, replicas, namespace)
+
+
+class AsyncPrometheusHelper(_AsyncWrapper):
+    """Async counterpart of `PrometheusHelper`."""
+
+    helper: PrometheusHelper
+
+    async def query(self, query: str) -> float:
+        return await self._run(self.helper.query, query)
+
+    async def query_vector(self, query: str) -> list[tuple[dict, float]]:
+        return await self._run(self.helper.query_vector, query)
+
+    async def get_request_rate(self, name: str) -> float:
+        return await self._run(self.helper.get_request_rate, name)
+
+    async def get_request_rate_by_job(self, job_name: str) -> float:
+        return await self._run(self.helper.get_request_rate_by_job, job_name)
+
+    async def get_request_rates_by_job(self, job_names: list[str]) -> dict:
+        return await self._run(self.helper.get_request_rates_by_job, job_names)
+
+    async def update_alert_rules(self, alert: dict, action: str) -> None:
+        return await self._run(self.helper.update_alert_rules, alert, action)
+
+    async def update_alert_rules_batch(
+        self, add=(), remove=(), graph_name=None
+    ) -> bool:
+        return await self._run(
+            self.helper.update_alert_rules_batch, add, remove, graph_name
+        )
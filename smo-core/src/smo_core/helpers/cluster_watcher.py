@@ -0,0 +1,201 @@
+"""
+Watch of the Karmada member clusters.
+
+The watcher lists the `cluster.karmada.io/v1alpha1` Cluster objects once,
+then follows a watch on them (resuming from the last seen `resourceVersion`,
+and re-listing when the API server reports it as expired). Each change is
+reported to a callback as parsed cluster info (see `parse_cluster_info`),
+so that the cluster inventory can be kept up to date without polling.
+
+A cluster that has just joined may not have a status yet (Karmada fills it
+in a moment later): it is only reported once its status is complete.
+"""
+
+import threading
+import traceback
+from collections.abc import Callable
+
+from kubernetes import watch
+from kubernetes.client import CustomObjectsApi
+from kubernetes.client.rest import ApiException
+from urllib3.exceptions import HTTPError
+
+from .deployment_cache import HTTP_GONE
+from .karmada_helper import (
+    CLUSTER_GROUP,
+    CLUSTER_PLURAL,
+    CLUSTER_VERSION,
+    parse_cluster_info,
+)
+
+# on_change(cluster_infos, removed, snapshot): `cluster_infos` maps the names
+# of the added or modified clusters to their info, `removed` holds the names
+# of the deleted ones, and `snapshot` is True when `cluster_infos` is the
+# complete list of clusters (after a (re)list).
+ClusterChangeCallback = Callable[[dict[str, dict], set[str], bool], None]
+
+
+class ClusterWatcher:
+    """Reports the changes of the Karmada clusters to a callback."""
+
+    def __init__(
+        self,
+        custom_api: CustomObjectsApi,
+        on_change: ClusterChangeCallback,
+        watch_timeout: int = 300,
+        retry_delay: float = 5.0,
+    ):
+        self.custom_api = custom_api
+        self.on_change = on_change
+        self.watch_timeout = watch_timeout
+        self.retry_delay = retry_delay
+
+        self.resource_version: str | None = None
+
+        # Last reported info of each known cluster, to drop no-op updates
+        # (Karmada updates the status of the clusters on every heartbeat).
+        self._clusters: dict[str, dict] = {}
+        self._relist_needed = False
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._watch: watch.Watch | None = None
+
+    # --- Lifecycle ---
+
+    def start(self) -> None:
+        """
+        Performs the initial list, then follows the watch in a background
+        thread. If the clusters can't be listed yet (e.g. Karmada is not up),
+        the list is retried in the background.
+        """
+        if self._thread is not None:
+            return
+        try:
+            self.relist()
+        except (ApiException, HTTPError, OSError) as e:
+            print(f"Warning: could not list clusters: {e}")
+            self._relist_needed = True
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="cluster-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._watch is not None:
+            self._watch.stop()
+        if self._thread is not None:
+            self._thread.join(timeout=self.retry_delay)
+            self._thread = None
+
+    def resync(self) -> None:
+        """Re-lists all the clusters, e.g. after `on_change` failed to apply a change."""
+        self._relist_needed = True
+        if self._watch is not None:
+            self._watch.stop()
+
+    # --- Synchronization ---
+
+    def relist(self) -> None:
+        """Lists all the clusters and reports them as a snapshot."""
+        response = self.custom_api.list_cluster_custom_object(
+            CLUSTER_GROUP, CLUSTER_VERSION, CLUSTER_PLURAL
+        )
+        clusters = {}
+        for item in response["items"]:
+            name = item["metadata"]["name"]
+            info = _parse_cluster(item)
+            if info is None:
+                info = self._clusters.get(name)
+            if info is not None:
+                clusters[name] = info
+        removed = set(self._clusters) - set(clusters)
+
+        self.on_change(clusters, removed, True)
+        self._clusters = clusters
+        self.resource_version = response["metadata"]["resourceVersion"]
+
+    def handle_event(self, event: dict) -> None:
+        """Applies a single watch event, reporting it if it changes a cluster."""
+        event_type = event["type"]
+        metadata = event["object"]["metadata"]
+        resource_version = metadata["resourceVersion"]
+
+        if event_type == "BOOKMARK":
+            self.resource_version = resource_version
+            return
+
+        name = metadata["name"]
+        if event_type == "DELETED":
+            if name in self._clusters:
+                self.on_change({}, {name}, False)
+                del self._clusters[name]
+        else:  # ADDED, MODIFIED
+            info = _parse_cluster(event["object"])
+            if info is not None and self._clusters.get(name) != info:
+                self.on_change({name: info}, set(), False)
+                self._clusters[name] = info
+        self.resource_version = resource_version
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            if self._relist_needed:
+                self._stop_event.wait(self.retry_delay)
+                self._relist_needed = False
+                self._relist_with_retry()
+                continue
+            try:
+                self._watch_once()
+            except ApiException as e:
+                if e.status == HTTP_GONE:
+                    # Our resourceVersion is too old: start over from a new list
+                    self._relist_with_retry()
+                    continue
+                print(f"Warning: cluster watch failed: {e}")
+                self._stop_event.wait(self.retry_delay)
+            except (HTTPError, OSError) as e:
+                print(f"Warning: cluster watch failed: {e}")
+                self._stop_event.wait(self.retry_delay)
+            except Exception:  # noqa: BLE001
+                # Any other error (e.g. an unexpected cluster object) would
+                # end the thread, and the sync with it: log it, and start over
+                # from a new list, as the event may not have been applied.
+                print("Warning: cluster watch failed unexpectedly:")
+                traceback.print_exc()
+                self._relist_needed = True
+
+    def _watch_once(self) -> None:
+        self._watch = watch.Watch()
+        stream = self._watch.stream(
+            self.custom_api.list_cluster_custom_object,
+            CLUSTER_GROUP,
+            CLUSTER_VERSION,
+            CLUSTER_PLURAL,
+            resource_version=self.resource_version,
+            timeout_seconds=self.watch_timeout,
+            allow_watch_bookmarks=True,
+        )
+        for event in stream:
+            if self._stop_event.is_set():
+                break
+            self.handle_event(event)
+
+    def _relist_with_retry(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.relist()
+                return
+            except (ApiException, HTTPError, OSError) as e:
+                print(f"Warning: could not list clusters: {e}")
+                self._stop_event.wait(self.retry_delay)
+
+
+def _parse_cluster(cluster: dict) -> dict | None:
+    """Returns the info of a cluster, or None if its status is not complete yet."""
+    try:
+        return parse_cluster_info(cluster)
+    except (KeyError, TypeError):
+        name = cluster["metadata"]["name"]
+        print(f"Cluster {name} has no complete status yet, skipping it for now.")
+        return None
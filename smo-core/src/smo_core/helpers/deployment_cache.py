@@ -0,0 +1,188 @@
+"""
+Informer-style local cache of Kubernetes Deployments.
+
+The cache lists the Deployments of a namespace once, then follows a watch on
+them (resuming from the last seen `resourceVersion`, and re-listing when the
+API server reports it as expired), so that control loops can read the state
+of a deployment from memory instead of doing an API round trip per read.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+
+from kubernetes import watch
+from kubernetes.client import AppsV1Api, V1Deployment
+from kubernetes.client.rest import ApiException
+from urllib3.exceptions import HTTPError
+
+HTTP_GONE = 410
+
+
+@dataclass(frozen=True)
+class CachedDeployment:
+    """A deployment as seen by the cache, with freshness metadata."""
+
+    deployment: V1Deployment
+    resource_version: str | None
+    # `time.monotonic()` of the event that last updated this entry
+    updated_at: float
+
+    @property
+    def age(self) -> float:
+        """Seconds since this entry was last updated."""
+        return time.monotonic() - self.updated_at
+
+
+class DeploymentCache:
+    """Keeps the Deployments of a namespace in memory, fed by a watch."""
+
+    def __init__(
+        self,
+        apps_api: AppsV1Api,
+        namespace: str,
+        watch_timeout: int = 300,
+        retry_delay: float = 5.0,
+    ):
+        self.apps_api = apps_api
+        self.namespace = namespace
+        self.watch_timeout = watch_timeout
+        self.retry_delay = retry_delay
+
+        self.resource_version: str | None = None
+        # `time.monotonic()` of the last list or watch event (None until synced)
+        self.last_sync: float | None = None
+
+        self._items: dict[str, CachedDeployment] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._watch: watch.Watch | None = None
+
+    # --- Lifecycle ---
+
+    def start(self) -> None:
+        """Performs the initial list, then follows the watch in a background thread."""
+        if self._thread is not None:
+            return
+        self.relist()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"deployment-cache-{self.namespace}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._watch is not None:
+            self._watch.stop()
+        if self._thread is not None:
+            self._thread.join(timeout=self.retry_delay)
+            self._thread = None
+
+    @property
+    def is_synced(self) -> bool:
+        """
+        Whether the cache can be read: it was listed, and its watch has not
+        failed since (the next watch event or list syncs it again).
+        """
+        return self.last_sync is not None
+
+    def _mark_unsynced(self) -> None:
+        with self._lock:
+            self.last_sync = None
+
+    # --- Accessors ---
+
+    def get(self, name: str) -> CachedDeployment | None:
+        with self._lock:
+            return self._items.get(name)
+
+    def list(self) -> list[CachedDeployment]:
+        with self._lock:
+            return list(self._items.values())
+
+    # --- Synchronization ---
+
+    def relist(self) -> None:
+        """Replaces the cache content with a fresh list of the deployments."""
+        response = self.apps_api.list_namespaced_deployment(self.namespace)
+        now = time.monotonic()
+        items = {
+            item.metadata.name: CachedDeployment(
+                item, item.metadata.resource_version, now
+            )
+            for item in response.items
+        }
+        with self._lock:
+            self._items = items
+            self.resource_version = response.metadata.resource_version
+            self.last_sync = now
+
+    def handle_event(self, event: dict) -> None:
+        """Applies a single watch event to the cache."""
+        event_type = event["type"]
+        obj = event["object"]
+        now = time.monotonic()
+
+        if event_type == "BOOKMARK":
+            resource_version = event["raw_object"]["metadata"]["resourceVersion"]
+            with self._lock:
+                self.resource_version = resource_version
+                self.last_sync = now
+            return
+
+        name = obj.metadata.name
+        resource_version = obj.metadata.resource_version
+        with self._lock:
+            if event_type == "DELETED":
+                self._items.pop(name, None)
+            else:  # ADDED, MODIFIED
+                self._items[name] = CachedDeployment(obj, resource_version, now)
+            self.resource_version = resource_version
+            self.last_sync = now
+
+    def _run(self) -> None:
+        # Whatever ends the thread, the cache is no longer kept up to date
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    self._watch_once()
+                except ApiException as e:
+                    # Until the watch is back, reads fall back to the API server
+                    self._mark_unsynced()
+                    if e.status == HTTP_GONE:
+                        # Our resourceVersion is too old: start over from a new list
+                        self._relist_with_retry()
+                        continue
+                    print(f"Warning: deployment watch failed: {e}")
+                    self._stop_event.wait(self.retry_delay)
+                except (HTTPError, OSError) as e:
+                    self._mark_unsynced()
+                    print(f"Warning: deployment watch failed: {e}")
+                    self._stop_event.wait(self.retry_delay)
+        finally:
+            self._mark_unsynced()
+
+    def _watch_once(self) -> None:
+        self._watch = watch.Watch()
+        stream = self._watch.stream(
+            self.apps_api.list_namespaced_deployment,
+            self.namespace,
+            resource_version=self.resource_version,
+            timeout_seconds=self.watch_timeout,
+            allow_watch_bookmarks=True,
+        )
+        for event in stream:
+            if self._stop_event.is_set():
+                break
+            self.handle_event(event)
+
+    def _relist_with_retry(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self.relist()
+                return
+            except (ApiException, HTTPError, OSError) as e:
+                print(f"Warning: could not list deployments: {e}")
+                self._stop_event.wait(self.retry_delay)
@@ -1,97 +1,332 @@
 """Karmada helper class and utility functions."""
 
-from kubernetes import client, config
+from dataclasses import asdict, dataclass
+
+from kubernetes import client
+from kubernetes.client.rest import ApiException
 from kubernetes.utils import parse_quantity
 
 from smo_core.utils import format_memory
 
+from .deployment_cache import DeploymentCache
+from .kube_client import KubeClientSettings, get_api_client
+from .manifest_applier import ManifestApplier
+
+CLUSTER_GROUP = "cluster.karmada.io"
+CLUSTER_VERSION = "v1alpha1"
+CLUSTER_PLURAL = "clusters"
+
+# Scheduling of a resource to member clusters, with its status on each of them
+BINDING_GROUP = "work.karmada.io"
+BINDING_VERSION = "v1alpha2"
+BINDING_PLURAL = "resourcebindings"
+
+# Labels stamped by SMO (via the Helm values) on the resources of a graph
+GRAPH_LABEL = "smo/graph"
+PROJECT_LABEL = "smo/project"
+
+
+def graph_label_selector(graph_name: str) -> str:
+    """Returns the label selector of the deployments of a graph."""
+    return f"{GRAPH_LABEL}={graph_name}"
+
+
+@dataclass(frozen=True)
+class DeploymentStatus:
+    """Compact status of a deployment, as returned by `get_deployments_status`."""
+
+    name: str
+    desired_replicas: int | None
+    available_replicas: int | None
+    # Limits of the first container, in cores and bytes (None if not set)
+    cpu_limit: float | None
+    memory_limit: int | None
+
+    @classmethod
+    def from_deployment(cls, deployment) -> "DeploymentStatus":
+        containers = deployment.spec.template.spec.containers
+        limits = (containers[0].resources.limits if containers else None) or {}
+        cpu_limit = limits.get("cpu")
+        memory_limit = limits.get("memory")
+        return cls(
+            name=deployment.metadata.name,
+            desired_replicas=deployment.spec.replicas,
+            available_replicas=deployment.status.available_replicas,
+            cpu_limit=float(parse_quantity(cpu_limit)) if cpu_limit else None,
+            memory_limit=int(parse_quantity(memory_limit)) if memory_limit else None,
+        )
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
 
 class KarmadaHelper:
     """Karmada helper class."""
 
-    def __init__(self, config_file_path: str, namespace: str = "default"):
+    def __init__(
+        self,
+        config_file_path: str,
+        namespace: str = "default",
+        context: str | None = None,
+        settings: KubeClientSettings | None = None,
+    ):
         self.namespace = namespace
         self.config_file_path = config_file_path
 
-        config.load_kube_config(config_file=self.config_file_path)
+        # Shared with the other helpers using the same kubeconfig and context
+        self.api_client = get_api_client(config_file_path, context, settings)
 
-        self.custom_api = client.CustomObjectsApi()
-        self.v1_api_client = client.AppsV1Api()
+        self.custom_api = client.CustomObjectsApi(self.api_client)
+        self.v1_api_client = client.AppsV1Api(self.api_client)
+        # Used by the native deployment engine (`helm.engine: native`)
+        self.manifest_applier = ManifestApplier(self.api_client)
 
-    def get_cluster_info(self):
-        group = "cluster.karmada.io"
-        version = "v1alpha1"
-        plural = "clusters"
+        self.deployment_cache: DeploymentCache | None = None
+
+    def start_deployment_cache(self) -> DeploymentCache:
+        """
+        Starts a watch-fed local cache of the deployments of the namespace.
+
+        Once started, the deployment accessors below are answered from memory
+        instead of reading the deployment from the API server on every call.
+        """
+        if self.deployment_cache is None:
+            self.deployment_cache = DeploymentCache(self.v1_api_client, self.namespace)
+            self.deployment_cache.start()
+        return self.deployment_cache
 
-        clusters = self.custom_api.list_cluster_custom_object(group, version, plural)
+    def stop_deployment_cache(self) -> None:
+        if self.deployment_cache is not None:
+            self.deployment_cache.stop()
+            self.deployment_cache = None
+
+    def get_deployment(self, name, namespace=None):
+        """
+        Returns the deployment, from the local cache if it is running and
+        covers the namespace, or from the API server otherwise.
+        """
+        namespace = namespace or self.namespace
+        cache = self.deployment_cache
+        if (
+            cache is not None
+            and cache.is_synced
+            and namespace == cache.namespace
+            and (cached := cache.get(name))
+        ):
+            return cached.deployment
+        return self.v1_api_client.read_namespaced_deployment(name, namespace)
+
+    def get_deployment_freshness(self, name) -> dict:
+        """
+        Returns freshness metadata about the state of a deployment as seen by
+        the accessors: where it comes from, its resourceVersion and its age.
+        """
+        cache = self.deployment_cache
+        cached = cache.get(name) if cache is not None and cache.is_synced else None
+        if cached is None:
+            return {"source": "api", "resource_version": None, "age": 0.0}
+        return {
+            "source": "cache",
+            "resource_version": cached.resource_version,
+            "age": cached.age,
+        }
+
+    def get_cluster_info(self):
+        clusters = self.custom_api.list_cluster_custom_object(
+            CLUSTER_GROUP, CLUSTER_VERSION, CLUSTER_PLURAL
+        )
         # debug(clusters)
 
-        result = {}
-        for cluster in clusters["items"]:
-            cluster_name = cluster["metadata"]["name"]
-            allocatable = cluster["status"]["resourceSummary"]["allocatable"]
-            allocated = cluster["status"]["resourceSummary"]["allocated"]
-
-            total_cpu = parse_quantity(allocatable["cpu"])
-            allocated_cpu = parse_quantity(allocated["cpu"])
-
-            total_memory = parse_quantity(allocatable["memory"])
-            allocated_memory = parse_quantity(allocated["memory"])
-
-            status = next(
-                (
-                    cond["status"]
-                    for cond in cluster["status"]["conditions"]
-                    if cond["reason"] == "ClusterReady"
-                ),
-                None,
+        return {
+            cluster["metadata"]["name"]: parse_cluster_info(cluster)
+            for cluster in clusters["items"]
+        }
+
+    def get_member_statuses(
+        self, name: str, namespace: str | None = None, kind: str = "Deployment"
+    ) -> dict[str, dict]:
+        """
+        Returns the status of a resource on each member cluster it is
+        propagated to, indexed by cluster name, from the `aggregatedStatus`
+        of its ResourceBinding (named `<name>-<kind>` by Karmada). Returns an
+        empty dict if the resource isn't scheduled yet.
+        """
+        try:
+            binding = self.custom_api.get_namespaced_custom_object(
+                BINDING_GROUP,
+                BINDING_VERSION,
+                namespace or self.namespace,
+                BINDING_PLURAL,
+                f"{name}-{kind.lower()}",
             )
-            availability = True if status == "True" else False
-
-            result[cluster_name] = {
-                "total_cpu": float(total_cpu),
-                "allocated_cpu": float(allocated_cpu),
-                "remaining_cpu": float(total_cpu - allocated_cpu),
-                "total_memory_bytes": format_memory(total_memory),
-                "allocated_memory_bytes": format_memory(allocated_memory),
-                "remaining_memory_bytes": format_memory(
-                    total_memory - allocated_memory
-                ),
-                "availability": availability,
-            }
+        except ApiException as e:
+            if e.status == 404:
+                return {}
+            raise
+        return {
+            item["clusterName"]: item
+            for item in (binding.get("status") or {}).get("aggregatedStatus") or []
+            if item.get("clusterName")
+        }
 
-        return result
+    def is_ready_on_cluster(
+        self, name: str, cluster: str, namespace: str | None = None
+    ) -> bool:
+        """
+        Returns True if a deployment is applied and healthy on a member
+        cluster, with all its replicas available.
+        """
+        member = self.get_member_statuses(name, namespace).get(cluster)
+        if not member or not member.get("applied"):
+            return False
+        if member.get("health", "Healthy") != "Healthy":
+            return False
+        status = member.get("status") or {}
+        replicas = status.get("replicas", 0)
+        return status.get("availableReplicas", 0) >= max(1, replicas)
 
-    def get_desired_replicas(self, name):
+    def get_desired_replicas(self, name, namespace=None):
         """Returns the desired number of replicas for the specified deployment."""
 
-        response = self.v1_api_client.read_namespaced_deployment_scale(
-            name, self.namespace
-        )
-        return response.spec.replicas
+        return self.get_deployment(name, namespace).spec.replicas
+
+    def get_desired_replicas_in_namespace(self, namespace: str | None = None) -> dict:
+        """
+        Returns the desired number of replicas of all deployments of a
+        namespace, with a single list call.
+        """
+        namespace = namespace or self.namespace
+        cache = self.deployment_cache
+        if cache is not None and cache.is_synced and namespace == cache.namespace:
+            return {
+                c.deployment.metadata.name: c.deployment.spec.replicas
+                for c in cache.list()
+            }
+
+        response = self.v1_api_client.list_namespaced_deployment(namespace)
+        return {item.metadata.name: item.spec.replicas for item in response.items}
+
+    def get_deployments_status(
+        self,
+        namespace: str | None = None,
+        label_selector: str | None = None,
+        names: list[str] | None = None,
+    ) -> dict[str, DeploymentStatus]:
+        """
+        Returns the status of many deployments at once, indexed by name, with a
+        single list call (or none, if the deployment cache covers the namespace).
+
+        Deployments are selected with `label_selector` (e.g. the one of a
+        graph, see `graph_label_selector`) and/or restricted to `names`. Named
+        deployments that don't carry the labels (e.g. charts that ignore the
+        `commonLabels` value) are looked up with one more list call of the
+        whole namespace.
+        """
+        namespace = namespace or self.namespace
+        deployments = self._list_deployments(namespace, label_selector)
+        if names is not None:
+            missing = set(names) - {d.metadata.name for d in deployments}
+            if missing and label_selector:
+                deployments += [
+                    d
+                    for d in self._list_deployments(namespace)
+                    if d.metadata.name in missing
+                ]
+            deployments = [d for d in deployments if d.metadata.name in set(names)]
+        return {
+            d.metadata.name: DeploymentStatus.from_deployment(d) for d in deployments
+        }
+
+    def _list_deployments(self, namespace: str, label_selector: str | None = None):
+        cache = self.deployment_cache
+        if cache is not None and cache.is_synced and namespace == cache.namespace:
+            selector = _parse_label_selector(label_selector)
+            if selector is not None:
+                return [
+                    c.deployment
+                    for c in cache.list()
+                    if _labels_match(c.deployment.metadata.labels, selector)
+                ]
+
+        kwargs = {"label_selector": label_selector} if label_selector else {}
+        response = self.v1_api_client.list_namespaced_deployment(namespace, **kwargs)
+        return list(response.items)
 
     def get_replicas(self, name):
         """Returns the current number of replicas for the specified deployment."""
 
-        response = self.v1_api_client.read_namespaced_deployment(name, self.namespace)
+        response = self.get_deployment(name)
 
         return response.status.available_replicas
 
     def get_cpu_limit(self, name):
         """Returns the current CPU limit for the specific deployment."""
 
-        response = self.v1_api_client.read_namespaced_deployment(name, self.namespace)
+        response = self.get_deployment(name)
         cpu_lim = response.spec.template.spec.containers[0].resources.limits["cpu"]
         if "m" in cpu_lim:
             return float(cpu_lim.replace("m", "")) * 1e-3
         else:
             return float(cpu_lim)
 
-    def scale_deployment(self, name, replicas):
+    def scale_deployment(self, name, replicas, namespace=None):
         """Scales the given application to the desired number of replicas"""
 
         self.v1_api_client.patch_namespaced_deployment_scale(
             name=name,
-            namespace=self.namespace,
+            namespace=namespace or self.namespace,
             body={"spec": {"replicas": replicas}},
         )
+
+
+def parse_cluster_info(cluster: dict) -> dict:
+    """Extracts the capacity and availability of a Karmada `Cluster` object."""
+    allocatable = cluster["status"]["resourceSummary"]["allocatable"]
+    allocated = cluster["status"]["resourceSummary"]["allocated"]
+
+    total_cpu = parse_quantity(allocatable["cpu"])
+    allocated_cpu = parse_quantity(allocated["cpu"])
+
+    total_memory = parse_quantity(allocatable["memory"])
+    allocated_memory = parse_quantity(allocated["memory"])
+
+    status = next(
+        (
+            cond["status"]
+            for cond in cluster["status"]["conditions"]
+            if cond["reason"] == "ClusterReady"
+        ),
+        None,
+    )
+    availability = True if status == "True" else False
+
+    return {
+        "total_cpu": float(total_cpu),
+        "allocated_cpu": float(allocated_cpu),
+        "remaining_cpu": float(total_cpu - allocated_cpu),
+        "total_memory_bytes": format_memory(total_memory),
+        "allocated_memory_bytes": format_memory(allocated_memory),
+        "remaining_memory_bytes": format_memory(total_memory - allocated_memory),
+        "availability": availability,
+    }
+
+
+def _parse_label_selector(label_selector: str | None) -> dict | None:
+    """
+    Parses an equality-based label selector ("a=b,c==d") into a dict.
+    Returns None for selectors that can't be evaluated locally.
+    """
+    if not label_selector:
+        return {}
+    selector = {}
+    for requirement in label_selector.split(","):
+        key, sep, value = requirement.replace("==", "=").partition("=")
+        if not sep or "!" in key or " " in key.strip():
+            return None
+        selector[key.strip()] = value.strip()
+    return selector
+
+
+def _labels_match(labels: dict | None, selector: dict) -> bool:
+    labels = labels or {}
+    return all(labels.get(key) == value for key, value in selector.items())
@@ -0,0 +1,152 @@
+"""
+Shared Kubernetes API clients.
+
+Each helper used to call `config.load_kube_config()` and build its API
+objects on the (process-global) default configuration, so the kubeconfig was
+parsed again for every helper instance and all of them shared urllib3's
+default pool size. Instead, `get_api_client` builds one `ApiClient` per
+(kubeconfig, context) pair, tuned with the connection settings below, and
+hands the same instance to every helper that talks to that cluster.
+"""
+
+import socket
+import threading
+import time
+from dataclasses import dataclass
+
+from kubernetes import client, config
+from urllib3.connection import HTTPConnection
+
+
+@dataclass(frozen=True)
+class KubeClientSettings:
+    """Connection settings of the shared API clients."""
+
+    # Maximum number of connections kept open to the API server
+    pool_size: int = 16
+    # Sustained request rate and burst allowed to the API server (as in
+    # client-go). `qps=None` disables the client-side rate limiting.
+    qps: float | None = 50.0
+    burst: int = 100
+    # TCP keep-alive, so that idle connections (and long watches) are not
+    # silently dropped by proxies and load balancers
+    keep_alive: bool = True
+
+    @classmethod
+    def from_dict(cls, data: dict | None) -> "KubeClientSettings":
+        """Creates settings from a config dict (e.g. the `kubernetes` section)."""
+        data = data or {}
+        return cls(
+            pool_size=int(data.get("pool_size", cls.pool_size)),
+            qps=data.get("qps", cls.qps),
+            burst=int(data.get("burst", cls.burst)),
+            keep_alive=bool(data.get("keep_alive", cls.keep_alive)),
+        )
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `qps` tokens per second, up to `burst`."""
+
+    def __init__(self, qps: float, burst: int, clock=time.monotonic, sleep=time.sleep):
+        self.qps = qps
+        self.burst = max(1, burst)
+        self.clock = clock
+        self.sleep = sleep
+
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Takes a token, waiting until one is available."""
+        while True:
+            with self._lock:
+                now = self.clock()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.qps
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.qps
+            self.sleep(wait)
+
+
+class RateLimitedApiClient(client.ApiClient):
+    """An `ApiClient` whose requests are throttled by a token bucket."""
+
+    def __init__(self, configuration=None, rate_limiter: TokenBucket | None = None):
+        super().__init__(configuration)
+        self.rate_limiter = rate_limiter
+
+    def call_api(self, *args, **kwargs):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return super().call_api(*args, **kwargs)
+
+
+_api_clients: dict[tuple[str | None, str | None], client.ApiClient] = {}
+_lock = threading.Lock()
+
+
+def get_api_client(
+    config_file: str | None = None,
+    context: str | None = None,
+    settings: KubeClientSettings | None = None,
+) -> client.ApiClient:
+    """
+    Returns the shared `ApiClient` of a kubeconfig file and context, creating
+    it on first use (`None` means the default kubeconfig / current context).
+
+    `settings` only apply when the client is created.
+
+    Raises `config.ConfigException` if the kubeconfig can't be loaded.
+    """
+    key = (config_file, context)
+    with _lock:
+        api_client = _api_clients.get(key)
+        if api_client is None:
+            api_client = _create_api_client(
+                config_file, context, settings or KubeClientSettings()
+            )
+            _api_clients[key] = api_client
+        return api_client
+
+
+def clear_api_clients() -> None:
+    """Closes and forgets all the shared clients (e.g. after a kubeconfig change)."""
+    with _lock:
+        for api_client in _api_clients.values():
+            api_client.close()
+        _api_clients.clear()
+
+
+def _create_api_client(
+    config_file: str | None, context: str | None, settings: KubeClientSettings
+) -> client.ApiClient:
+    configuration = client.Configuration()
+    config.load_kube_config(
+        config_file=config_file,
+        context=context,
+        client_configuration=configuration,
+    )
+    configuration.connection_pool_maxsize = settings.pool_size
+    if settings.keep_alive:
+        configuration.socket_options = _keep_alive_socket_options()
+
+    rate_limiter = None
+    if settings.qps:
+        rate_limiter = TokenBucket(settings.qps, settings.burst)
+    return RateLimitedApiClient(configuration, rate_limiter=rate_limiter)
+
+
+def _keep_alive_socket_options() -> list[tuple[int, int, int]]:
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # Same timings as client-go (Linux only, other platforms keep their defaults)
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30))
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 15))
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 9))
+    return options
@@ -1,12 +1,43 @@
 import math
+import re
 
 import requests
 from kubernetes import client, config
 from kubernetes.client.rest import ApiException
 
+from .kube_client import get_api_client
+from .reload_coordinator import ReloadCoordinator, get_reload_coordinator
+
+HTTP_NOT_FOUND = 404
+HTTP_CONFLICT = 409
+# Statuses of the queries rejected by Prometheus (invalid, or failing to execute)
+HTTP_BAD_DATA = 400
+HTTP_UNPROCESSABLE = 422
+
+# Series recorded by the per-graph recording rules (see `create_graph_rules`)
+REQUEST_RATE_SERIES = "smo:service_request_rate"
+
+DEFAULT_RULE_LABELS = {
+    "release": "kube-prometheus-stack",
+    "app.kubernetes.io/managed-by": "smo",
+}
+
 # TODO: raise exception on errors / missing parameters, instead of just printing warnings.
 
 
+class PrometheusQueryError(Exception):
+    """
+    A PromQL query that failed, as opposed to one that returned no result.
+
+    `bad_query` is True when Prometheus rejected the query itself, rather
+    than being unreachable or unavailable.
+    """
+
+    def __init__(self, message: str, bad_query: bool = False):
+        super().__init__(message)
+        self.bad_query = bad_query
+
+
 #
 #  PUBLIC FACADE CLASS (Interface remains unchanged for callers)
 #
@@ -17,25 +48,76 @@ class PrometheusHelper:
     """
 
     def __init__(
-        self, prometheus_host: str, time_window: str = "5", time_unit: str = "s"
+        self,
+        prometheus_host: str,
+        time_window: str = "5",
+        time_unit: str = "s",
+        kubeconfig: str | None = None,
+        kube_context: str | None = None,
+        rules_namespace: str = "monitoring",
+        rule_labels: dict | None = None,
+        reload_window: float = 1.0,
     ):
         self.time_window = time_window
         self.time_unit = time_unit
 
+        # Namespace and labels of the PrometheusRule objects created by SMO.
+        # The labels must match the `ruleSelector` of the Prometheus resource
+        # (kube-prometheus-stack selects on its `release` label by default).
+        self.rules_namespace = rules_namespace
+        self.rule_labels = (
+            rule_labels if rule_labels is not None else DEFAULT_RULE_LABELS
+        )
+
         # Instantiate internal helpers, providing them with necessary configuration
         self._query_client = _PrometheusQueryClient(prometheus_host)
         self._rule_manager = _PrometheusRuleManager(
-            reload_url=f"{prometheus_host}/-/reload"
+            reload_url=f"{prometheus_host}/-/reload",
+            kubeconfig=kubeconfig,
+            kube_context=kube_context,
+            reload_window=reload_window,
         )
 
+    @property
+    def manages_rules(self) -> bool:
+        """Whether a Kubernetes client is available to write the PrometheusRules."""
+        return self._rule_manager.api_instance is not None
+
+    @property
+    def reload_coordinator(self) -> ReloadCoordinator:
+        return self._rule_manager.reload_coordinator
+
+    def flush_reload(self) -> None:
+        """Reloads Prometheus now if rule updates are waiting for a reload."""
+        self._rule_manager.reload_coordinator.flush()
+
+    def query(self, query: str) -> float:
+        """Executes a PromQL query and returns the value of the first result (or NaN)."""
+        return self._query_client.execute(query)
+
+    def query_vector(
+        self, query: str, strict: bool = False
+    ) -> list[tuple[dict, float]]:
+        """
+        Executes a PromQL query and returns the (labels, value) pairs of all
+        results. With `strict`, errors raise `PrometheusQueryError` instead of
+        returning an empty list.
+        """
+        return self._query_client.execute_vector(query, strict=strict)
+
     def get_request_rate_by_job(self, job_name: str) -> float:
         """
         Queries Prometheus for the request rate of a target service,
         identified by its 'job' label.
         """
-        # This query is taken directly from the h3ni-scaler logic
-        query = f'sum(rate(http_requests_total{{job="{job_name}"}}[1m]))'
-        rate = self._query_client.execute(query)
+        rate = self._query_client.execute(
+            f'sum({REQUEST_RATE_SERIES}{{job="{job_name}"}})'
+        )
+        if math.isnan(rate):
+            # No recorded series (yet): compute the rate from the raw counter.
+            # This query is taken directly from the h3ni-scaler logic
+            query = f'sum(rate(http_requests_total{{job="{job_name}"}}[1m]))'
+            rate = self._query_client.execute(query)
 
         if math.isnan(rate):
             print(f"No data received from Prometheus for job '{job_name}'.")
@@ -44,38 +126,222 @@ class PrometheusHelper:
         print(f"Current request rate for job '{job_name}': {rate:.2f} RPS")
         return rate
 
+    def get_request_rates_by_job(self, job_names: list[str]) -> dict[str, float]:
+        """
+        Queries Prometheus, in a single request, for the request rates of
+        several services identified by their 'job' label.
+
+        Jobs without data are missing from the result.
+        """
+        if not job_names:
+            return {}
+        rates = self._query_rates_by_job(
+            f'sum by (job) ({REQUEST_RATE_SERIES}{{job=~"{_regex(job_names)}"}})'
+        )
+        missing = [name for name in job_names if name not in rates]
+        if missing:
+            # Jobs without recorded series: compute their rate from the raw counter
+            rates.update(
+                self._query_rates_by_job(
+                    f"sum by (job) "
+                    f'(rate(http_requests_total{{job=~"{_regex(missing)}"}}[1m]))'
+                )
+            )
+        return rates
+
+    def _query_rates_by_job(self, query: str) -> dict[str, float]:
+        return {
+            labels.get("job"): value
+            for labels, value in self._query_client.execute_vector(query)
+            if not math.isnan(value)
+        }
+
     def get_request_rate(self, name: str) -> float:
         """Returns the request completion rate of the service."""
+        request_rate = self._query_client.execute(
+            f'sum({REQUEST_RATE_SERIES}{{service="{name}"}})'
+        )
+        if math.isnan(request_rate):
+            # No recorded series (e.g. graph deployed before the recording
+            # rules were installed): compute the rate from the raw counter
+            query = (
+                f'sum(rate(flask_http_request_total{{service="{name}"}}'
+                f"[{self.time_window}{self.time_unit}])) by (service)"
+            )
+            request_rate = self._query_client.execute(query)
+        # The original behavior was to return 0.0 on failure or NaN, we preserve that.
+        return 0.0 if math.isnan(request_rate) else request_rate
+
+    def get_request_rate_history(
+        self, name: str, start: float, end: float, step: float
+    ) -> list[tuple[float, float]]:
+        """Returns the (timestamp, request rate) samples of the service over a time range."""
         query = (
             f'sum(rate(flask_http_request_total{{service="{name}"}}'
-            f"[{self.time_window}{self.time_unit}])) by (service)"
+            f"[{self.time_window}{self.time_unit}]))"
         )
+        return self._query_client.execute_range(query, start, end, step)
 
-        request_rate = self._query_client.execute(query)
-        # The original behavior was to return 0.0 on failure or NaN, we preserve that.
-        return 0.0 if math.isnan(request_rate) else request_rate
+    def get_cpu_usage_history(
+        self, name: str, start: float, end: float, step: float
+    ) -> list[tuple[float, float]]:
+        """Returns the (timestamp, CPU cores used by all pods) samples of a deployment."""
+        query = (
+            f'sum(rate(container_cpu_usage_seconds_total{{pod=~"{name}-.*",container!=""}}'
+            f"[{self.time_window}{self.time_unit}]))"
+        )
+        return self._query_client.execute_range(query, start, end, step)
+
+    def get_replicas_history(
+        self, name: str, start: float, end: float, step: float
+    ) -> list[tuple[float, float]]:
+        """Returns the (timestamp, available replicas) samples of a deployment (kube-state-metrics)."""
+        query = f'sum(kube_deployment_status_replicas_available{{deployment="{name}"}})'
+        return self._query_client.execute_range(query, start, end, step)
 
     def update_alert_rules(self, alert: dict, action: str) -> None:
         """
         Update prometheus rules depending on action. Either `add` or `remove`.
         Delegates the action to the internal rule manager.
         """
-        # Hardcoded values from original implementation
-        rule_file_name = "kube-prometheus-stack-0"
-        namespace = "monitoring"
-        group_name = "smo-alerts"
-
         if action.lower() == "add":
-            self._rule_manager.add_alert(alert, rule_file_name, namespace, group_name)
+            self.update_alert_rules_batch(add=[alert])
         elif action.lower() == "remove":
-            self._rule_manager.remove_alert(
-                alert, rule_file_name, namespace, group_name
-            )
+            self.update_alert_rules_batch(remove=[alert])
         else:
             raise ValueError(
                 f"Invalid action '{action}' for update_alert_rules. Must be 'add' or 'remove'."
             )
 
+    def update_alert_rules_batch(
+        self,
+        add: list[dict] = (),
+        remove: list[dict] = (),
+        graph_name: str | None = None,
+    ) -> bool:
+        """
+        Adds and removes several alert rules at once, with a single
+        read-modify-write of the PrometheusRule and a single reload.
+
+        With `graph_name`, the rules of the PrometheusRule of the graph are
+        updated (see `create_graph_rules`), otherwise those of the shared
+        legacy PrometheusRule.
+
+        Returns True if the rules were changed.
+        """
+        if not add and not remove:
+            return False
+
+        if graph_name is None:
+            return self._update_legacy_alert_rules(list(add), list(remove))
+
+        name = graph_rule_name(graph_name)
+        changed = self._rule_manager.apply_alerts(
+            list(add),
+            list(remove),
+            name,
+            self.rules_namespace,
+            name,
+            labels=self._graph_rule_labels(graph_name),
+        )
+        if remove and not self._rule_manager.rule_exists(name, self.rules_namespace):
+            # Graph deployed before the rules were sharded per graph
+            changed = self._update_legacy_alert_rules([], list(remove)) or changed
+        return changed
+
+    def create_graph_rules(
+        self,
+        graph_name: str,
+        alerts: list[dict] = (),
+        service_names: list[str] = (),
+    ) -> bool:
+        """
+        Creates (or replaces) the PrometheusRule of a graph, named
+        `smo-<graph>`, holding the alerts of its conditional services.
+
+        Keeping the rules of each graph in its own small object means that
+        updating them doesn't rewrite the rules of all the other graphs.
+
+        With `service_names`, a second group holds the recording rules of the
+        request rates of the services (see `recording_rules`).
+        """
+        name = graph_rule_name(graph_name)
+        groups = [{"name": name, "rules": list(alerts)}]
+        if service_names:
+            groups.append(
+                {
+                    "name": f"{name}-recording",
+                    "rules": self.recording_rules(graph_name, service_names),
+                }
+            )
+        return self._rule_manager.put_rule(
+            name,
+            self.rules_namespace,
+            self._graph_rule_labels(graph_name),
+            groups,
+        )
+
+    def recording_rules(self, graph_name: str, service_names: list[str]) -> list[dict]:
+        """
+        Returns the rules recording the request rates of the services of a
+        graph as `smo:service_request_rate` series, so that the scalers read
+        precomputed series instead of evaluating `rate()` on every tick.
+
+        The rates are recorded both by `service` (Flask exporter metric, read
+        by `get_request_rate`) and by `job` (read by `get_request_rate_by_job`).
+        """
+        services_regex = _regex(service_names)
+        labels = {"smo_graph": graph_name}
+        return [
+            {
+                "record": REQUEST_RATE_SERIES,
+                "expr": (
+                    f"sum by (service) (rate(flask_http_request_total"
+                    f'{{service=~"{services_regex}"}}'
+                    f"[{self.time_window}{self.time_unit}]))"
+                ),
+                "labels": labels,
+            },
+            {
+                "record": REQUEST_RATE_SERIES,
+                "expr": (
+                    f"sum by (job) (rate(http_requests_total"
+                    f'{{job=~"{services_regex}"}}[1m]))'
+                ),
+                "labels": labels,
+            },
+        ]
+
+    def delete_graph_rules(self, graph_name: str) -> bool:
+        """Deletes the PrometheusRule of a graph."""
+        return self._rule_manager.delete_rule(
+            graph_rule_name(graph_name), self.rules_namespace
+        )
+
+    def _graph_rule_labels(self, graph_name: str) -> dict:
+        return {**self.rule_labels, "smo/graph": graph_name}
+
+    def _update_legacy_alert_rules(self, add: list[dict], remove: list[dict]) -> bool:
+        # Hardcoded values from original implementation
+        rule_file_name = "kube-prometheus-stack-0"
+        namespace = "monitoring"
+        group_name = "smo-alerts"
+
+        return self._rule_manager.apply_alerts(
+            add, remove, rule_file_name, namespace, group_name
+        )
+
+
+def graph_rule_name(graph_name: str) -> str:
+    """Returns the name of the PrometheusRule (and rule group) of a graph."""
+    return f"smo-{graph_name}"
+
+
+def _regex(names: list[str]) -> str:
+    """Returns a PromQL regex matching any of the names."""
+    # The backslashes of `re.escape` must themselves be escaped in PromQL strings
+    return "|".join(re.escape(name).replace("\\", "\\\\") for name in names)
+
 
 #
 #  INTERNAL HELPER CLASSES (New Refactored Components)
@@ -87,6 +353,7 @@ class _PrometheusQueryClient:
         if not prometheus_host:
             raise ValueError("Prometheus host URL cannot be empty.")
         self.api_endpoint = f"{prometheus_host.rstrip('/')}/api/v1/query"
+        self.range_endpoint = f"{prometheus_host.rstrip('/')}/api/v1/query_range"
 
     def execute(self, query: str) -> float:
         """
@@ -110,19 +377,89 @@ class _PrometheusQueryClient:
 
         return float("NaN")
 
+    def execute_vector(
+        self, query: str, strict: bool = False
+    ) -> list[tuple[dict, float]]:
+        """
+        Executes a PromQL query and returns the (labels, value) pairs of all
+        the resulting series.
+        Returns an empty list if no data is found or an error occurs (or
+        raises `PrometheusQueryError` on errors, with `strict`).
+        """
+        try:
+            response = requests.get(
+                self.api_endpoint, params={"query": query}, timeout=5
+            )
+            response.raise_for_status()
+            results = response.json()["data"]["result"]
+            return [(r["metric"], float(r["value"][1])) for r in results]
+        except requests.exceptions.RequestException as e:
+            msg = f"Prometheus request failed for query '{query}': {e}"
+            if strict:
+                status = e.response.status_code if e.response is not None else None
+                bad_query = status in (HTTP_BAD_DATA, HTTP_UNPROCESSABLE)
+                raise PrometheusQueryError(msg, bad_query=bad_query) from e
+            print(f"Warning: {msg}")
+        except (KeyError, IndexError, ValueError) as e:
+            msg = f"Could not parse Prometheus response for query '{query}': {e}"
+            if strict:
+                raise PrometheusQueryError(msg) from e
+            print(f"Warning: {msg}")
+
+        return []
+
+    def execute_range(
+        self, query: str, start: float, end: float, step: float
+    ) -> list[tuple[float, float]]:
+        """
+        Executes a PromQL range query and returns the (timestamp, value) samples
+        of the first resulting series.
+        Returns an empty list if no data is found or an error occurs.
+        """
+        params = {"query": query, "start": start, "end": end, "step": step}
+        try:
+            response = requests.get(self.range_endpoint, params=params, timeout=10)
+            response.raise_for_status()
+            results = response.json()["data"]["result"]
+            if results:
+                return [(float(ts), float(value)) for ts, value in results[0]["values"]]
+        except requests.exceptions.RequestException as e:
+            print(f"Warning: Prometheus request failed for query '{query}': {e}")
+        except (KeyError, IndexError, ValueError) as e:
+            print(
+                f"Warning: Could not parse Prometheus response for query '{query}': {e}"
+            )
+
+        return []
+
 
 class _PrometheusRuleManager:
     """Internal manager for manipulating PrometheusRule CRDs in Kubernetes."""
 
-    def __init__(self, reload_url: str):
+    def __init__(
+        self,
+        reload_url: str,
+        kubeconfig: str | None = None,
+        kube_context: str | None = None,
+        max_conflict_retries: int = 5,
+        reload_window: float = 1.0,
+    ):
         self.reload_url = reload_url
+        # Reloads requested by the rule updates are coalesced: at most one
+        # per `reload_window` seconds (shared by the helpers of the process)
+        self.reload_coordinator = get_reload_coordinator(
+            reload_url, reload_window, self._reload_prometheus
+        )
+        self.max_conflict_retries = max_conflict_retries
+        self.kubeconfig = kubeconfig
+        self.kube_context = kube_context
         self.api_instance = self._initialize_k8s_client()
 
     def _initialize_k8s_client(self) -> client.CustomObjectsApi | None:
-        """Loads Kubernetes config and returns a CustomObjectsApi client."""
+        """Returns a CustomObjectsApi client on the shared client of the kubeconfig."""
         try:
-            config.load_kube_config()
-            return client.CustomObjectsApi()
+            api_client = get_api_client(self.kubeconfig, self.kube_context)
+            return client.CustomObjectsApi(api_client)
         except config.ConfigException as e:
             print(
                 f"Warning: Could not load Kubernetes config: {e}. Rule management is disabled."
@@ -135,56 +472,192 @@ class _PrometheusRuleManager:
         self, alert: dict, rule_file_name: str, namespace: str, group_name: str
     ):
         """Adds an alert rule to a specified group in a PrometheusRule file."""
-        self._update_rules(alert, "add", rule_file_name, namespace, group_name)
+        self.apply_alerts([alert], [], rule_file_name, namespace, group_name)
 
     def remove_alert(
         self, alert: dict, rule_file_name: str, namespace: str, group_name: str
     ):
         """Removes an alert rule from a specified group."""
-        self._update_rules(alert, "remove", rule_file_name, namespace, group_name)
+        self.apply_alerts([], [alert], rule_file_name, namespace, group_name)
+
+    def apply_alerts(
+        self,
+        add: list[dict],
+        remove: list[dict],
+        rule_file_name: str,
+        namespace: str,
+        group_name: str,
+        labels: dict | None = None,
+    ) -> bool:
+        """
+        Adds and removes alert rules of a group in one update of the
+        PrometheusRule, followed by a single reload. Returns True if the
+        rules were changed.
 
-    # --- Orchestrator Method (The refactored _update_rules) ---
+        If `labels` are given, a missing PrometheusRule (or group) is created
+        (with these labels) instead of being reported as an error.
+        """
+        return self._update_rules(
+            add, remove, rule_file_name, namespace, group_name, labels
+        )
 
-    def _update_rules(
-        self, alert: dict, action: str, crd_name: str, namespace: str, group_name: str
-    ):
-        """Orchestrates fetching, modifying, and updating the PrometheusRule CRD."""
+    def put_rule(self, name: str, namespace: str, labels: dict, groups: list) -> bool:
+        """Creates a PrometheusRule, or replaces it if it already exists."""
         if not self.api_instance:
             print("Cannot update alert rules: Kubernetes client not available.")
-            return
+            return False
 
-        # 1. Fetch the current Custom Resource from Kubernetes
-        crd = self._get_prometheus_rule(crd_name, namespace)
-        if not crd:
-            return  # Error is logged in the helper method
+        body = {
+            "apiVersion": "monitoring.coreos.com/v1",
+            "kind": "PrometheusRule",
+            "metadata": {"name": name, "namespace": namespace, "labels": labels},
+            "spec": {"groups": groups},
+        }
+        for _ in range(self.max_conflict_retries):
+            try:
+                self.api_instance.create_namespaced_custom_object(
+                    group="monitoring.coreos.com",
+                    version="v1",
+                    namespace=namespace,
+                    plural="prometheusrules",
+                    body=body,
+                )
+                action = "created"
+                break
+            except ApiException as e:
+                if e.status != HTTP_CONFLICT:
+                    print(f"Exception when creating PrometheusRule '{name}': {e}")
+                    return False
+
+            # Already exists: replace it, sending back its resourceVersion
+            current = self._get_prometheus_rule(name, namespace)
+            if current is None:
+                continue
+            body["metadata"]["resourceVersion"] = current["metadata"]["resourceVersion"]
+            try:
+                if not self._replace_prometheus_rule(name, namespace, body):
+                    return False
+                action = "replaced"
+                break
+            except ApiException:
+                continue  # Conflict, retry
+        else:
+            print(f"Error: too many conflicts when updating PrometheusRule '{name}'.")
+            return False
 
-        # 2. Modify the CRD dictionary in memory
-        crd_changed, success = self._modify_alert_group(crd, alert, action, group_name)
-        if not success:
-            print(
-                f"Error: Alert group '{group_name}' not found in PrometheusRule '{crd_name}'."
-            )
-            return
+        print(f"PrometheusRule '{name}' {action}.")
+        self._trigger_prometheus_reload()
+        return True
 
-        # If no actual change was made (e.g., removing a non-existent alert), skip the update.
-        if not crd_changed:
-            print(
-                f"No changes needed for alert '{alert.get('alert')}'. Skipping update."
+    def delete_rule(self, name: str, namespace: str) -> bool:
+        """Deletes a PrometheusRule. Returns False if it didn't exist."""
+        if not self.api_instance:
+            print("Cannot update alert rules: Kubernetes client not available.")
+            return False
+
+        try:
+            self.api_instance.delete_namespaced_custom_object(
+                group="monitoring.coreos.com",
+                version="v1",
+                namespace=namespace,
+                plural="prometheusrules",
+                name=name,
             )
-            return
+        except ApiException as e:
+            if e.status != HTTP_NOT_FOUND:
+                print(f"Exception when deleting PrometheusRule '{name}': {e}")
+            return False
 
-        # 3. Push the updated CRD back to the cluster
-        update_successful = self._replace_prometheus_rule(crd_name, namespace, crd)
+        print(f"PrometheusRule '{name}' deleted.")
+        self._trigger_prometheus_reload()
+        return True
 
-        # 4. Trigger a reload of Prometheus only if the update succeeded
-        if update_successful:
-            print("PrometheusRule updated successfully.")
-            self._trigger_prometheus_reload()
+    def rule_exists(self, name: str, namespace: str) -> bool:
+        if not self.api_instance:
+            return False
+        return self._get_prometheus_rule(name, namespace, quiet=True) is not None
+
+    # --- Orchestrator Method ---
+
+    def _update_rules(
+        self,
+        add: list[dict],
+        remove: list[dict],
+        crd_name: str,
+        namespace: str,
+        group_name: str,
+        labels: dict | None = None,
+    ) -> bool:
+        """Orchestrates fetching, modifying, and updating the PrometheusRule CRD."""
+        if not self.api_instance:
+            print("Cannot update alert rules: Kubernetes client not available.")
+            return False
+
+        for _ in range(self.max_conflict_retries):
+            # 1. Fetch the current Custom Resource from Kubernetes
+            crd = self._get_prometheus_rule(
+                crd_name, namespace, quiet=labels is not None
+            )
+            if not crd:
+                if labels is None:
+                    return False  # Error is logged in the helper method
+                if not add:
+                    return False  # Nothing to remove
+                return self.put_rule(
+                    crd_name, namespace, labels, [{"name": group_name, "rules": add}]
+                )
+
+            # 2. Modify the CRD dictionary in memory
+            if labels is not None:
+                groups = crd.setdefault("spec", {}).setdefault("groups", [])
+                if not any(g.get("name") == group_name for g in groups):
+                    groups.append({"name": group_name, "rules": []})
+            crd_changed, success = self._modify_alert_group(
+                crd, add, remove, group_name
+            )
+            if not success:
+                print(
+                    f"Error: Alert group '{group_name}' not found in PrometheusRule '{crd_name}'."
+                )
+                return False
+
+            # If no actual change was made (e.g., removing a non-existent alert), skip the update.
+            if not crd_changed:
+                print("No changes needed for alert rules. Skipping update.")
+                return False
+
+            # 3. Push the updated CRD back to the cluster. The fetched
+            # resourceVersion is sent back, so a concurrent update makes this
+            # fail with a conflict instead of being overwritten: start over.
+            try:
+                update_successful = self._replace_prometheus_rule(
+                    crd_name, namespace, crd
+                )
+            except ApiException:
+                print(f"Conflict when replacing PrometheusRule '{crd_name}', retrying.")
+                continue
+
+            # 4. Trigger a reload of Prometheus only if the update succeeded
+            if update_successful:
+                print(
+                    f"PrometheusRule updated successfully "
+                    f"({len(add)} added, {len(remove)} removed)."
+                )
+                self._trigger_prometheus_reload()
+            return update_successful
+
+        print(f"Error: too many conflicts when updating PrometheusRule '{crd_name}'.")
+        return False
 
     # --- Low-level Helper Methods ---
 
-    def _get_prometheus_rule(self, name: str, namespace: str) -> dict | None:
-        """Fetches the PrometheusRule Custom Resource from the cluster."""
+    def _get_prometheus_rule(
+        self, name: str, namespace: str, quiet: bool = False
+    ) -> dict | None:
+        """
+        Fetches the PrometheusRule Custom Resource from the cluster.
+        With `quiet`, a missing PrometheusRule is not reported as an error.
+        """
         try:
             return self.api_instance.get_namespaced_custom_object(
                 group="monitoring.coreos.com",
@@ -194,11 +667,12 @@ class _PrometheusRuleManager:
                 name=name,
             )
         except ApiException as e:
-            print(f"Exception when fetching PrometheusRule '{name}': {e}")
+            if not (quiet and e.status == HTTP_NOT_FOUND):
+                print(f"Exception when fetching PrometheusRule '{name}': {e}")
             return None
 
     def _modify_alert_group(
-        self, crd: dict, alert: dict, action: str, group_name: str
+        self, crd: dict, add: list[dict], remove: list[dict], group_name: str
     ) -> tuple[bool, bool]:
         """
         Modifies the rules within a specific group in the CRD.
@@ -218,20 +692,22 @@ class _PrometheusRuleManager:
             return False, False  # Group was not found
 
         rules = group.setdefault("rules", [])
-        initial_rule_count = len(rules)
-
-        if action == "add":
-            # Add only if an alert with the same name doesn't already exist
-            if not any(r.get("alert") == alert.get("alert") for r in rules):
-                rules.append(alert)
-        elif action == "remove":
-            group["rules"] = [r for r in rules if r.get("alert") != alert.get("alert")]
-        else:
-            raise ValueError(f"Unknown action '{action}'")
 
+        # Alerts are looked up by name (other rules, e.g. recording rules,
+        # are kept as they are)
+        removed_names = {alert["alert"] for alert in remove}
+        new_rules = [r for r in rules if r.get("alert") not in removed_names]
+        existing_names = {r["alert"] for r in new_rules if "alert" in r}
+
+        # Add only if an alert with the same name doesn't already exist
+        for alert in add:
+            if alert["alert"] not in existing_names:
+                new_rules.append(alert)
+                existing_names.add(alert["alert"])
+
+        group["rules"] = new_rules
         # Return whether a change occurred and that the group was found
-        was_changed = len(group["rules"]) != initial_rule_count
-        return was_changed, True
+        return new_rules != rules, True
 
     def _replace_prometheus_rule(self, name: str, namespace: str, body: dict) -> bool:
         """Pushes the updated PrometheusRule back to the Kubernetes cluster."""
@@ -246,14 +722,22 @@ class _PrometheusRuleManager:
             )
             return True
         except ApiException as e:
+            if e.status == HTTP_CONFLICT:
+                raise
             print(f"Exception when replacing PrometheusRule '{name}': {e}")
             return False
 
     def _trigger_prometheus_reload(self):
+        """Requests a reload of Prometheus (see `ReloadCoordinator`)."""
+        self.reload_coordinator.request()
+
+    def _reload_prometheus(self) -> bool:
         """Sends a POST request to the Prometheus reload endpoint."""
         try:
             response = requests.post(self.reload_url, timeout=10)
             response.raise_for_status()
             print("Prometheus reloaded successfully.")
+            return True
         except requests.exceptions.RequestException as e:
             print(f"Failed to reload Prometheus: {e}")
+            return False
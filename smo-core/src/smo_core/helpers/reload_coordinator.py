@@ -0,0 +1,126 @@
+"""
+Debounced Prometheus configuration reloads.
+
+Every successful PrometheusRule update used to POST `/-/reload` right away,
+so deploying or stopping several graphs in a row made Prometheus reload its
+whole configuration many times. The coordinator coalesces the reload
+requests made within a time window into a single reload, and keeps track of
+how many updates each reload covered.
+"""
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ReloadRecord:
+    """A reload that was triggered by the coordinator."""
+
+    # `time.time()` of the reload
+    timestamp: float
+    # Number of reload requests (i.e. rule updates) covered by the reload
+    updates: int
+    success: bool
+
+
+class ReloadCoordinator:
+    """
+    Coalesces reload requests: at most one reload is triggered per `window`
+    seconds, covering all the requests made in the meantime.
+
+    With `window=0`, each request triggers a reload immediately.
+    """
+
+    def __init__(
+        self,
+        reload: Callable[[], bool],
+        window: float = 1.0,
+        on_reload: Callable[[ReloadRecord], None] | None = None,
+        max_history: int = 100,
+    ):
+        self.reload = reload
+        self.window = window
+        self.on_reload = on_reload
+        self.history: deque[ReloadRecord] = deque(maxlen=max_history)
+
+        self._pending = 0
+        self._last_reload: float | None = None
+        self._timer: threading.Timer | None = None
+        self._lock = threading.Lock()
+        # Serializes the reloads themselves
+        self._reload_lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Number of requests waiting for the next reload."""
+        with self._lock:
+            return self._pending
+
+    def request(self) -> None:
+        """Asks for a reload, which is triggered at the end of the current window."""
+        if self.window <= 0:
+            with self._lock:
+                self._pending += 1
+            self.flush()
+            return
+
+        with self._lock:
+            self._pending += 1
+            if self._timer is not None:
+                return  # Covered by the scheduled reload
+            now = time.monotonic()
+            if self._last_reload is None:
+                delay = self.window
+            else:
+                delay = max(0.0, self._last_reload + self.window - now)
+            # Not a daemon thread, so that short-lived processes (e.g. the CLI)
+            # still reload Prometheus before exiting
+            self._timer = threading.Timer(delay, self.flush)
+            self._timer.start()
+
+    def flush(self) -> ReloadRecord | None:
+        """Triggers the pending reload now, if any."""
+        with self._reload_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                updates, self._pending = self._pending, 0
+                if not updates:
+                    return None
+                # The window starts with the reload, so that the requests
+                # made while it runs are delayed to the next window
+                self._last_reload = time.monotonic()
+
+            success = self.reload()
+
+            record = ReloadRecord(time.time(), updates, success)
+            self.history.append(record)
+
+        print(f"Prometheus reload covered {updates} rule update(s).")
+        if self.on_reload is not None:
+            self.on_reload(record)
+        return record
+
+
+_coordinators: dict[tuple[str, float], ReloadCoordinator] = {}
+_coordinators_lock = threading.Lock()
+
+
+def get_reload_coordinator(
+    reload_url: str, window: float, reload: Callable[[], bool]
+) -> ReloadCoordinator:
+    """
+    Returns the coordinator of a Prometheus reload endpoint, shared by all
+    the helpers of the process, so that their reloads are coalesced too.
+    """
+    key = (reload_url, window)
+    with _coordinators_lock:
+        coordinator = _coordinators.get(key)
+        if coordinator is None:
+            coordinator = ReloadCoordinator(reload, window=window)
+            _coordinators[key] = coordinator
+        return coordinator
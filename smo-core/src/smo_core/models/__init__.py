@@ -5,12 +5,23 @@ This file imports all models so they can be discovered by SQLAlchemy's `create_a
 when called by the consumer application.
 """
 
+from .capacity import ServiceCapacity
 from .cluster import Cluster
 from .graph import Graph
+from .job import Job
+from .release import Release
+from .scaling_policy import ScalingPolicy
+from .schema import init_db, upgrade_schema
 from .service import Service
 
 __all__ = [
     "Cluster",
     "Graph",
+    "Job",
+    "Release",
+    "ScalingPolicy",
     "Service",
+    "ServiceCapacity",
+    "init_db",
+    "upgrade_schema",
 ]
@@ -3,7 +3,7 @@ Defines the SQLAlchemy declarative base.
 
 Consumer applications (like smo-web or smo-cli) are responsible for creating
 the database engine and session factory, and then calling:
-`Base.metadata.create_all(engine)`
+`smo_core.models.init_db(engine)`, which also upgrades existing databases
 """
 
 from sqlalchemy import JSON
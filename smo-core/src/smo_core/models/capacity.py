@@ -0,0 +1,47 @@
+"""Calibrated service capacity model."""
+
+from datetime import datetime
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+__all__ = ["ServiceCapacity"]
+
+
+class ServiceCapacity(Base):
+    """
+    Fitted coefficients of the capacity curve `alpha * replicas + beta` of a
+    service, together with the (decayed) sufficient statistics of the
+    regression so that the fit can be refreshed incrementally.
+    """
+
+    __tablename__ = "service_capacity"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    service_name: Mapped[str] = mapped_column(String(255), unique=True)
+    alpha: Mapped[float | None] = mapped_column(nullable=True)
+    beta: Mapped[float | None] = mapped_column(nullable=True)
+
+    # Sufficient statistics of the least-squares fit
+    weight: Mapped[float] = mapped_column(default=0.0)
+    sum_x: Mapped[float] = mapped_column(default=0.0)
+    sum_y: Mapped[float] = mapped_column(default=0.0)
+    sum_xx: Mapped[float] = mapped_column(default=0.0)
+    sum_xy: Mapped[float] = mapped_column(default=0.0)
+
+    # Timestamp of the last Prometheus sample folded into the fit
+    last_sample_at: Mapped[float | None] = mapped_column(nullable=True)
+    updated_at: Mapped[datetime | None] = mapped_column(nullable=True)
+
+    def to_dict(self):
+        """Returns a dictionary representation of the class."""
+        return {
+            "service_name": self.service_name,
+            "alpha": self.alpha,
+            "beta": self.beta,
+            "samples": self.weight,
+            "last_sample_at": self.last_sample_at,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
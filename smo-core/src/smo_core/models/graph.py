@@ -20,6 +20,9 @@ class Graph(Base):
 
     graph_descriptor: Mapped[dict] = mapped_column(JsonType)
     placement: Mapped[dict] = mapped_column(JsonType, nullable=True)
+    # Progress of the deployment: completed steps, and failed step if any
+    # (see `GraphService.deploy_graph`)
+    deploy_state: Mapped[dict | None] = mapped_column(JsonType, nullable=True)
 
     services = relationship("Service", back_populates="graph", cascade="all,delete")
 
@@ -32,6 +35,7 @@ class Graph(Base):
             "grafana": self.grafana,
             "hdaGraph": self.graph_descriptor,
             "placement": self.placement,
+            "deploy_state": self.deploy_state,
         }
         if self.services:
             instance_dict["services"] = [service.to_dict() for service in self.services]
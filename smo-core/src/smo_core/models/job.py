@@ -0,0 +1,65 @@
+"""Background job (graph lifecycle operation) model."""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base, JsonType
+
+__all__ = ["Job"]
+
+
+class Job(Base):
+    """
+    A lifecycle operation on a graph (deploy, start, stop...), queued by the
+    API and run by a `JobWorker`. The jobs of a graph are run one at a time,
+    in the order they were queued.
+    """
+
+    __tablename__ = "job"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    kind: Mapped[str] = mapped_column(String(64))
+    graph_name: Mapped[str] = mapped_column(String(255), index=True)
+    project: Mapped[str | None] = mapped_column(String(255))
+    payload: Mapped[JSON | None] = mapped_column(JsonType)
+    status: Mapped[str] = mapped_column(String(32), index=True)
+    progress: Mapped[str | None] = mapped_column(String(255))
+    result: Mapped[JSON | None] = mapped_column(JsonType)
+    error: Mapped[str | None] = mapped_column(Text)
+
+    attempts: Mapped[int] = mapped_column(default=0)
+    max_attempts: Mapped[int] = mapped_column(default=1)
+    # Worker running the job, and its last sign of life
+    worker: Mapped[str | None] = mapped_column(String(255))
+    heartbeat_at: Mapped[datetime | None] = mapped_column(nullable=True)
+
+    # All times are naive UTC
+    created_at: Mapped[datetime]
+    # Not run before this time (retries are delayed)
+    available_at: Mapped[datetime]
+    started_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(nullable=True)
+
+    def to_dict(self):
+        """Returns a dictionary representation of the class."""
+
+        def isoformat(value: datetime | None) -> str | None:
+            return value.isoformat() if value else None
+
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "graph": self.graph_name,
+            "project": self.project,
+            "status": self.status,
+            "progress": self.progress,
+            "result": self.result,
+            "error": self.error,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "created_at": isoformat(self.created_at),
+            "started_at": isoformat(self.started_at),
+            "finished_at": isoformat(self.finished_at),
+        }
@@ -0,0 +1,43 @@
+"""Release (rendered manifests) of a service deployed by the native engine."""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base, JsonType
+
+__all__ = ["Release"]
+
+
+class Release(Base):
+    """
+    The manifests rendered from the chart and values of a service, and
+    applied with server-side apply (see `ManifestApplier`). They are kept so
+    that an unchanged service doesn't need to be rendered again, and so that
+    its resources can be pruned on upgrade and deleted on uninstall.
+    """
+
+    __tablename__ = "release"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(255), unique=True)
+    namespace: Mapped[str] = mapped_column(String(255))
+    chart: Mapped[str | None] = mapped_column(String(255))
+    # `values_digest` of the chart and values the manifests were rendered from
+    digest: Mapped[str | None] = mapped_column(String(64))
+    revision: Mapped[int] = mapped_column(default=0)
+    status: Mapped[str | None] = mapped_column(String(255))
+    manifests: Mapped[JSON | None] = mapped_column(JsonType)
+    updated_at: Mapped[datetime | None] = mapped_column(nullable=True)
+
+    def to_dict(self):
+        """Returns a dictionary representation of the class."""
+        return {
+            "name": self.name,
+            "namespace": self.namespace,
+            "chart": self.chart,
+            "revision": self.revision,
+            "status": self.status,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
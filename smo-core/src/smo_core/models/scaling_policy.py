@@ -0,0 +1,58 @@
+"""Threshold scaling policy model."""
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+__all__ = ["ScalingPolicy"]
+
+
+class ScalingPolicy(Base):
+    """Threshold-based scaling policy of a deployment, run by the scaler daemon."""
+
+    __tablename__ = "scaling_policy"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    target_deployment: Mapped[str] = mapped_column(String(255))
+    target_namespace: Mapped[str] = mapped_column(String(255), default="default")
+    up_threshold: Mapped[float] = mapped_column()
+    down_threshold: Mapped[float] = mapped_column()
+    up_replicas: Mapped[int] = mapped_column()
+    down_replicas: Mapped[int] = mapped_column()
+    poll_interval: Mapped[int] = mapped_column(default=15)
+    cooldown_period: Mapped[int] = mapped_column(default=60)
+    enabled: Mapped[bool] = mapped_column(default=True)
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.target_namespace, self.target_deployment
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ScalingPolicy":
+        """Creates a (transient) policy from a dict, e.g. loaded from a YAML file."""
+        return cls(
+            target_deployment=data["target_deployment"],
+            target_namespace=data.get("target_namespace", "default"),
+            up_threshold=float(data["up_threshold"]),
+            down_threshold=float(data["down_threshold"]),
+            up_replicas=int(data["up_replicas"]),
+            down_replicas=int(data["down_replicas"]),
+            poll_interval=int(data.get("poll_interval", 15)),
+            cooldown_period=int(data.get("cooldown_period", 60)),
+            enabled=bool(data.get("enabled", True)),
+        )
+
+    def to_dict(self):
+        """Returns a dictionary representation of the class."""
+        return {
+            "target_deployment": self.target_deployment,
+            "target_namespace": self.target_namespace,
+            "up_threshold": self.up_threshold,
+            "down_threshold": self.down_threshold,
+            "up_replicas": self.up_replicas,
+            "down_replicas": self.down_replicas,
+            "poll_interval": self.poll_interval,
+            "cooldown_period": self.cooldown_period,
+            "enabled": self.enabled,
+        }
@@ -0,0 +1,62 @@
+"""
+Creation and upgrade of the database schema.
+
+`Base.metadata.create_all` creates the missing tables, but doesn't change the
+existing ones. The columns added to existing tables since are listed in
+`ADDED_COLUMNS`, and added by `upgrade_schema` to the databases created
+before them. All the added columns are nullable, so the existing rows keep
+their values.
+"""
+
+from sqlalchemy import Engine, inspect, text
+
+from .base import Base
+
+__all__ = ["ADDED_COLUMNS", "init_db", "upgrade_schema"]
+
+# Columns added to existing tables, as (table, column), in the order they were added
+ADDED_COLUMNS: list[tuple[str, str]] = [
+    ("service", "applied_digest"),
+    ("service", "triggered_at"),
+    ("service", "trigger_latency"),
+    ("graph", "deploy_state"),
+]
+
+
+def init_db(engine: Engine) -> None:
+    """Creates the missing tables, and adds the missing columns to the existing ones."""
+    Base.metadata.create_all(bind=engine)
+    upgrade_schema(engine)
+
+
+def upgrade_schema(engine: Engine) -> list[str]:
+    """
+    Adds the columns of `ADDED_COLUMNS` missing from the database, with
+    `ALTER TABLE ... ADD COLUMN`. Returns the added columns, as "table.column".
+    """
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    quote = engine.dialect.identifier_preparer.quote
+
+    added = []
+    with engine.begin() as connection:
+        for table_name, column_name in ADDED_COLUMNS:
+            if table_name not in existing_tables:
+                continue
+            existing_columns = {c["name"] for c in inspector.get_columns(table_name)}
+            if column_name in existing_columns:
+                continue
+
+            column = Base.metadata.tables[table_name].columns[column_name]
+            column_type = column.type.compile(dialect=engine.dialect)
+            connection.execute(
+                text(
+                    f"ALTER TABLE {quote(table_name)} "
+                    f"ADD COLUMN {quote(column_name)} {column_type}"
+                )
+            )
+            added.append(f"{table_name}.{column_name}")
+
+    if added:
+        print(f"Added columns to the database: {', '.join(added)}")
+    return added
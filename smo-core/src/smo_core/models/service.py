@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import TYPE_CHECKING
 
 from sqlalchemy import JSON, ForeignKey, String
@@ -37,6 +38,15 @@ class Service(Base):
     values_overwrite: Mapped[JSON | None] = mapped_column(JsonType)
     alert: Mapped[JSON | None] = mapped_column(JsonType)
 
+    # Digest of the chart and values last applied with helm (None if not
+    # installed), to skip helm runs that wouldn't change anything
+    applied_digest: Mapped[str | None] = mapped_column(String(64))
+
+    # When the trigger of a conditional service last fired, and the time
+    # (seconds) it took to deploy the service from then
+    triggered_at: Mapped[datetime | None] = mapped_column(nullable=True)
+    trigger_latency: Mapped[float | None] = mapped_column(nullable=True)
+
     # Foreign Key and Relationship
     graph_id: Mapped[int] = mapped_column(ForeignKey("graph.id"))
     graph: Mapped[Graph] = relationship(back_populates="services")
@@ -57,4 +67,8 @@ class Service(Base):
             "artifact_ref": self.artifact_ref,
             "artifact_type": self.artifact_type,
             "artifact_implementer": self.artifact_implementer,
+            "triggered_at": (
+                self.triggered_at.isoformat() if self.triggered_at else None
+            ),
+            "trigger_latency": self.trigger_latency,
         }
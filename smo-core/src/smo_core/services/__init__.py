@@ -1,9 +1,21 @@
+from .calibration_service import CalibrationService
 from .cluster_service import ClusterService
+from .cluster_sync import ClusterInventorySync
 from .graph_service import GraphService
+from .job_service import JobService
+from .job_worker import JobWorker
+from .scaler_daemon import ScalerDaemon
 from .scaler_service import ScalerService
+from .trigger_evaluator import TriggerEvaluator
 
 __all__ = [
     "GraphService",
     "ClusterService",
     "ScalerService",
+    "ScalerDaemon",
+    "CalibrationService",
+    "ClusterInventorySync",
+    "TriggerEvaluator",
+    "JobService",
+    "JobWorker",
 ]
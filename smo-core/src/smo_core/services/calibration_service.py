@@ -0,0 +1,154 @@
+"""Calibration of the per-service capacity model from Prometheus history."""
+
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm.session import Session
+
+from smo_core.helpers import KarmadaHelper, PrometheusHelper
+from smo_core.models import ServiceCapacity
+from smo_core.utils.calibration import (
+    LinearFit,
+    capacity_samples,
+    last_common_timestamp,
+)
+
+
+@dataclass(frozen=True)
+class CalibrationService:
+    """Fits and persists the `alpha`/`beta` capacity coefficients of services."""
+
+    db_session: Session
+    karmada_helper: KarmadaHelper
+    prom_helper: PrometheusHelper
+
+    # How far back to look the first time a service is calibrated (seconds)
+    initial_lookback: float = 3600
+    # Resolution of the Prometheus range queries (seconds)
+    step: float = 30
+    # Exponential forgetting factor applied at each new sample
+    decay: float = 0.999
+    min_utilization: float = 0.2
+    # Samples (as decayed) needed before the fitted coefficients are used
+    min_samples: float = 10
+
+    def get_capacity(self, service_name: str) -> ServiceCapacity | None:
+        stmt = select(ServiceCapacity).where(
+            ServiceCapacity.service_name == service_name
+        )
+        return self.db_session.scalars(stmt).first()
+
+    def refresh(self, service_names: list[str], now: float | None = None) -> dict:
+        """
+        Folds the samples observed since the last refresh into the fit of each
+        service and persists the updated coefficients.
+
+        Returns a dict mapping each service name to its `(alpha, beta)`
+        coefficients (or None if it couldn't be calibrated yet).
+        """
+        now = now or time.time()
+        stmt = select(ServiceCapacity).where(
+            ServiceCapacity.service_name.in_(service_names)
+        )
+        capacities = {c.service_name: c for c in self.db_session.scalars(stmt)}
+
+        result = {}
+        for name in service_names:
+            capacity = capacities.get(name)
+            if capacity is None:
+                capacity = ServiceCapacity(service_name=name)
+                self.db_session.add(capacity)
+            self._refresh_one(capacity, now)
+            result[name] = (
+                (capacity.alpha, capacity.beta) if capacity.alpha is not None else None
+            )
+
+        self.db_session.commit()
+        return result
+
+    def get_coefficients(
+        self,
+        service_names: list[str],
+        default_alpha: dict | None = None,
+        default_beta: dict | None = None,
+    ) -> tuple[list[float], list[float]]:
+        """
+        Returns the `alpha` and `beta` lists to pass to `decide_replicas`,
+        falling back to the given defaults (or 1 and 0) for services that
+        have not been calibrated yet (or whose fit is not usable).
+        """
+        default_alpha = default_alpha or {}
+        default_beta = default_beta or {}
+
+        stmt = select(ServiceCapacity).where(
+            ServiceCapacity.service_name.in_(service_names)
+        )
+        capacities = {c.service_name: c for c in self.db_session.scalars(stmt)}
+
+        alpha, beta = [], []
+        for name in service_names:
+            capacity = capacities.get(name)
+            if capacity is not None and capacity.alpha and capacity.alpha > 0:
+                alpha.append(capacity.alpha)
+                beta.append(capacity.beta)
+            else:
+                alpha.append(default_alpha.get(name, 1))
+                beta.append(default_beta.get(name, 0))
+        return alpha, beta
+
+    def _refresh_one(self, capacity: ServiceCapacity, now: float) -> None:
+        name = capacity.service_name
+        start = (
+            capacity.last_sample_at + self.step
+            if capacity.last_sample_at
+            else now - self.initial_lookback
+        )
+        if start > now:
+            return
+
+        request_rates = self.prom_helper.get_request_rate_history(
+            name, start, now, self.step
+        )
+        if not request_rates:
+            return
+
+        cpu_limit = self.karmada_helper.get_cpu_limit(name)
+        cpu_usages = self.prom_helper.get_cpu_usage_history(name, start, now, self.step)
+        replicas = self.prom_helper.get_replicas_history(name, start, now, self.step)
+        samples = capacity_samples(
+            request_rates,
+            cpu_usages,
+            replicas,
+            cpu_limit,
+            min_utilization=self.min_utilization,
+        )
+        # Samples of a series lagging behind the others are picked up at the
+        # next refresh
+        last_sample_at = last_common_timestamp(request_rates, cpu_usages, replicas)
+        if last_sample_at is None:
+            return
+        capacity.last_sample_at = last_sample_at
+        if not samples:
+            return
+
+        fit = LinearFit(
+            weight=capacity.weight or 0.0,
+            sum_x=capacity.sum_x or 0.0,
+            sum_y=capacity.sum_y or 0.0,
+            sum_xx=capacity.sum_xx or 0.0,
+            sum_xy=capacity.sum_xy or 0.0,
+        )
+        for _ts, replicas, capacity_rps in samples:
+            fit.add(replicas, capacity_rps, decay=self.decay)
+
+        capacity.weight = fit.weight
+        capacity.sum_x = fit.sum_x
+        capacity.sum_y = fit.sum_y
+        capacity.sum_xx = fit.sum_xx
+        capacity.sum_xy = fit.sum_xy
+        # An unusable fit falls back to the default coefficients
+        coefficients = fit.coefficients(self.min_samples)
+        capacity.alpha, capacity.beta = coefficients or (None, None)
+        capacity.updated_at = datetime.now(UTC)
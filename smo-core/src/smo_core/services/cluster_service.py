@@ -1,6 +1,6 @@
 """Kubernetes cluster business logic."""
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 
 from sqlalchemy import select
@@ -38,38 +38,114 @@ class ClusterService:
         Retrieves all cluster data from Karmada, syncs with the DB,
         and creates Grafana dashboards if needed.
         """
-        cluster_dicts = []
         karmada_cluster_info = self.karmada_helper.get_cluster_info()
 
-        for cluster_name, info in karmada_cluster_info.items():
-            cluster = self._update_cluster(cluster_name, info)
-            cluster_dicts.append(cluster.to_dict())
-
+        clusters, _ = self._upsert_clusters(karmada_cluster_info)
         self.db_session.commit()
-        return cluster_dicts
+        return [clusters[name].to_dict() for name in karmada_cluster_info]
+
+    def sync_clusters(
+        self,
+        cluster_infos: dict[str, dict],
+        removed: Iterable[str] = (),
+        snapshot: bool = False,
+    ) -> list[dict]:
+        """
+        Applies a batch of cluster changes (as reported by a `ClusterWatcher`)
+        to the DB, and returns the resulting change events.
+
+        Only the rows whose values actually change are written. Removed
+        clusters are kept, but marked as unavailable so that placement skips
+        them. When `snapshot` is True, `cluster_infos` is the complete list of
+        clusters and any other known cluster is considered removed.
 
-    def _update_cluster(self, cluster_name: str, info: dict) -> Cluster:
+        Each event is a dict like::
+
+            {"type": "updated", "cluster": "cluster1",
+             "changes": {"available_cpu": [4.0, 2.5]}}
+
+        where `type` is one of "added", "updated" or "removed".
         """
-        Updates or creates a cluster in the database based on Karmada info, creating a Grafana dashboard if necessary.
+        _, events = self._upsert_clusters(cluster_infos, removed, snapshot)
+        if events:
+            self.db_session.commit()
+        return events
+
+    def _upsert_clusters(
+        self,
+        cluster_infos: dict[str, dict],
+        removed: Iterable[str] = (),
+        snapshot: bool = False,
+    ) -> tuple[dict[str, Cluster], list[dict]]:
         """
-        stmt = select(Cluster).where(Cluster.name == cluster_name)
-        cluster = self.db_session.scalars(stmt).first()
-        if cluster:
-            cluster.available_cpu = info["remaining_cpu"]
-            cluster.available_ram = info["remaining_memory_bytes"]
-            cluster.availability = info["availability"]
+        Updates or creates the clusters in the database from Karmada info, with
+        a single query, creating Grafana dashboards for new clusters.
+        """
+        removed = set(removed) - set(cluster_infos)
+        if snapshot:
+            stmt = select(Cluster)
         else:
-            dashboard = self.grafana_helper.create_cluster_dashboard(cluster_name)
-            response = self.grafana_helper.publish_dashboard(dashboard)
-            grafana_url = f"{self.config['grafana']['host']}{response['url']}"
-            cluster = Cluster(
-                name=cluster_name,
-                location="Unknown",
+            stmt = select(Cluster).where(Cluster.name.in_(set(cluster_infos) | removed))
+        clusters = {c.name: c for c in self.db_session.scalars(stmt).all()}
+        if snapshot:
+            removed |= set(clusters) - set(cluster_infos)
+
+        events = []
+        for cluster_name, info in cluster_infos.items():
+            cluster = clusters.get(cluster_name)
+            if cluster is None:
+                cluster = self._create_cluster(cluster_name, info)
+                clusters[cluster_name] = cluster
+                events.append({"type": "added", "cluster": cluster_name, "changes": {}})
+                continue
+
+            changes = _apply_changes(
+                cluster,
                 available_cpu=info["remaining_cpu"],
                 available_ram=info["remaining_memory_bytes"],
                 availability=info["availability"],
-                acceleration=False,  # TODO: A mechanism to discover this is needed
-                grafana=grafana_url,
             )
-            self.db_session.add(cluster)
+            if changes:
+                events.append(
+                    {"type": "updated", "cluster": cluster_name, "changes": changes}
+                )
+
+        for cluster_name in sorted(removed):
+            cluster = clusters.get(cluster_name)
+            if cluster is None:
+                continue
+            # Already unavailable clusters are not reported again on every relist
+            if changes := _apply_changes(cluster, availability=False):
+                events.append(
+                    {"type": "removed", "cluster": cluster_name, "changes": changes}
+                )
+
+        return clusters, events
+
+    def _create_cluster(self, cluster_name: str, info: dict) -> Cluster:
+        """Creates a cluster in the database, with its Grafana dashboard."""
+        dashboard = self.grafana_helper.create_cluster_dashboard(cluster_name)
+        response = self.grafana_helper.publish_dashboard(dashboard)
+        grafana_url = f"{self.config['grafana']['host']}{response['url']}"
+        cluster = Cluster(
+            name=cluster_name,
+            location="Unknown",
+            available_cpu=info["remaining_cpu"],
+            available_ram=info["remaining_memory_bytes"],
+            availability=info["availability"],
+            acceleration=False,  # TODO: A mechanism to discover this is needed
+            grafana=grafana_url,
+        )
+        self.db_session.add(cluster)
         return cluster
+
+
+def _apply_changes(cluster: Cluster, **values) -> dict:
+    """Sets the given attributes, returning the {name: [old, new]} of the changed ones."""
+    changes = {}
+    for name, value in values.items():
+        old = getattr(cluster, name)
+        if old != value:
+            setattr(cluster, name, value)
+            changes[name] = [old, value]
+    return changes
@@ -0,0 +1,94 @@
+"""
+Event-driven cluster inventory sync.
+
+Keeps the `cluster` table up to date from a watch on the Karmada clusters,
+instead of listing and rewriting all of them on each `fetch_clusters` call.
+Each batch of changes is applied in its own session with a bulk upsert of
+the changed rows only, and the resulting change events are passed to the
+registered listeners (which must handle their own errors). If a batch can't
+be written, all the clusters are listed and synced again.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from smo_core.helpers import GrafanaHelper, KarmadaHelper
+from smo_core.helpers.cluster_watcher import ClusterWatcher
+from smo_core.services.cluster_service import ClusterService
+
+ClusterEventListener = Callable[[list[dict]], None]
+
+
+class ClusterInventorySync:
+    """Syncs the cluster table with Karmada in the background."""
+
+    def __init__(
+        self,
+        karmada_helper: KarmadaHelper,
+        grafana_helper: GrafanaHelper,
+        config: dict,
+        session_factory: Callable[[], Session],
+        listeners: list[ClusterEventListener] | None = None,
+        watch_timeout: int = 300,
+        retry_delay: float = 5.0,
+    ):
+        self.karmada_helper = karmada_helper
+        self.grafana_helper = grafana_helper
+        self.config = config
+        self.session_factory = session_factory
+        self.listeners = list(listeners or [])
+
+        # `time.monotonic()` of the last applied change batch (None until started)
+        self.last_sync: float | None = None
+
+        self._lock = threading.Lock()
+        self.watcher = ClusterWatcher(
+            karmada_helper.custom_api,
+            self.apply_changes,
+            watch_timeout=watch_timeout,
+            retry_delay=retry_delay,
+        )
+
+    def add_listener(self, listener: ClusterEventListener) -> None:
+        self.listeners.append(listener)
+
+    def start(self) -> None:
+        """Syncs all the clusters, then follows their changes in a background thread."""
+        self.watcher.start()
+
+    def stop(self) -> None:
+        self.watcher.stop()
+
+    @property
+    def is_synced(self) -> bool:
+        return self.last_sync is not None
+
+    def apply_changes(
+        self, cluster_infos: dict[str, dict], removed: set[str], snapshot: bool
+    ) -> list[dict]:
+        """Writes a batch of cluster changes to the DB and notifies the listeners."""
+        with self._lock:
+            try:
+                with self.session_factory() as session:
+                    cluster_service = ClusterService(
+                        db_session=session,
+                        karmada_helper=self.karmada_helper,
+                        grafana_helper=self.grafana_helper,
+                        config=self.config,
+                    )
+                    events = cluster_service.sync_clusters(
+                        cluster_infos, removed=removed, snapshot=snapshot
+                    )
+            except SQLAlchemyError as e:
+                print(f"Warning: could not sync clusters: {e}")
+                self.watcher.resync()
+                return []
+            self.last_sync = time.monotonic()
+
+        for listener in self.listeners:
+            listener(events)
+        return events
@@ -1,17 +1,30 @@
 """Application graph deployment business logic."""
 
-import os
-import tempfile
+import copy
+import functools
+import hashlib
+import json
+import subprocess
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 
 import yaml
 from glom import glom
 from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
 
 from smo_core.helpers import KarmadaHelper, PrometheusHelper
 from smo_core.helpers.grafana.grafana_helper import GrafanaHelper
-from smo_core.models import Cluster, Graph, Service
+from smo_core.helpers.karmada_helper import (
+    GRAPH_LABEL,
+    PROJECT_LABEL,
+    graph_label_selector,
+)
+from smo_core.helpers.manifest_applier import parse_manifests, resource_ref
+from smo_core.models import Cluster, Graph, Release, Service
 from smo_core.services.placement_service import (
     NaivePlacementService,
     PlacementService,
@@ -19,11 +32,97 @@ from smo_core.services.placement_service import (
     convert_placement,
 )
 from smo_core.utils import run_helm
+from smo_core.utils.artifact_cache import ArtifactCache, artifact_cache_from_config
+from smo_core.utils.external_commands import DEFAULT_TIMEOUT
 from smo_core.utils.intent_translation import (
     translate_cpu,
     translate_memory,
     translate_storage,
 )
+from smo_core.utils.lifecycle import (
+    OK,
+    LifecycleExecutor,
+    OperationResult,
+    raise_for_failures,
+    service_dependencies,
+)
+from smo_core.utils.migration import (
+    DEFAULT_MAX_CONCURRENT,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_READINESS_TIMEOUT,
+    Migration,
+    MigrationExecutor,
+)
+from smo_core.utils.trigger_metrics import (
+    COLD,
+    STAGED,
+    parse_timestamp,
+)
+
+# How the trigger conditions of the conditional services are evaluated
+# (`triggers.mode` config): by Prometheus alerts, delivered to `/alerts` by
+# Alertmanager, or by SMO itself (see `TriggerEvaluator`).
+TRIGGER_MODE_PROMETHEUS = "prometheus"
+TRIGGER_MODE_SMO = "smo"
+
+# How the services are deployed (`helm.engine` config): by running `helm`
+# for each operation, or by applying the manifests rendered by
+# `helm template` through the Kubernetes API (see `ManifestApplier`).
+ENGINE_HELM = "helm"
+ENGINE_NATIVE = "native"
+
+# Steps of the deployment of a graph (see `GraphService.deploy_graph`)
+DEPLOY_STEPS = (
+    "placement",
+    "services",
+    "service_dashboards",
+    "rules",
+    "install",
+    "stage",
+    "graph_dashboard",
+)
+GRAPH_DEPLOYING = "Deploying"
+# The deployment failed, and can be resumed
+GRAPH_FAILED = "Failed"
+
+RELEASE_DEPLOYED = "deployed"
+# Rendered ahead of the trigger of a conditional service, not applied yet
+RELEASE_STAGED = "staged"
+RELEASE_UNINSTALLED = "uninstalled"
+
+
+def values_digest(artifact_ref: str, values: dict | None) -> str:
+    """Returns the digest of a chart reference and its values, as applied by helm."""
+    data = json.dumps({"chart": artifact_ref, "values": values}, sort_keys=True)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def diff_graph_descriptors(old: dict, new: dict) -> dict[str, list[str]]:
+    """
+    Compares the services of two descriptors of a graph. Returns the ids of
+    the services `added`, `removed`, `changed` (any difference in their
+    descriptor: artifact, values, intent or trigger) and `unchanged`.
+    """
+    old_services = {s["id"]: s for s in (old or {}).get("services", [])}
+    new_services = {s["id"]: s for s in (new or {}).get("services", [])}
+    diff = {"added": [], "removed": [], "changed": [], "unchanged": []}
+    for name, service_data in new_services.items():
+        if name not in old_services:
+            diff["added"].append(name)
+        elif old_services[name] != service_data:
+            diff["changed"].append(name)
+        else:
+            diff["unchanged"].append(name)
+    diff["removed"] = [name for name in old_services if name not in new_services]
+    return diff
+
+
+def release_resources(release: Release) -> list[dict]:
+    """Returns the references of the resources of a release."""
+    return [
+        resource_ref(manifest, release.namespace)
+        for manifest in release.manifests or []
+    ]
 
 
 @dataclass(frozen=True)
@@ -40,6 +139,10 @@ class GraphService:
     placement_service: PlacementService = NaivePlacementService()
     reoptimization_service: PlacementService = ReoptimizationPlacementService()
 
+    # Called with a short message at each step of the long operations
+    # (e.g. to report the progress of a background job)
+    on_progress: Callable[[str], None] | None = None
+
     def get_graphs(self, project: str = "") -> list[Graph]:
         """Retrieves all the graph descriptors of a project"""
         stmt = select(Graph)
@@ -48,6 +151,14 @@ class GraphService:
         stmt = stmt.order_by(Graph.name)
         return list(self.db_session.scalars(stmt).all())
 
+    @property
+    def trigger_mode(self) -> str:
+        return self.config.get("triggers", {}).get("mode", TRIGGER_MODE_PROMETHEUS)
+
+    @property
+    def deploy_engine(self) -> str:
+        return self.config.get("helm", {}).get("engine", ENGINE_HELM)
+
     def get_graph(self, name: str) -> Graph | None:
         """Retrieves the descriptor of an application graph."""
         return self.db_session.query(Graph).filter_by(name=name).first()
@@ -56,55 +167,178 @@ class GraphService:
         """
         Instantiates an application graph by using Helm to
         deploy each service's artifact.
-        """
-        # 1. Validate and create Graph DB object
-        # 2. Prepare placement data (calculate_naive_placement, convert_placement)
-        # 3. Prepare service imports
-        # 4. Loop through services:
-        #    a. Create Prometheus alert
-        #    b. Translate resource intents (CPU, memory, etc.)
-        #    c. Update values_overwrite with placement info
-        #    d. Create service-level Grafana dashboard
-        #    e. Create Service DB object
-        #    f. Conditionally run helm install
-        # 5. Create graph-level Grafana dashboard
-        # 6. Commit transaction
 
+        The deployment runs the steps of `DEPLOY_STEPS` in order, and
+        commits after each of them. If a step fails, the graph is left in
+        the "Failed" status with the steps completed so far: deploying the
+        same descriptor again resumes from the first incomplete step, so
+        the dashboards, alert rules and helm releases already created are
+        not created again.
+        """
         name = graph_descriptor["id"]
-        if self.get_graph(name) is not None:
+        graph = self.get_graph(name)
+        if graph is None:
+            # Create the main graph object in the database
+            graph = self._create_graph_db_entry(project, graph_descriptor)
+        elif not self.can_resume_deploy(graph, project, graph_descriptor):
             raise ValueError(f"Graph with name {name} already exists")
+        else:
+            print(f"Resuming the deployment of graph {name}...")
+            graph.status = GRAPH_DEPLOYING
 
-        # 1: Create the main graph object in the database
-        graph = self._create_graph_db_entry(project, graph_descriptor)
-
-        # 2: Determine where each service should be placed
-        services_descriptor = graph_descriptor["services"]
-        placement_info = self._prepare_placement_info(graph, services_descriptor)
-
-        # 3&4: Create and deploy each individual service artifact
-        service_names = self._deploy_individual_services(
-            graph, services_descriptor, placement_info
-        )
-
-        # 5: Create a top-level Grafana dashboard for the entire graph
-        self._create_and_link_graph_dashboard(graph, service_names)
+        steps = {
+            "placement": self._deploy_step_placement,
+            "services": self._deploy_step_services,
+            "service_dashboards": self._deploy_step_service_dashboards,
+            "rules": self._deploy_step_rules,
+            "install": self._deploy_step_install,
+            "stage": self._deploy_step_stage,
+            "graph_dashboard": self._deploy_step_graph_dashboard,
+        }
+        for step in DEPLOY_STEPS:
+            if step in (graph.deploy_state or {}).get("completed", []):
+                continue
+            self._progress(step.replace("_", " "))
+            try:
+                steps[step](graph)
+            except Exception as e:
+                # Keep what was done (e.g. the services installed so far)
+                try:
+                    self._checkpoint(graph, failed_step=step, error=str(e))
+                except SQLAlchemyError as checkpoint_error:
+                    self.db_session.rollback()
+                    print(f"Warning: could not record the failure: {checkpoint_error}")
+                raise
+            self._checkpoint(graph, completed_step=step)
 
-        # 6: Commit the graph and services to the database
+        graph.status = "Running"
         self.db_session.commit()
 
+    def _progress(self, message: str) -> None:
+        if self.on_progress is not None:
+            self.on_progress(message)
+
     def _create_graph_db_entry(self, project: str, graph_descriptor: dict) -> Graph:
         """Creates and saves the initial Graph entity to the database."""
         graph = Graph(
             name=graph_descriptor["id"],
             graph_descriptor=graph_descriptor,
             project=project,
-            status="Running",
+            status=GRAPH_DEPLOYING,
             grafana=None,
+            deploy_state={"completed": []},
         )
         self.db_session.add(graph)
-        self.db_session.flush()  # Use flush to get graph.id for service relationships
+        self.db_session.commit()
         return graph
 
+    def can_resume_deploy(
+        self, graph: Graph, project: str, graph_descriptor: dict
+    ) -> bool:
+        """Returns True if `graph` is an incomplete deployment of the same descriptor."""
+        return (
+            graph.status in (GRAPH_DEPLOYING, GRAPH_FAILED)
+            and graph.project == project
+            and graph.graph_descriptor == graph_descriptor
+        )
+
+    def _checkpoint(
+        self,
+        graph: Graph,
+        completed_step: str | None = None,
+        failed_step: str | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Records the outcome of a deployment step, and commits."""
+        state = dict(graph.deploy_state or {})
+        state["completed"] = list(state.get("completed", []))
+        if completed_step is not None:
+            state["completed"].append(completed_step)
+            state.pop("failed_step", None)
+            state.pop("error", None)
+        if failed_step is not None:
+            state["failed_step"] = failed_step
+            state["error"] = error
+            graph.status = GRAPH_FAILED
+        graph.deploy_state = state  # A new dict, for the change to be detected
+        self.db_session.commit()
+
+    def _deploy_step_placement(self, graph: Graph) -> None:
+        """Determines where each service should be placed."""
+        services_descriptor = graph.graph_descriptor["services"]
+        placement_info = self._prepare_placement_info(graph, services_descriptor)
+        graph.deploy_state = {**(graph.deploy_state or {}), "placement": placement_info}
+
+    def _deploy_step_services(self, graph: Graph) -> None:
+        """Creates the Service entities of the graph (not deployed yet)."""
+        placement_info = (graph.deploy_state or {}).get("placement") or {
+            "service_placement": {},
+            "import_clusters": {},
+        }
+        existing = {service.name for service in graph.services}
+        for service_data in graph.graph_descriptor["services"]:
+            if service_data["id"] in existing:
+                continue
+            service = self._build_service_object(graph, service_data, placement_info)
+            graph.services.append(service)
+            self.db_session.add(service)
+
+    def _deploy_step_service_dashboards(self, graph: Graph) -> None:
+        """Publishes the Grafana dashboards of the services that have none yet."""
+        for service in graph.services:
+            if service.grafana:
+                continue
+            dashboard = self.grafana_helper.create_graph_service(service.name)
+            response = self.grafana_helper.publish_dashboard(dashboard)
+            service.grafana = f"{self.config['grafana']['host']}{response['url']}"
+            self.db_session.commit()  # Published dashboards are never redone
+
+    def _deploy_step_rules(self, graph: Graph) -> None:
+        """
+        Creates the PrometheusRule of the graph, with the alerts of its
+        conditional services and the recording rules of its request rates.
+
+        Without a Kubernetes client, the rules are skipped; otherwise a failed
+        write fails the step, so that it is retried when the deploy resumes.
+        """
+        written = self.prom_helper.create_graph_rules(
+            graph.name,
+            self._prometheus_alerts(graph.services),
+            service_names=[service.name for service in graph.services],
+        )
+        if not written and self.prom_helper.manages_rules:
+            raise RuntimeError(
+                f"Could not write the PrometheusRule of graph {graph.name}"
+            )
+
+    def _deploy_step_install(self, graph: Graph) -> None:
+        """
+        Installs the services that are not conditional, in dependency order
+        (the services installed by a previous attempt are skipped).
+        """
+        results = self._apply_services(
+            graph,
+            [s for s in graph.services if s.status == "Not deployed"],
+            "install",
+        )
+        for service in graph.services:
+            if service.name in results and results[service.name].ok:
+                service.status = "Deployed"
+        raise_for_failures(results)
+
+    def _deploy_step_stage(self, graph: Graph) -> None:
+        """Prepares the conditional services, for a fast deploy on trigger."""
+        self._stage_services(
+            graph, [s for s in graph.services if s.status == "Pending"]
+        )
+
+    def _deploy_step_graph_dashboard(self, graph: Graph) -> None:
+        """Creates a top-level Grafana dashboard for the entire graph."""
+        if not graph.grafana:
+            self._create_and_link_graph_dashboard(
+                graph, [service.name for service in graph.services]
+            )
+
     def _prepare_placement_info(self, graph: Graph, services_descriptor: list) -> dict:
         """Calculates and prepares placement and service import data."""
         if graph.graph_descriptor.get("hdaGraphIntent", {}).get(
@@ -155,33 +389,13 @@ class GraphService:
             "import_clusters": import_clusters,
         }
 
-    def _deploy_individual_services(
-        self, graph: Graph, services_descriptor: list, placement_info: dict
-    ) -> list[str]:
-        """Loops through services, creates their DB entries, and deploys them."""
-        deployed_service_names = []
-        for service_data in services_descriptor:
-            # Build the Service database object with all its properties
-            service = self._build_service_object(graph, service_data, placement_info)
-            self.db_session.add(service)
-
-            deployed_service_names.append(service.name)
-
-            # Deploy the service now if it's not conditional
-            if service.status == "Deployed":
-                self._helm_install_artifact(
-                    service.name,
-                    service.artifact_ref,
-                    service.values_overwrite,
-                    graph.project,
-                    "install",
-                )
-        return deployed_service_names
-
     def _build_service_object(
         self, graph: Graph, service_data: dict, placement_info: dict
     ) -> Service:
-        """Builds a single Service object from its descriptor data, ready for DB insertion."""
+        """
+        Builds a single Service object from its descriptor data, ready for DB
+        insertion (its dashboard is published by a later step).
+        """
         svc_name = service_data["id"]
         artifact = service_data["artifact"]
         values_overwrite = artifact["valuesOverwrite"]
@@ -199,15 +413,21 @@ class GraphService:
                 event["condition"]["description"],
                 svc_name,
             )
-            self.prom_helper.update_alert_rules(alert, "add")
+
+        placement_dict = (
+            values_overwrite.setdefault("voChartOverwrite", {})
+            if implementer == "WOT"
+            else values_overwrite
+        )
+
+        # Label the resources of the service, so that the deployments of the
+        # graph can be listed together (see `get_deployments_status`)
+        placement_dict.setdefault("commonLabels", {}).update(
+            {GRAPH_LABEL: graph.name, PROJECT_LABEL: graph.project}
+        )
 
         # Update values with dynamic placement info if applicable
         if placement_info["service_placement"]:
-            placement_dict = (
-                values_overwrite.setdefault("voChartOverwrite", {})
-                if implementer == "WOT"
-                else values_overwrite
-            )
             placement_dict["clustersAffinity"] = [
                 placement_info["service_placement"][svc_name]
             ]
@@ -215,11 +435,6 @@ class GraphService:
                 svc_name
             ]
 
-        # Create the service's Grafana dashboard
-        svc_dashboard = self.grafana_helper.create_graph_service(svc_name)
-        response = self.grafana_helper.publish_dashboard(svc_dashboard)
-        grafana_url = f"{self.config['grafana']['host']}{response['url']}"
-
         if glom(service_data, "deployment.intent.compute.gpu.enabled", default=False):
             gpu = 1
         else:
@@ -229,7 +444,8 @@ class GraphService:
             name=svc_name,
             values_overwrite=values_overwrite,
             graph_id=graph.id,
-            status="Pending" if is_conditional else "Deployed",
+            # Installed by the "install" step of the deployment
+            status="Pending" if is_conditional else "Not deployed",
             cluster_affinity=placement_info.get("service_placement", {}).get(svc_name),
             artifact_ref=artifact["ociImage"],
             artifact_type=artifact["ociConfig"]["type"],
@@ -244,7 +460,7 @@ class GraphService:
                 glom(service_data, "deployment.intent.compute.storage", default="small")
             ),
             gpu=gpu,
-            grafana=grafana_url,
+            grafana=None,
             alert=alert,
         )
 
@@ -263,8 +479,12 @@ class GraphService:
 
         # 1. Gather current state data
         cluster_data = self._get_cluster_data()
+        statuses = self.get_deployments_status(graph)
         current_replicas = {
-            s.name: self.karmada_helper.get_replicas(s.name) or 1
+            s.name: (
+                statuses[s.name].available_replicas if s.name in statuses else None
+            )
+            or 1
             for s in graph.services
         }
 
@@ -279,6 +499,213 @@ class GraphService:
 
         self.db_session.commit()
 
+    def update_graph(self, name: str, graph_descriptor: dict) -> dict[str, list[str]]:
+        """
+        Updates a graph to a new descriptor, only acting on what changed
+        (see `diff_graph_descriptors`): the removed services are uninstalled,
+        the added ones installed, and the changed ones upgraded. Only the
+        added and changed services are placed again, the others stay on
+        their cluster. The dashboards and alert rules of the graph are only
+        updated if its services or their alerts changed.
+
+        A stopped graph is only updated in the database, its services are
+        installed when it is started. Returns the diff.
+        """
+        graph = self.get_graph(name)
+        if not graph:
+            raise ValueError(f"Graph {name} not found")
+        if graph_descriptor.get("id") != name:
+            raise ValueError(
+                f"Descriptor of graph {graph_descriptor.get('id')} can't update "
+                f"graph {name}"
+            )
+        if graph.status in (GRAPH_DEPLOYING, GRAPH_FAILED):
+            raise ValueError(
+                f"Graph {name} is not fully deployed, deploy it again to resume"
+            )
+
+        diff = diff_graph_descriptors(graph.graph_descriptor, graph_descriptor)
+        if graph.graph_descriptor == graph_descriptor:
+            print(f"Graph {name} is up to date.")
+            return diff
+        print(
+            f"Updating graph {name}: {len(diff['added'])} added, "
+            f"{len(diff['removed'])} removed, {len(diff['changed'])} changed."
+        )
+        running = graph.status == "Running"
+        services_data = {s["id"]: s for s in graph_descriptor["services"]}
+        by_name = {service.name: service for service in graph.services}
+
+        # 1. Uninstall the removed services (in the order of the old graph)
+        removed = [by_name[n] for n in diff["removed"] if n in by_name]
+        if removed:
+            self._progress("remove services")
+            results = self._uninstall_services(graph, removed)
+            for service in removed:
+                if service.name in results and results[service.name].ok:
+                    service.status = "Not deployed"
+                    service.applied_digest = None
+            self.db_session.commit()
+            raise_for_failures(results)
+            for service in removed:
+                release = self._get_release(service.name)
+                if release is not None:
+                    self.db_session.delete(release)
+                graph.services.remove(service)
+                self.db_session.delete(service)
+
+        # 2. Place the added and changed services
+        self._progress("placement")
+        placement_info = self._prepare_update_placement(
+            graph, graph_descriptor, diff["added"] + diff["changed"]
+        )
+
+        # 3. Update the services, without touching those that didn't change
+        alerts_changed = bool(removed)
+        for service_name in diff["changed"]:
+            service = by_name[service_name]
+            updated = self._build_service_object(
+                graph, copy.deepcopy(services_data[service_name]), placement_info
+            )
+            alerts_changed |= service.alert != updated.alert
+            for attr in (
+                "values_overwrite",
+                "cluster_affinity",
+                "artifact_ref",
+                "artifact_type",
+                "artifact_implementer",
+                "cpu",
+                "memory",
+                "storage",
+                "gpu",
+                "alert",
+            ):
+                setattr(service, attr, getattr(updated, attr))
+            if service.status != "Deployed":
+                service.status = updated.status if running else "Not deployed"
+        for service_name in diff["added"]:
+            service = self._build_service_object(
+                graph, copy.deepcopy(services_data[service_name]), placement_info
+            )
+            alerts_changed |= bool(service.alert)
+            if not running:
+                service.status = "Not deployed"
+            graph.services.append(service)
+            self.db_session.add(service)
+        if placement_info["service_placement"]:
+            # The imports of the unchanged services follow their peers
+            for service_name in diff["unchanged"]:
+                service = by_name[service_name]
+                self._set_placement_values(
+                    service,
+                    placement_info["service_placement"].get(service_name),
+                    placement_info["import_clusters"].get(service_name, []),
+                )
+
+        graph.graph_descriptor = copy.deepcopy(graph_descriptor)
+        self.db_session.commit()
+
+        # 4. Dashboards and alert rules
+        if diff["added"]:
+            self._progress("service dashboards")
+            self._deploy_step_service_dashboards(graph)
+        if diff["added"] or removed:
+            self._create_and_link_graph_dashboard(
+                graph, [service.name for service in graph.services]
+            )
+        if running and (alerts_changed or diff["added"]):
+            self._progress("rules")
+            self._deploy_step_rules(graph)
+        self.db_session.commit()
+
+        if not running:
+            return diff
+
+        # 5. Apply: only the services whose chart or values changed are
+        # upgraded (see `_apply_services`)
+        self._progress("install")
+        results = self._apply_services(
+            graph, [s for s in graph.services if s.status == "Deployed"], "upgrade"
+        )
+        installed = self._apply_services(
+            graph, [s for s in graph.services if s.status == "Not deployed"], "install"
+        )
+        for service in graph.services:
+            if service.name in installed and installed[service.name].ok:
+                service.status = "Deployed"
+        results.update(installed)
+        self._stage_services(
+            graph, [s for s in graph.services if s.status == "Pending"]
+        )
+        self.db_session.commit()
+        raise_for_failures(results)
+        return diff
+
+    def _prepare_update_placement(
+        self, graph: Graph, graph_descriptor: dict, names: list[str]
+    ) -> dict:
+        """
+        Places the services `names` of an updated graph, the other services
+        keeping their cluster, and returns the placement info (see
+        `_prepare_placement_info`).
+        """
+        if graph_descriptor.get("hdaGraphIntent", {}).get("useStaticPlacement", False):
+            return {"service_placement": {}, "import_clusters": {}}
+
+        services_descriptor = graph_descriptor["services"]
+        service_placement = {
+            service.name: service.cluster_affinity
+            for service in graph.services
+            if service.name not in names and service.cluster_affinity
+        }
+        cluster_data = self._get_cluster_data()
+        to_place = [s for s in services_descriptor if s["id"] in names]
+        if to_place:
+            placement_matrix = self.placement_service.calculate(
+                cluster_data["capacities"],
+                cluster_data["accelerations"],
+                [
+                    translate_cpu(s["deployment"]["intent"]["compute"]["cpu"])
+                    for s in to_place
+                ],
+                [
+                    1
+                    if s["deployment"]["intent"]["compute"]["gpu"]["enabled"] == "True"
+                    else 0
+                    for s in to_place
+                ],
+                replicas=[1] * len(to_place),
+            )
+            service_placement.update(
+                convert_placement(placement_matrix, to_place, cluster_data["names"])
+            )
+
+        # The placement matrix of the graph, in the order of the descriptor
+        graph.placement = [
+            [
+                1 if cluster == service_placement.get(s["id"]) else 0
+                for cluster in cluster_data["names"]
+            ]
+            for s in services_descriptor
+        ]
+        return {
+            "service_placement": service_placement,
+            "import_clusters": self._create_service_imports(
+                services_descriptor, service_placement
+            ),
+        }
+
+    def get_deployments_status(self, graph: Graph) -> dict:
+        """
+        Returns the status of the deployments of the services of a graph
+        (see `KarmadaHelper.get_deployments_status`), with a single list call.
+        """
+        return self.karmada_helper.get_deployments_status(
+            namespace=graph.project,
+            label_selector=graph_label_selector(graph.name),
+            names=[s.name for s in graph.services],
+        )
+
     def _get_cluster_data(self) -> dict:
         """Queries the database for current cluster capacity and returns structured data."""
         available_clusters = (
@@ -321,29 +748,189 @@ class GraphService:
         service_placement = convert_placement(
             new_placement_matrix, descriptor_services, cluster_data["names"]
         )
+
+        # Move the deployed services make-before-break, a few at a time
+        self._progress("migration")
+        results = self._migrate_services(graph, service_placement)
+        for index, service_data in enumerate(descriptor_services):
+            result = results.get(service_data["id"])
+            if result is not None and not result.ok:
+                # Kept on its source cluster
+                source = self._current_cluster(
+                    next(s for s in graph.services if s.name == service_data["id"])
+                )
+                service_placement[service_data["id"]] = source
+                new_placement_matrix[index] = [
+                    1 if name == source else 0 for name in cluster_data["names"]
+                ]
+        graph.placement = new_placement_matrix
+
         import_clusters = self._create_service_imports(
             descriptor_services, service_placement
         )
         for service in graph.services:
-            values_overwrite = dict(service.values_overwrite)
-            placement_dict = values_overwrite
+            self._set_placement_values(
+                service, service_placement[service.name], import_clusters[service.name]
+            )
+            service.cluster_affinity = service_placement[service.name]
+
+        # Only the services whose values actually changed (e.g. the imports
+        # of the peers of the moved services, once they all moved) are upgraded
+        deployed = [s for s in graph.services if s.status == "Deployed"]
+        results.update(self._apply_services(graph, deployed, "upgrade"))
+        self._stage_services(
+            graph, [s for s in graph.services if s.status == "Pending"]
+        )
+        self.db_session.commit()
+        raise_for_failures(results)
+
+    def _current_cluster(self, service: Service) -> str | None:
+        """Returns the cluster a service is placed on."""
+        if service.cluster_affinity:
+            return service.cluster_affinity
+        placement_dict = service.values_overwrite or {}
+        if service.artifact_implementer == "WOT":
+            placement_dict = placement_dict.get("voChartOverwrite", {})
+        clusters = placement_dict.get("clustersAffinity") or []
+        return clusters[0] if clusters else None
+
+    def _migrate_services(
+        self, graph: Graph, service_placement: dict[str, str]
+    ) -> dict[str, OperationResult]:
+        """
+        Moves the deployed services whose cluster changed to their new
+        cluster, make-before-break (see `MigrationExecutor`), at most
+        `migration.max_concurrent` at once. The values applied to the moved
+        services and their peers are recorded on the services.
+        """
+        deployed = {s.name: s for s in graph.services if s.status == "Deployed"}
+        connections = {
+            s["id"]: glom(s, "deployment.intent.connectionPoints", default=None) or []
+            for s in graph.graph_descriptor["services"]
+        }
+        migrations = []
+        for service in deployed.values():
+            source = self._current_cluster(service)
+            target = service_placement.get(service.name)
+            if source and target and source != target:
+                peers = [
+                    peer
+                    for peer in connections.get(service.name, [])
+                    if peer in deployed and peer != service.name
+                ]
+                migrations.append(Migration(service.name, source, target, tuple(peers)))
+        if not migrations:
+            return {}
+
+        clusters = {}
+        import_clusters = {}
+        for service in deployed.values():
+            placement_dict = service.values_overwrite or {}
             if service.artifact_implementer == "WOT":
-                placement_dict = values_overwrite.setdefault("voChartOverwrite", {})
+                placement_dict = placement_dict.get("voChartOverwrite", {})
+            cluster = self._current_cluster(service)
+            clusters[service.name] = [cluster] if cluster else []
+            import_clusters[service.name] = list(
+                placement_dict.get("serviceImportClusters") or []
+            )
 
-            if (
-                placement_dict.get("clustersAffinity", [None])[0]
-                != service_placement[service.name]
-            ):
-                placement_dict["clustersAffinity"] = [service_placement[service.name]]
-                placement_dict["serviceImportClusters"] = import_clusters[service.name]
-                service.values_overwrite = values_overwrite
-                self._helm_install_artifact(
-                    service.name,
-                    service.artifact_ref,
-                    values_overwrite,
-                    graph.project,
-                    "upgrade",
+        # The session is not used by the executor threads: the operations
+        # only get snapshots of the services
+        namespace = graph.project
+        snapshots = {
+            name: (
+                service.artifact_ref,
+                copy.deepcopy(service.values_overwrite or {}),
+                service.artifact_implementer,
+            )
+            for name, service in deployed.items()
+        }
+        previous = {}
+        if self.deploy_engine == ENGINE_NATIVE:
+            for name in deployed:
+                release = self._get_release(name)
+                if release is not None and release.status == RELEASE_DEPLOYED:
+                    previous[name] = release_resources(release)
+        applied: dict[str, dict] = {}
+        rendered: dict[str, list[dict]] = {}
+
+        def apply(name: str, clusters: list[str], import_clusters: list[str]):
+            artifact_ref, values, implementer = snapshots[name]
+            values = copy.deepcopy(values)
+            placement_dict = values
+            if implementer == "WOT":
+                placement_dict = values.setdefault("voChartOverwrite", {})
+            if clusters:
+                placement_dict["clustersAffinity"] = clusters
+            placement_dict["serviceImportClusters"] = import_clusters
+            if self.deploy_engine == ENGINE_NATIVE:
+                if name in rendered:
+                    previous[name] = [
+                        resource_ref(manifest, namespace) for manifest in rendered[name]
+                    ]
+                output = self._apply_manifests(
+                    name,
+                    artifact_ref,
+                    values,
+                    namespace,
+                    None,
+                    previous.get(name, []),
+                    rendered,
                 )
+            else:
+                output = self._helm_install_artifact(
+                    name, artifact_ref, values, namespace, "upgrade"
+                )
+            applied[name] = values
+            return output
+
+        migration_config = self.config.get("migration", {})
+        executor = MigrationExecutor(
+            apply,
+            functools.partial(self._is_ready_on_cluster, namespace),
+            max_concurrent=migration_config.get(
+                "max_concurrent", DEFAULT_MAX_CONCURRENT
+            ),
+            readiness_timeout=migration_config.get(
+                "readiness_timeout_seconds", DEFAULT_READINESS_TIMEOUT
+            ),
+            poll_interval=migration_config.get(
+                "poll_interval_seconds", DEFAULT_POLL_INTERVAL
+            ),
+        )
+        results = executor.run(migrations, clusters, import_clusters)
+
+        for name, values in applied.items():
+            service = deployed[name]
+            service.values_overwrite = values
+            service.applied_digest = values_digest(service.artifact_ref, values)
+            if name in rendered:
+                self._record_release(
+                    service, namespace, service.applied_digest, rendered[name]
+                )
+        for migration in migrations:
+            result = results[migration.name]
+            if result.ok:
+                deployed[migration.name].cluster_affinity = migration.target
+            else:
+                print(f"Migration of service {migration.name} failed: {result.error}")
+        return results
+
+    def _is_ready_on_cluster(self, namespace: str, name: str, cluster: str) -> bool:
+        return self.karmada_helper.is_ready_on_cluster(name, cluster, namespace)
+
+    def _set_placement_values(
+        self, service: Service, cluster: str | None, import_clusters: list[str]
+    ) -> None:
+        """Sets the cluster and imports of a service in its values."""
+        values_overwrite = copy.deepcopy(service.values_overwrite)
+        placement_dict = values_overwrite
+        if service.artifact_implementer == "WOT":
+            placement_dict = values_overwrite.setdefault("voChartOverwrite", {})
+        if cluster is not None:
+            placement_dict["clustersAffinity"] = [cluster]
+        placement_dict["serviceImportClusters"] = import_clusters
+        service.values_overwrite = values_overwrite
 
     def start_graph(self, name: str) -> None:
         graph = self.get_graph(name)
@@ -352,20 +939,22 @@ class GraphService:
         if graph.status == "Running":
             raise ValueError(f"Graph {name} is already running")
 
-        graph.status = "Running"
+        self.prom_helper.update_alert_rules_batch(
+            add=self._prometheus_alerts(graph.services), graph_name=graph.name
+        )
+        results = self._apply_services(
+            graph,
+            [s for s in graph.services if s.status == "Not deployed"],
+            "install",
+        )
         for service in graph.services:
-            if service.alert:
-                self.prom_helper.update_alert_rules(service.alert, "add")
-            if service.status == "Not deployed":
-                self._helm_install_artifact(
-                    service.name,
-                    service.artifact_ref,
-                    service.values_overwrite,
-                    graph.project,
-                    "install",
-                )
+            if service.name in results and results[service.name].ok:
                 service.status = "Deployed"
+        # If some services failed, the graph can be started again to retry them
+        if all(result.ok for result in results.values()):
+            graph.status = "Running"
         self.db_session.commit()
+        raise_for_failures(results)
 
     def stop_graph(self, name: str) -> None:
         graph = self.get_graph(name)
@@ -374,21 +963,39 @@ class GraphService:
         if graph.status == "Stopped":
             raise ValueError(f"Graph {name} is already stopped")
 
-        self._helm_uninstall_graph(graph.services, graph.project)
-        graph.status = "Stopped"
+        self.prom_helper.update_alert_rules_batch(
+            remove=self._prometheus_alerts(graph.services), graph_name=graph.name
+        )
+        results = self._helm_uninstall_graph(graph)
         for service in graph.services:
-            if service.status == "Deployed":
+            if service.name in results and results[service.name].ok:
                 service.status = "Not deployed"
+                service.applied_digest = None
+        # If some services failed, the graph can be stopped again to retry them
+        if all(result.ok for result in results.values()):
+            graph.status = "Stopped"
         self.db_session.commit()
+        raise_for_failures(results)
 
     def remove_graph(self, name: str) -> None:
         graph = self.get_graph(name)
         if not graph:
             raise ValueError(f"Graph {name} not found")
 
+        if not self.prom_helper.delete_graph_rules(graph.name):
+            # Alerts of a graph deployed before the rules were sharded per graph
+            self.prom_helper.update_alert_rules_batch(
+                remove=[service.alert for service in graph.services if service.alert],
+                graph_name=graph.name,
+            )
         if graph.status != "Stopped":
-            self._helm_uninstall_graph(graph.services, graph.project)
+            raise_for_failures(self._helm_uninstall_graph(graph))
 
+        if self.deploy_engine == ENGINE_NATIVE:
+            for service in graph.services:
+                release = self._get_release(service.name)
+                if release is not None:
+                    self.db_session.delete(release)
         self.db_session.delete(graph)
         self.db_session.commit()
 
@@ -406,38 +1013,180 @@ class GraphService:
                     )
                     continue
 
-                graph = service.graph
-                self._helm_install_artifact(
-                    service.name,
-                    service.artifact_ref,
-                    service.values_overwrite,
-                    graph.project,
-                    "install",
+                self._deploy_pending_service(
+                    service, triggered_at=parse_timestamp(alert.get("startsAt"))
                 )
-                service.status = "Deployed"
                 self.db_session.commit()
 
-    def _helm_install_artifact(
-        self, name, artifact_ref, values_overwrite, namespace, command
-    ):
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".yaml", delete=False
-        ) as values_file:
-            yaml.dump(values_overwrite, values_file)
-            values_filename = values_file.name
+    def get_pending_services(self) -> list[Service]:
+        """Returns the conditional services, of running graphs, waiting for their trigger."""
+        stmt = (
+            select(Service)
+            .join(Service.graph)
+            .where(Service.status == "Pending", Graph.status == "Running")
+            .order_by(Service.name)
+        )
+        return [s for s in self.db_session.scalars(stmt).all() if s.alert]
+
+    def deploy_triggered_services(
+        self, names: list[str], triggered_at: dict[str, datetime] | None = None
+    ) -> list[str]:
+        """
+        Deploys the conditional services whose trigger fired (as evaluated
+        by SMO, see `TriggerEvaluator`), at `triggered_at` (by name) if
+        known. Returns the names of the deployed services (services that
+        are no longer pending are skipped).
+        """
+        if not names:
+            return []
+        stmt = select(Service).where(
+            Service.name.in_(names), Service.status == "Pending"
+        )
+        deployed = []
+        for service in self.db_session.scalars(stmt).all():
+            self._deploy_pending_service(
+                service, triggered_at=(triggered_at or {}).get(service.name)
+            )
+            deployed.append(service.name)
+        self.db_session.commit()
+        return deployed
+
+    def _deploy_pending_service(
+        self, service: Service, triggered_at: datetime | None = None
+    ) -> None:
+        """
+        Deploys a conditional service whose trigger fired (at `triggered_at`,
+        if known), from its staged manifests if they are up to date.
+        """
+        start = time.monotonic()
+        was_pending = service.status == "Pending"
+        digest = values_digest(service.artifact_ref, service.values_overwrite)
+        path = COLD
+        if service.applied_digest != digest:
+            namespace = service.graph.project
+            if self.deploy_engine == ENGINE_NATIVE:
+                release = self._get_release(service.name)
+                if (
+                    release is not None
+                    and release.status == RELEASE_STAGED
+                    and release.digest == digest
+                ):
+                    path = STAGED
+            rendered = {}
+            self._helm_operation(service, namespace, "install", rendered)()
+            if service.name in rendered:
+                self._record_release(service, namespace, digest, rendered[service.name])
+            service.applied_digest = digest
+        service.status = "Deployed"
 
-        # Temp
-        from pathlib import Path
+        # Alertmanager repeats the alerts of services already deployed
+        if was_pending:
+            self._record_trigger(service, triggered_at, time.monotonic() - start, path)
 
-        with Path("/tmp/helm_values.yaml").open("w") as f:
-            yaml.dump(values_overwrite, f)
+    def _record_trigger(
+        self,
+        service: Service,
+        triggered_at: datetime | None,
+        duration: float,
+        path: str,
+    ) -> None:
+        """Records the latency of the deployment of a triggered service."""
+        now = datetime.now(UTC)
+        if triggered_at is None:
+            triggered_at = now - timedelta(seconds=duration)
+        latency = max(0.0, (now - triggered_at).total_seconds())
+        service.triggered_at = triggered_at
+        service.trigger_latency = latency
+        print(
+            f"Service {service.name} deployed {latency:.2f}s after its trigger "
+            f"fired ({path}, deploy took {duration:.2f}s)."
+        )
 
+    def _stage_services(self, graph: Graph, services: list[Service]) -> None:
+        """
+        Prepares the deployment of conditional services, so that their
+        trigger only has to apply them: their chart is pulled into the
+        artifact cache and, with the native engine, their manifests are
+        rendered and kept in a staged release. A service that can't be
+        staged is deployed from scratch on trigger.
+        """
+        native = self.deploy_engine == ENGINE_NATIVE
+        if not services or (not native and self.artifact_cache is None):
+            return
+
+        operations = {}
+        digests = {}
+        rendered = {}
+        for service in services:
+            if not native:
+                operations[service.name] = functools.partial(
+                    self._resolve_chart, service.artifact_ref
+                )
+                continue
+            digest = values_digest(service.artifact_ref, service.values_overwrite)
+            release = self._get_release(service.name)
+            if release is not None and release.digest == digest:
+                continue  # Already rendered
+            digests[service.name] = digest
+            operations[service.name] = functools.partial(
+                self._stage_manifests,
+                service.name,
+                service.artifact_ref,
+                service.values_overwrite,
+                graph.project,
+                rendered,
+            )
+
+        executor = LifecycleExecutor(
+            max_workers=self.config.get("helm", {}).get("max_parallel", 8)
+        )
+        results = executor.run(operations, {})
+        for service in services:
+            result = results.get(service.name)
+            if result is None:
+                continue
+            if not result.ok:
+                print(
+                    f"Warning: could not stage service {service.name}: {result.error}"
+                )
+            elif service.name in rendered:
+                self._record_release(
+                    service,
+                    graph.project,
+                    digests[service.name],
+                    rendered[service.name],
+                    status=RELEASE_STAGED,
+                )
+
+    def _stage_manifests(
+        self,
+        name: str,
+        artifact_ref: str,
+        values_overwrite: dict,
+        namespace: str,
+        rendered: dict,
+    ) -> str:
+        rendered[name] = parse_manifests(
+            self._render_chart(name, artifact_ref, values_overwrite, namespace)
+        )
+        return f"Rendered {len(rendered[name])} resources"
+
+    def _prometheus_alerts(self, services) -> list[dict]:
+        """Returns the alerts to install in Prometheus for the conditional services."""
+        if self.trigger_mode != TRIGGER_MODE_PROMETHEUS:
+            return []  # Evaluated by SMO
+        return [service.alert for service in services if service.alert]
+
+    def _helm_install_artifact(
+        self, name, artifact_ref, values_overwrite, namespace, command
+    ):
+        # The values are passed on stdin (`--values -`), without temp files
         # fmt: off
         args = [
             command,
             name,
-            artifact_ref,
-            "--values", values_filename,
+            self._resolve_chart(artifact_ref),
+            "--values", "-",
             "--namespace", namespace,
             "--create-namespace",
             "--kubeconfig", self.config["karmada_kubeconfig"],
@@ -449,26 +1198,262 @@ class GraphService:
             args.append("--reuse-values")
 
         print(f"Running helm {command} for service {name}...")
-        result = run_helm(*args)
+        result = run_helm(
+            *args, timeout=self._helm_timeout, input=yaml.dump(values_overwrite)
+        )
         print(result)
-        os.remove(values_filename)
+        return result
+
+    def _helm_uninstall_graph(self, graph: Graph) -> dict[str, OperationResult]:
+        """Uninstalls the deployed services of a graph, dependents first."""
+        return self._uninstall_services(graph, graph.services)
 
-    def _helm_uninstall_graph(self, services, namespace):
+    def _uninstall_services(
+        self, graph: Graph, services: list[Service]
+    ) -> dict[str, OperationResult]:
+        """Uninstalls the deployed services among `services`, dependents first."""
+        operations = {}
+        releases = {}
         for service in services:
-            if service.alert:
-                self.prom_helper.update_alert_rules(service.alert, "remove")
-            if service.status == "Deployed":
-                print(f"Uninstalling service {service.name}...")
-                # fmt: off
-                args = [
-                    "uninstall",
-                    service.name,
-                    "--namespace", namespace,
-                    "--kubeconfig", self.config["karmada_kubeconfig"],
-                ]
-                # fmt: on
-                result = run_helm(*args)
-                print(result)
+            if service.status != "Deployed":
+                continue
+            release = None
+            if self.deploy_engine == ENGINE_NATIVE:
+                release = self._get_release(service.name)
+            if release is not None and release.status == RELEASE_DEPLOYED:
+                releases[service.name] = release
+                operations[service.name] = functools.partial(
+                    self.karmada_helper.manifest_applier.delete,
+                    release_resources(release),
+                )
+            else:
+                # Installed by helm
+                operations[service.name] = functools.partial(
+                    self._helm_uninstall_service, service.name, graph.project
+                )
+
+        results = self._run_helm_operations(graph, operations, reverse=True)
+        for name, release in releases.items():
+            if results[name].ok:
+                release.status = RELEASE_UNINSTALLED
+                release.updated_at = datetime.now(UTC)
+        return results
+
+    def _render_chart(self, name, artifact_ref, values_overwrite, namespace) -> str:
+        """Renders the manifests of a service with `helm template`."""
+        # fmt: off
+        args = [
+            "template",
+            name,
+            self._resolve_chart(artifact_ref),
+            "--values", "-",
+            "--namespace", namespace,
+        ]
+        # fmt: on
+        if self.config.get("helm", {}).get("insecure_registry"):
+            args.append("--plain-http")
+
+        print(f"Rendering the chart of service {name}...")
+        return run_helm(
+            *args, timeout=self._helm_timeout, input=yaml.dump(values_overwrite)
+        )
+
+    def _apply_manifests(
+        self,
+        name: str,
+        artifact_ref: str,
+        values_overwrite: dict,
+        namespace: str,
+        manifests: list[dict] | None,
+        previous: list[dict],
+        rendered: dict,
+    ) -> str:
+        """
+        Applies the manifests of a service (rendered first if not given),
+        pruning the resources of the `previous` revision no longer rendered.
+        """
+        if manifests is None:
+            manifests = parse_manifests(
+                self._render_chart(name, artifact_ref, values_overwrite, namespace)
+            )
+        print(f"Applying {len(manifests)} resources for service {name}...")
+        self.karmada_helper.manifest_applier.apply(manifests, namespace, previous)
+        rendered[name] = manifests
+        return f"Applied {len(manifests)} resources"
+
+    def _get_release(self, name: str) -> Release | None:
+        stmt = select(Release).where(Release.name == name)
+        return self.db_session.scalars(stmt).first()
+
+    def _record_release(
+        self,
+        service: Service,
+        namespace: str,
+        digest: str,
+        manifests: list[dict],
+        status: str = RELEASE_DEPLOYED,
+    ) -> Release:
+        """Records the manifests applied (or staged) for a service (native engine)."""
+        release = self._get_release(service.name)
+        if release is None:
+            release = Release(name=service.name, revision=0)
+            self.db_session.add(release)
+        release.namespace = namespace
+        release.chart = service.artifact_ref
+        release.digest = digest
+        release.manifests = manifests
+        if status == RELEASE_DEPLOYED:
+            release.revision = (release.revision or 0) + 1
+        release.status = status
+        release.updated_at = datetime.now(UTC)
+        return release
+
+    def _helm_uninstall_service(self, name: str, namespace: str) -> str:
+        print(f"Uninstalling service {name}...")
+        # fmt: off
+        args = [
+            "uninstall",
+            name,
+            "--namespace", namespace,
+            "--kubeconfig", self.config["karmada_kubeconfig"],
+        ]
+        # fmt: on
+        result = run_helm(*args, timeout=self._helm_timeout)
+        print(result)
+        return result
+
+    @property
+    def artifact_cache(self) -> ArtifactCache | None:
+        return artifact_cache_from_config(self.config)
+
+    def _resolve_chart(self, artifact_ref: str) -> str:
+        """
+        Returns the chart to pass to helm: the tarball from the artifact
+        cache (pulled on first use), or the reference itself.
+        """
+        cache = self.artifact_cache
+        if cache is None or not artifact_ref.startswith("oci://"):
+            return artifact_ref
+        try:
+            return str(
+                cache.get_chart(
+                    artifact_ref,
+                    plain_http=self.config.get("helm", {}).get("insecure_registry"),
+                    timeout=self._helm_timeout,
+                )
+            )
+        except (subprocess.SubprocessError, OSError) as e:
+            print(f"Warning: could not cache chart {artifact_ref}: {e}")
+            return artifact_ref
+
+    @property
+    def _helm_timeout(self) -> float:
+        return self.config.get("helm", {}).get("timeout_seconds", DEFAULT_TIMEOUT)
+
+    def _apply_services(
+        self, graph: Graph, services: list[Service], command: str
+    ) -> dict[str, OperationResult]:
+        """
+        Installs or upgrades services, skipping those whose chart and values
+        are the ones last applied (see `values_digest`).
+        """
+        operations = {}
+        digests = {}
+        results = {}
+        rendered = {}
+        for service in services:
+            digest = values_digest(service.artifact_ref, service.values_overwrite)
+            if service.applied_digest == digest:
+                print(f"Service {service.name} is up to date, skipping helm {command}.")
+                results[service.name] = OperationResult(service.name, OK, "unchanged")
+                continue
+            digests[service.name] = digest
+            operations[service.name] = self._helm_operation(
+                service, graph.project, command, rendered
+            )
+
+        results.update(self._run_helm_operations(graph, operations))
+        for service in services:
+            if service.name in digests and results[service.name].ok:
+                service.applied_digest = digests[service.name]
+                if service.name in rendered:
+                    self._record_release(
+                        service,
+                        graph.project,
+                        digests[service.name],
+                        rendered[service.name],
+                    )
+        return results
+
+    def _helm_operation(
+        self,
+        service: Service,
+        namespace: str,
+        command: str,
+        rendered: dict | None = None,
+    ):
+        """
+        Returns the install/upgrade of a service, to run on the executor.
+
+        With the native engine, the manifests applied are stored in
+        `rendered` (by service name), to be recorded in the release of the
+        service once the operation succeeded (the session is not shared
+        with the executor threads).
+        """
+        if self.deploy_engine == ENGINE_NATIVE:
+            release = self._get_release(service.name)
+            digest = values_digest(service.artifact_ref, service.values_overwrite)
+            manifests = None
+            if release is not None and release.digest == digest:
+                manifests = release.manifests  # No need to render the chart again
+            previous = []
+            if release is not None and release.status == RELEASE_DEPLOYED:
+                previous = release_resources(release)
+            return functools.partial(
+                self._apply_manifests,
+                service.name,
+                service.artifact_ref,
+                service.values_overwrite,
+                namespace,
+                manifests,
+                previous,
+                rendered if rendered is not None else {},
+            )
+
+        return functools.partial(
+            self._helm_install_artifact,
+            service.name,
+            service.artifact_ref,
+            service.values_overwrite,
+            namespace,
+            command,
+        )
+
+    def _run_helm_operations(
+        self, graph: Graph, operations: dict, reverse: bool = False
+    ) -> dict[str, OperationResult]:
+        """
+        Runs helm operations on the services of a graph: independent services
+        concurrently (up to `helm.max_parallel`), in dependency order.
+        """
+        if not operations:
+            return {}
+        executor = LifecycleExecutor(
+            max_workers=self.config.get("helm", {}).get("max_parallel", 8)
+        )
+        dependencies = service_dependencies(
+            (graph.graph_descriptor or {}).get("services", [])
+        )
+        results = executor.run(
+            operations, dependencies, reverse=reverse, skip_dependents=not reverse
+        )
+        for result in results.values():
+            if not result.ok:
+                print(
+                    f"Helm operation failed for service {result.name}: "
+                    f"{result.error or 'skipped (a dependency failed)'}"
+                )
+        return results
 
     def _create_service_imports(self, services, service_placement):
         service_import_clusters = {s["id"]: [] for s in services}
@@ -0,0 +1,228 @@
+"""
+Database-backed queue of the lifecycle operations of graphs.
+
+Deploying, updating, starting, stopping or removing a graph runs placement,
+Grafana and Prometheus updates and helm operations, which can take minutes.
+The API queues them as jobs instead, and returns immediately; jobs are run by
+the workers of a `JobWorker`, possibly in another process.
+
+The queue only relies on plain SQL, so that it works on SQLite as well as
+PostgreSQL: a job is claimed with a conditional update (`status = 'queued'`)
+that only one worker can win. The jobs of a graph are run one at a time, in
+order: only the oldest unfinished job of each graph can be claimed. Failed
+jobs are retried with an exponential backoff, up to their `max_attempts`.
+"""
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import select, update
+from sqlalchemy.orm.session import Session
+
+from smo_core.models import Job
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+# Lifecycle operations
+DEPLOY = "deploy"
+START = "start"
+STOP = "stop"
+REMOVE = "remove"
+PLACEMENT = "placement"
+UPDATE = "update"
+JOB_KINDS = (DEPLOY, START, STOP, REMOVE, PLACEMENT, UPDATE)
+
+
+def utcnow() -> datetime:
+    """Returns the current (naive) UTC time, as stored in the job table."""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+@dataclass(frozen=True)
+class JobService:
+    """Queues, claims and completes the jobs of graphs."""
+
+    db_session: Session
+
+    def enqueue(
+        self,
+        kind: str,
+        graph_name: str,
+        project: str | None = None,
+        payload: dict | None = None,
+        max_attempts: int = 1,
+    ) -> Job:
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unknown job kind: {kind}")
+        now = utcnow()
+        job = Job(
+            kind=kind,
+            graph_name=graph_name,
+            project=project,
+            payload=payload,
+            status=QUEUED,
+            attempts=0,
+            max_attempts=max(1, max_attempts),
+            created_at=now,
+            available_at=now,
+        )
+        self.db_session.add(job)
+        self.db_session.commit()
+        return job
+
+    def get_job(self, job_id: int) -> Job | None:
+        return self.db_session.get(Job, job_id)
+
+    def list_jobs(self, graph_name: str = "", status: str = "") -> list[Job]:
+        """Returns the jobs, most recent first."""
+        stmt = select(Job)
+        if graph_name:
+            stmt = stmt.where(Job.graph_name == graph_name)
+        if status:
+            stmt = stmt.where(Job.status == status)
+        stmt = stmt.order_by(Job.id.desc())
+        return list(self.db_session.scalars(stmt).all())
+
+    def claim_next(self, worker: str) -> Job | None:
+        """
+        Claims the next job that can run: the oldest unfinished job of its
+        graph, queued and due. Returns None if there is none.
+        """
+        now = utcnow()
+        stmt = (
+            select(Job.id, Job.graph_name, Job.status, Job.available_at)
+            .where(Job.status.in_([QUEUED, RUNNING]))
+            .order_by(Job.id)
+        )
+        seen = set()
+        for job_id, graph_name, status, available_at in self.db_session.execute(
+            stmt
+        ).all():
+            if graph_name in seen:
+                continue  # Waits for the previous job of the graph
+            seen.add(graph_name)
+            if status != QUEUED or available_at > now:
+                continue
+
+            claim = (
+                update(Job)
+                .where(Job.id == job_id, Job.status == QUEUED)
+                .values(
+                    status=RUNNING,
+                    worker=worker,
+                    attempts=Job.attempts + 1,
+                    started_at=now,
+                    heartbeat_at=now,
+                )
+            )
+            claimed = self.db_session.execute(claim).rowcount
+            self.db_session.commit()
+            if claimed:
+                return self.db_session.get(Job, job_id)
+        return None
+
+    def heartbeat(self, job_ids: list[int], progress: dict[int, str]) -> None:
+        """Records that running jobs are still alive, with their progress."""
+        now = utcnow()
+        for job_id in job_ids:
+            values = {"heartbeat_at": now}
+            if job_id in progress:
+                values["progress"] = progress[job_id][:255]
+            self.db_session.execute(
+                update(Job)
+                .where(Job.id == job_id, Job.status == RUNNING)
+                .values(**values)
+            )
+        self.db_session.commit()
+
+    def complete(
+        self, job_id: int, worker: str, result: dict | None = None
+    ) -> Job | None:
+        """
+        Records the success of a job run by `worker`. Returns None, leaving
+        the job unchanged, if it is no longer run by this worker (e.g. it was
+        requeued as stale meanwhile).
+        """
+        stmt = (
+            update(Job)
+            .where(Job.id == job_id, Job.status == RUNNING, Job.worker == worker)
+            .values(
+                status=SUCCEEDED,
+                result=result,
+                error=None,
+                progress="done",
+                finished_at=utcnow(),
+            )
+        )
+        return self._finish(stmt, job_id)
+
+    def fail(
+        self, job_id: int, worker: str, error: str, retry_delay: float = 5.0
+    ) -> Job | None:
+        """
+        Records the failure of a job run by `worker`: it is queued again
+        (after `retry_delay`, doubled at each attempt) if it has attempts
+        left. Returns None, leaving the job unchanged, if it is no longer run
+        by this worker.
+        """
+        job = self._get_or_raise(job_id)
+        values = {"error": error}
+        if job.attempts < job.max_attempts:
+            delay = retry_delay * 2 ** max(0, job.attempts - 1)
+            values |= {
+                "status": QUEUED,
+                "available_at": utcnow() + timedelta(seconds=delay),
+                "progress": f"retrying in {delay:.0f}s",
+            }
+        else:
+            values |= {"status": FAILED, "finished_at": utcnow()}
+        stmt = (
+            update(Job)
+            .where(Job.id == job_id, Job.status == RUNNING, Job.worker == worker)
+            .values(**values)
+        )
+        return self._finish(stmt, job_id)
+
+    def retry(self, job_id: int) -> Job:
+        """Queues a failed job again, for one more attempt."""
+        job = self._get_or_raise(job_id)
+        if job.status != FAILED:
+            raise ValueError(
+                f"Job {job_id} is {job.status}, only failed jobs can be retried"
+            )
+        job.status = QUEUED
+        job.max_attempts = job.attempts + 1
+        job.available_at = utcnow()
+        job.finished_at = None
+        job.progress = None
+        self.db_session.commit()
+        return job
+
+    def requeue_stale(self, timeout: float) -> int:
+        """
+        Queues again the running jobs whose worker stopped sending
+        heartbeats for `timeout` seconds (e.g. after a crash). Returns their
+        number.
+        """
+        deadline = utcnow() - timedelta(seconds=timeout)
+        stmt = select(Job).where(Job.status == RUNNING, Job.heartbeat_at < deadline)
+        stale = list(self.db_session.scalars(stmt).all())
+        for job in stale:
+            print(f"Job {job.id} ({job.kind} {job.graph_name}) lost its worker.")
+            self.fail(job.id, job.worker, f"Worker {job.worker} stopped responding", 0)
+        return len(stale)
+
+    def _finish(self, stmt, job_id: int) -> Job | None:
+        """Runs the conditional update of a running job, like `claim_next`."""
+        updated = self.db_session.execute(stmt).rowcount
+        self.db_session.commit()
+        return self.get_job(job_id) if updated else None
+
+    def _get_or_raise(self, job_id: int) -> Job:
+        job = self.get_job(job_id)
+        if job is None:
+            raise ValueError(f"Job {job_id} not found")
+        return job
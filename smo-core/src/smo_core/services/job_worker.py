@@ -0,0 +1,216 @@
+"""
+Worker pool running the queued lifecycle jobs of graphs (see `JobService`).
+
+Each worker thread claims a job, runs the corresponding `GraphService`
+operation in its own database session, and records the outcome. A separate
+thread sends the heartbeats (and progress) of the running jobs, and queues
+again the jobs of workers that died.
+"""
+
+import functools
+import os
+import socket
+import threading
+import traceback
+from collections.abc import Callable
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from smo_core.helpers import GrafanaHelper, KarmadaHelper, PrometheusHelper
+from smo_core.models import Job
+from smo_core.services.graph_service import GraphService
+from smo_core.services.job_service import (
+    DEPLOY,
+    PLACEMENT,
+    REMOVE,
+    START,
+    STOP,
+    UPDATE,
+    JobService,
+)
+
+
+def _deploy(graph_service: GraphService, job: Job) -> None:
+    graph_service.deploy_graph(job.project, job.payload["descriptor"])
+
+
+def _start(graph_service: GraphService, job: Job) -> None:
+    graph_service.start_graph(job.graph_name)
+
+
+def _stop(graph_service: GraphService, job: Job) -> None:
+    graph_service.stop_graph(job.graph_name)
+
+
+def _remove(graph_service: GraphService, job: Job) -> None:
+    graph_service.remove_graph(job.graph_name)
+
+
+def _placement(graph_service: GraphService, job: Job) -> None:
+    graph_service.trigger_placement(job.graph_name)
+
+
+def _update(graph_service: GraphService, job: Job) -> None:
+    graph_service.update_graph(job.graph_name, job.payload["descriptor"])
+
+
+JOB_HANDLERS: dict[str, Callable[[GraphService, Job], None]] = {
+    DEPLOY: _deploy,
+    START: _start,
+    STOP: _stop,
+    REMOVE: _remove,
+    PLACEMENT: _placement,
+    UPDATE: _update,
+}
+
+
+class JobWorker:
+    """Runs the queued jobs on a pool of threads."""
+
+    def __init__(
+        self,
+        karmada_helper: KarmadaHelper,
+        grafana_helper: GrafanaHelper,
+        prom_helper: PrometheusHelper,
+        config: dict,
+        session_factory: Callable[[], Session],
+        workers: int = 4,
+        poll_interval: float = 1.0,
+        retry_delay: float = 5.0,
+        heartbeat_interval: float = 10.0,
+        stale_timeout: float = 300.0,
+        name: str | None = None,
+    ):
+        self.karmada_helper = karmada_helper
+        self.grafana_helper = grafana_helper
+        self.prom_helper = prom_helper
+        self.config = config
+        self.session_factory = session_factory
+        self.workers = max(1, workers)
+        self.poll_interval = poll_interval
+        self.retry_delay = retry_delay
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_timeout = stale_timeout
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}"
+
+        # Running jobs of this process, with their last progress message
+        self._running: dict[int, str | None] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    def start(self) -> None:
+        """Starts the worker threads, and the heartbeat thread."""
+        if self._threads:
+            return
+        self._stop_event.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(
+                target=self.run,
+                args=(f"{self.name}/{i}",),
+                name=f"smo-job-worker-{i}",
+                daemon=True,
+            )
+            self._threads.append(thread)
+        self._threads.append(
+            threading.Thread(
+                target=self._heartbeat_loop, name="smo-job-heartbeat", daemon=True
+            )
+        )
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stops the threads, after the jobs being run complete."""
+        self._stop_event.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def run(self, worker: str) -> None:
+        """Runs jobs until the worker is stopped."""
+        while not self._stop_event.is_set():
+            try:
+                ran = self.run_once(worker)
+            except SQLAlchemyError as e:
+                print(f"Warning: job worker {worker} failed: {e}")
+                ran = False
+            if not ran:
+                self._stop_event.wait(self.poll_interval)
+
+    def run_once(self, worker: str) -> bool:
+        """Claims and runs one job. Returns False if no job was ready."""
+        with self.session_factory() as session:
+            job = JobService(session).claim_next(worker)
+            if job is None:
+                return False
+            job_id, kind, graph_name = job.id, job.kind, job.graph_name
+            session.expunge(job)
+
+        print(f"Running job {job_id}: {kind} {graph_name} (worker {worker})")
+        self._set_progress(job_id, f"running {kind}")
+        error = None
+        try:
+            with self.session_factory() as session:
+                graph_service = GraphService(
+                    db_session=session,
+                    karmada_helper=self.karmada_helper,
+                    grafana_helper=self.grafana_helper,
+                    prom_helper=self.prom_helper,
+                    config=self.config,
+                    on_progress=functools.partial(self._set_progress, job_id),
+                )
+                try:
+                    JOB_HANDLERS[kind](graph_service, job)
+                except Exception:
+                    session.rollback()
+                    raise
+        except Exception as e:  # noqa: BLE001
+            # A job can fail in any of the helpers (helm, Karmada, Grafana,
+            # Prometheus, DB): whatever it is, it's the outcome of the job.
+            traceback.print_exc()
+            error = str(e) or type(e).__name__
+        finally:
+            with self._lock:
+                self._running.pop(job_id, None)
+
+        with self.session_factory() as session:
+            jobs = JobService(session)
+            if error is None:
+                job = jobs.complete(job_id, worker)
+                if job is not None:
+                    print(f"Job {job_id} succeeded.")
+            else:
+                job = jobs.fail(job_id, worker, error, self.retry_delay)
+                if job is not None:
+                    print(f"Job {job_id} failed ({job.status}): {error}")
+            if job is None:
+                print(
+                    f"Warning: job {job_id} was requeued while worker {worker} "
+                    "ran it, its outcome is ignored."
+                )
+        return True
+
+    def _set_progress(self, job_id: int, message: str | None) -> None:
+        with self._lock:
+            self._running[job_id] = message
+
+    def _heartbeat_loop(self) -> None:
+        while not self._stop_event.wait(self.heartbeat_interval):
+            try:
+                self.heartbeat()
+            except SQLAlchemyError as e:
+                print(f"Warning: job heartbeat failed: {e}")
+
+    def heartbeat(self) -> None:
+        """Sends the heartbeats of the running jobs, and requeues the stale ones."""
+        with self._lock:
+            running = dict(self._running)
+        with self.session_factory() as session:
+            jobs = JobService(session)
+            jobs.heartbeat(
+                list(running),
+                {job_id: msg for job_id, msg in running.items() if msg},
+            )
+            jobs.requeue_stale(self.stale_timeout)
@@ -0,0 +1,205 @@
+"""
+Multi-target scaler daemon.
+
+Runs the threshold scaling policies of many deployments from a single
+process. Policies are scheduled on a timer heap, each with its own poll
+interval and cooldown period. At each tick, all the policies that are due
+are evaluated together: request rates are read with a single Prometheus
+query, replica counts with one list call per namespace, and the resulting
+scaling actions are applied concurrently on a bounded worker pool.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import yaml
+from kubernetes.client.rest import ApiException
+from sqlalchemy import select
+from sqlalchemy.orm.session import Session
+from urllib3.exceptions import HTTPError
+
+from smo_core.helpers import KarmadaHelper, PrometheusHelper
+from smo_core.models import ScalingPolicy
+from smo_core.services.scaler_service import decide_threshold_action
+
+
+def load_policies_from_yaml(path: Path | str) -> list[ScalingPolicy]:
+    """
+    Loads scaling policies from a YAML file of the form::
+
+        policies:
+          - target_deployment: noise-reduction
+            target_namespace: default
+            up_threshold: 10
+            down_threshold: 2
+            up_replicas: 3
+            down_replicas: 1
+            poll_interval: 15
+            cooldown_period: 60
+    """
+    with Path(path).open() as f:
+        data = yaml.safe_load(f) or {}
+    return [ScalingPolicy.from_dict(d) for d in data.get("policies", [])]
+
+
+def load_policies_from_db(db_session: Session) -> list[ScalingPolicy]:
+    """Loads the enabled scaling policies from the database."""
+    stmt = select(ScalingPolicy).where(ScalingPolicy.enabled.is_(True))
+    return list(db_session.scalars(stmt).all())
+
+
+class ScalerDaemon:
+    """Schedules and runs the threshold scaling policies of many deployments."""
+
+    def __init__(
+        self,
+        karmada: KarmadaHelper,
+        prometheus: PrometheusHelper,
+        policies: Iterable[ScalingPolicy],
+        max_workers: int = 8,
+        clock: Callable[[], float] = time.monotonic,
+        on_result: Callable[[ScalingPolicy, dict], None] | None = None,
+    ):
+        self.karmada = karmada
+        self.prometheus = prometheus
+        self.max_workers = max_workers
+        self.clock = clock
+        self.on_result = on_result
+
+        self.policies = {p.key: p for p in policies if p.enabled}
+        self.last_scale_time: dict[tuple[str, str], float] = {}
+
+        # Heap of (next run time, sequence number, policy key)
+        self._counter = itertools.count()
+        self._heap = []
+        now = self.clock()
+        for key in self.policies:
+            self._schedule(key, now)
+
+    def run(self, stop_event: threading.Event) -> None:
+        """
+        Runs the scheduling loop until `stop_event` is set.
+
+        Replica counts are served by the watch-fed deployment cache of the
+        Karmada helper while the daemon runs.
+        """
+        self.karmada.start_deployment_cache()
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                while not stop_event.is_set():
+                    self.tick(executor)
+                    delay = self.next_run_time() - self.clock()
+                    if delay > 0:
+                        stop_event.wait(delay)
+        finally:
+            self.karmada.stop_deployment_cache()
+
+    def next_run_time(self) -> float:
+        """Returns the time at which the next policy is due."""
+        if not self._heap:
+            return self.clock() + 1
+        return self._heap[0][0]
+
+    def tick(self, executor: ThreadPoolExecutor) -> dict:
+        """
+        Evaluates all the policies that are due, and reschedules them.
+
+        Returns a dict mapping the key of each evaluated policy to the
+        result of its scaling decision.
+        """
+        now = self.clock()
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            _, _, key = heapq.heappop(self._heap)
+            due.append(self.policies[key])
+        if not due:
+            return {}
+
+        for policy in due:
+            self._schedule(policy.key, now)
+
+        active = [p for p in due if not self._in_cooldown(p, now)]
+        results = {
+            p.key: {"action": "none", "reason": "In cooldown period."}
+            for p in due
+            if p not in active
+        }
+        if not active:
+            return results
+
+        # Batched metric reads
+        request_rates = self.prometheus.get_request_rates_by_job(
+            [p.target_deployment for p in active]
+        )
+        replicas = self._read_replicas({p.target_namespace for p in active})
+
+        decisions = []
+        for policy in active:
+            current = replicas.get(policy.key)
+            if current is None:
+                results[policy.key] = {
+                    "action": "error",
+                    "reason": f"Deployment {policy.target_deployment} not found.",
+                }
+                continue
+            result = decide_threshold_action(
+                current,
+                request_rates.get(policy.target_deployment),
+                policy.up_threshold,
+                policy.down_threshold,
+                policy.up_replicas,
+                policy.down_replicas,
+            )
+            results[policy.key] = result
+            if result["action"] in ("scale_up", "scale_down"):
+                decisions.append((policy, result))
+
+        # Batched, concurrent actuation
+        futures = {
+            executor.submit(
+                self.karmada.scale_deployment,
+                policy.target_deployment,
+                result["new_replicas"],
+                namespace=policy.target_namespace,
+            ): (policy, result)
+            for policy, result in decisions
+        }
+        for future, (policy, result) in futures.items():
+            try:
+                future.result()
+                self.last_scale_time[policy.key] = self.clock()
+            except (ApiException, HTTPError, OSError) as e:
+                result["action"] = "error"
+                result["reason"] = f"Scaling failed: {e}"
+
+        if self.on_result:
+            for policy in due:
+                self.on_result(policy, results[policy.key])
+        return results
+
+    def _schedule(self, key: tuple[str, str], now: float) -> None:
+        policy = self.policies[key]
+        heapq.heappush(
+            self._heap, (now + policy.poll_interval, next(self._counter), key)
+        )
+
+    def _in_cooldown(self, policy: ScalingPolicy, now: float) -> bool:
+        last = self.last_scale_time.get(policy.key)
+        return last is not None and now - last < policy.cooldown_period
+
+    def _read_replicas(self, namespaces: set[str]) -> dict:
+        replicas = {}
+        for namespace in namespaces:
+            try:
+                by_name = self.karmada.get_desired_replicas_in_namespace(namespace)
+            except (ApiException, HTTPError, OSError) as e:
+                print(f"Warning: could not list deployments in {namespace}: {e}")
+                continue
+            for name, count in by_name.items():
+                replicas[(namespace, name)] = count
+        return replicas
@@ -1,6 +1,8 @@
+import math
 from dataclasses import dataclass
 
 from smo_core.helpers import KarmadaHelper, PrometheusHelper
+from smo_core.utils.queueing import replicas_for_rate
 
 
 @dataclass(frozen=True)
@@ -27,47 +29,121 @@ class ScalerService:
             A dictionary describing the action taken, e.g.,
             {'action': 'scale_up', 'new_replicas': 3, 'reason': 'RPS > threshold'}
         """
-        # Get current state from Kubernetes
-        deployment = self.karmada.v1_api_client.read_namespaced_deployment(
+        # Get current state from Kubernetes (or the local deployment cache)
+        current_replicas = self.karmada.get_desired_replicas(
             target_deployment, target_namespace
         )
-        current_replicas = deployment.spec.replicas
 
         # Get metric from Prometheus
         request_rate = self.prometheus.get_request_rate_by_job(target_deployment)
 
-        if request_rate is None:
+        result = decide_threshold_action(
+            current_replicas,
+            request_rate,
+            scale_up_threshold,
+            scale_down_threshold,
+            scale_up_replicas,
+            scale_down_replicas,
+        )
+        if result["action"] in ("scale_up", "scale_down"):
+            self.karmada.scale_deployment(target_deployment, result["new_replicas"])
+        return result
+
+    def run_queueing_scaler_iteration(
+        self,
+        target_deployment: str,
+        target_namespace: str,
+        capacity_table: list[float],
+        min_replicas: int = 1,
+    ) -> dict:
+        """
+        Performs a single iteration of queueing-model based scaling.
+
+        The deployment is scaled to the minimum number of replicas that meets
+        its latency target at the current request rate, according to a
+        capacity table precomputed with `smo_core.utils.queueing.capacity_table`.
+        If the table is not large enough for the current rate, the deployment
+        is scaled to the largest replica count of the table.
+
+        Returns:
+            A dictionary describing the action taken, with the same shape as
+            `run_threshold_scaler_iteration`.
+        """
+        current_replicas = self.karmada.get_desired_replicas(
+            target_deployment, target_namespace
+        )
+
+        request_rate = self.prometheus.get_request_rate_by_job(target_deployment)
+        if request_rate is None or math.isnan(request_rate):
             return {
                 "action": "none",
                 "reason": "Could not retrieve metrics from Prometheus.",
                 "current_replicas": current_replicas,
             }
 
-        # --- Scaling Decision Logic ---
-        if request_rate > scale_up_threshold and current_replicas < scale_up_replicas:
-            self.karmada.scale_deployment(target_deployment, scale_up_replicas)
-            return {
-                "action": "scale_up",
-                "new_replicas": scale_up_replicas,
-                "reason": f"Request rate {request_rate:.2f} RPS exceeded scale-up threshold of {scale_up_threshold:.2f} RPS.",
-                "current_replicas": current_replicas,
-            }
+        needed = replicas_for_rate(capacity_table, request_rate) or len(capacity_table)
+        needed = max(needed, min_replicas)
 
-        if (
-            request_rate < scale_down_threshold
-            and current_replicas > scale_down_replicas
-        ):
-            self.karmada.scale_deployment(target_deployment, scale_down_replicas)
+        if needed == current_replicas:
             return {
-                "action": "scale_down",
-                "new_replicas": scale_down_replicas,
-                "reason": f"Request rate {request_rate:.2f} RPS is below scale-down threshold of {scale_down_threshold:.2f} RPS.",
+                "action": "none",
+                "reason": "Deployment already meets the latency target.",
                 "current_replicas": current_replicas,
+                "request_rate": request_rate,
             }
 
+        self.karmada.scale_deployment(target_deployment, needed)
+        action = "scale_up" if needed > current_replicas else "scale_down"
         return {
-            "action": "none",
-            "reason": "Request rate is within thresholds or deployment is already at target replicas.",
+            "action": action,
+            "new_replicas": needed,
+            "reason": f"{needed} replicas needed to meet the latency target at {request_rate:.2f} RPS.",
             "current_replicas": current_replicas,
             "request_rate": request_rate,
         }
+
+
+def decide_threshold_action(
+    current_replicas: int,
+    request_rate: float | None,
+    scale_up_threshold: float,
+    scale_down_threshold: float,
+    scale_up_replicas: int,
+    scale_down_replicas: int,
+) -> dict:
+    """
+    Threshold-based scaling decision, without side effects.
+
+    Returns:
+        A dictionary describing the action to take, e.g.,
+        {'action': 'scale_up', 'new_replicas': 3, 'reason': 'RPS > threshold'}
+    """
+    if request_rate is None:
+        return {
+            "action": "none",
+            "reason": "Could not retrieve metrics from Prometheus.",
+            "current_replicas": current_replicas,
+        }
+
+    if request_rate > scale_up_threshold and current_replicas < scale_up_replicas:
+        return {
+            "action": "scale_up",
+            "new_replicas": scale_up_replicas,
+            "reason": f"Request rate {request_rate:.2f} RPS exceeded scale-up threshold of {scale_up_threshold:.2f} RPS.",
+            "current_replicas": current_replicas,
+        }
+
+    if request_rate < scale_down_threshold and current_replicas > scale_down_replicas:
+        return {
+            "action": "scale_down",
+            "new_replicas": scale_down_replicas,
+            "reason": f"Request rate {request_rate:.2f} RPS is below scale-down threshold of {scale_down_threshold:.2f} RPS.",
+            "current_replicas": current_replicas,
+        }
+
+    return {
+        "action": "none",
+        "reason": "Request rate is within thresholds or deployment is already at target replicas.",
+        "current_replicas": current_replicas,
+        "request_rate": request_rate,
+    }
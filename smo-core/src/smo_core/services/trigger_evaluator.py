@@ -0,0 +1,197 @@
+"""
+In-process evaluation of the triggers of conditional services.
+
+By default, the trigger condition (`promQuery`) of a conditional service is
+installed as a Prometheus alert: the service is deployed when Alertmanager
+delivers the alert to `/alerts`, which means a PrometheusRule update and a
+Prometheus reload on the deploy path, and the latency of the rule
+evaluation, Alertmanager grouping and webhook delivery on the trigger path.
+
+With `triggers.mode: smo`, the evaluator below replaces this chain: it
+periodically evaluates the conditions of all the pending services with a
+few batched queries, applies their `gracePeriod` itself (like the `for` of
+an alert) and deploys the services directly.
+"""
+
+import re
+import threading
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from smo_core.helpers import GrafanaHelper, KarmadaHelper, PrometheusHelper
+from smo_core.helpers.prometheus_helper import PrometheusQueryError
+from smo_core.services.graph_service import GraphService
+from smo_core.utils.lifecycle import OPERATION_ERRORS
+
+# Label added to the result of each condition, to tell them apart
+SERVICE_LABEL = "smo_service"
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h|d|w|y)")
+_DURATION_UNITS = {
+    "ms": 0.001,
+    "s": 1,
+    "m": 60,
+    "h": 3600,
+    "d": 86400,
+    "w": 604800,
+    "y": 31536000,
+}
+
+
+def parse_duration(duration: str | float | None) -> float:
+    """Returns the number of seconds of a Prometheus duration (e.g. "1m30s")."""
+    if duration is None or duration == "":
+        return 0.0
+    if isinstance(duration, int | float):
+        return float(duration)
+    text = duration.strip()
+    matches = list(_DURATION_RE.finditer(text))
+    if not matches or "".join(m.group(0) for m in matches) != text:
+        raise ValueError(f"Invalid duration: {duration!r}")
+    return sum(float(m.group(1)) * _DURATION_UNITS[m.group(2)] for m in matches)
+
+
+def build_trigger_query(conditions: dict[str, str]) -> str:
+    """
+    Combines the conditions of several services in a single query: each one
+    is labeled with the name of its service, and the results are joined with
+    `or` (the distinct labels keep all of them).
+    """
+    return " or ".join(
+        f'label_replace(({expr}), "{SERVICE_LABEL}", "{name}", "", "")'
+        for name, expr in conditions.items()
+    )
+
+
+class TriggerEvaluator:
+    """Deploys the pending conditional services whose condition holds."""
+
+    def __init__(
+        self,
+        karmada_helper: KarmadaHelper,
+        grafana_helper: GrafanaHelper,
+        prom_helper: PrometheusHelper,
+        config: dict,
+        session_factory: Callable[[], Session],
+        interval: float = 5.0,
+        batch_size: int = 50,
+        clock: Callable[[], float] = time.monotonic,
+        on_trigger: Callable[[str, float], None] | None = None,
+    ):
+        self.karmada_helper = karmada_helper
+        self.grafana_helper = grafana_helper
+        self.prom_helper = prom_helper
+        self.config = config
+        self.session_factory = session_factory
+        self.interval = interval
+        self.batch_size = batch_size
+        self.clock = clock
+        self.on_trigger = on_trigger
+
+        # Time at which the condition of each service started to hold
+        self.active_since: dict[str, float] = {}
+
+    def run(self, stop_event: threading.Event) -> None:
+        """Evaluates the triggers every `interval` seconds until `stop_event` is set."""
+        while not stop_event.is_set():
+            try:
+                self.evaluate()
+            except (PrometheusQueryError, SQLAlchemyError, *OPERATION_ERRORS) as e:
+                print(f"Warning: trigger evaluation failed: {e}")
+            stop_event.wait(self.interval)
+
+    def evaluate(self) -> list[str]:
+        """
+        Evaluates the conditions of the pending services, and deploys those
+        that have held for their grace period. Returns the deployed services.
+        """
+        with self.session_factory() as session:
+            graph_service = self._graph_service(session)
+            pending = {s.name: s.alert for s in graph_service.get_pending_services()}
+
+            now = self.clock()
+            # If Prometheus can't be queried, the evaluation is skipped (and
+            # the grace periods in progress are kept)
+            firing, failed = self.firing_services(
+                {n: a["expr"] for n, a in pending.items()}
+            )
+
+            # Forget the services whose condition no longer holds (or that
+            # are no longer pending)
+            for name in list(self.active_since):
+                if name not in pending or (name not in firing and name not in failed):
+                    del self.active_since[name]
+
+            due = {}
+            for name in firing & pending.keys():
+                since = self.active_since.setdefault(name, now)
+                grace_period = parse_duration(pending[name].get("for"))
+                if now - since >= grace_period:
+                    # The trigger fired at the end of the grace period
+                    late = now - since - grace_period
+                    due[name] = datetime.now(UTC) - timedelta(seconds=late)
+            if not due:
+                return []
+
+            deployed = graph_service.deploy_triggered_services(
+                sorted(due), triggered_at=due
+            )
+
+        for name in deployed:
+            elapsed = now - self.active_since.pop(name, now)
+            print(f"Trigger of service '{name}' fired (held for {elapsed:.1f}s).")
+            if self.on_trigger is not None:
+                self.on_trigger(name, elapsed)
+        return deployed
+
+    def firing_services(self, conditions: dict[str, str]) -> tuple[set[str], set[str]]:
+        """
+        Returns the services whose condition currently returns a result, and
+        those whose condition couldn't be evaluated.
+
+        A batch rejected by Prometheus (e.g. because one of its conditions is
+        not valid PromQL) is evaluated again one condition at a time. Raises
+        `PrometheusQueryError` if Prometheus can't be queried at all.
+        """
+        names = list(conditions)
+        firing = set()
+        failed = set()
+        for i in range(0, len(names), self.batch_size):
+            batch = {name: conditions[name] for name in names[i : i + self.batch_size]}
+            try:
+                firing |= self._query_firing(batch)
+            except PrometheusQueryError as e:
+                if not e.bad_query:
+                    raise
+                for name, expr in batch.items():
+                    try:
+                        firing |= self._query_firing({name: expr})
+                    except PrometheusQueryError as error:
+                        if not error.bad_query:
+                            raise
+                        print(
+                            f"Warning: could not evaluate trigger of '{name}': {error}"
+                        )
+                        failed.add(name)
+        return firing, failed
+
+    def _query_firing(self, conditions: dict[str, str]) -> set[str]:
+        results = self.prom_helper.query_vector(
+            build_trigger_query(conditions), strict=True
+        )
+        return {
+            labels[SERVICE_LABEL] for labels, _ in results if SERVICE_LABEL in labels
+        }
+
+    def _graph_service(self, session: Session) -> GraphService:
+        return GraphService(
+            db_session=session,
+            karmada_helper=self.karmada_helper,
+            grafana_helper=self.grafana_helper,
+            prom_helper=self.prom_helper,
+            config=self.config,
+        )
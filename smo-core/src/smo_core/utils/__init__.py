@@ -1,16 +1,29 @@
 # Order is important because of circular imports
 # ruff: noqa: E402 - Module level import not at top of file
 
-from .external_commands import run_hdarctl, run_helm
+from .external_commands import (
+    CommandResult,
+    run_command_async,
+    run_hdarctl,
+    run_hdarctl_async,
+    run_helm,
+)
 
 assert run_hdarctl and run_helm  # Ensure these are imported correctly
 
-from .artifacts import get_graph_from_artifact
+from .artifact_cache import ArtifactCache, artifact_cache_from_config
+from .artifacts import get_graph_from_artifact, get_graph_from_artifact_async
 from .formatters import format_memory
 
 __all__ = [
+    "ArtifactCache",
+    "CommandResult",
+    "artifact_cache_from_config",
     "format_memory",
     "get_graph_from_artifact",
+    "get_graph_from_artifact_async",
+    "run_command_async",
     "run_helm",
     "run_hdarctl",
+    "run_hdarctl_async",
 ]
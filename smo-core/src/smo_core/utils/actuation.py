@@ -0,0 +1,151 @@
+"""
+Diff-and-coalesce actuator for deployment scaling.
+
+The scaling loop computes the desired replicas of every managed service at
+each tick, but most of the time few (or none) of them change. The actuator
+keeps track of the last observed replicas of each deployment and only sends
+the patches that actually change something, rate-limits them, and applies
+the remaining ones concurrently on a bounded worker pool.
+
+Writes that are rate-limited are not lost: the latest desired value of each
+deployment is kept and retried at the next `apply` (so that successive
+decisions for the same deployment are coalesced into a single patch).
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from kubernetes.client.rest import ApiException
+from urllib3.exceptions import HTTPError
+
+from smo_core.helpers import KarmadaHelper
+
+SCALED = "scaled"
+UNCHANGED = "unchanged"
+RATE_LIMITED = "rate_limited"
+FAILED = "failed"
+
+
+class ScalingActuator:
+    """Applies desired replica counts to deployments, skipping no-op patches."""
+
+    def __init__(
+        self,
+        karmada_helper: KarmadaHelper,
+        max_workers: int = 4,
+        min_interval: float = 0.0,
+        max_writes_per_second: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            karmada_helper: Helper used to patch the deployments.
+            max_workers: Maximum number of concurrent patch requests.
+            min_interval: Minimum delay (seconds) between two patches of the
+                same deployment.
+            max_writes_per_second: Global write budget (token bucket), or None
+                for no global limit.
+            clock: Time source, for testing.
+        """
+        self.karmada_helper = karmada_helper
+        self.max_workers = max_workers
+        self.min_interval = min_interval
+        self.max_writes_per_second = max_writes_per_second
+        self.clock = clock
+
+        self.observed: dict[str, int] = {}
+        self.pending: dict[str, int] = {}
+        self.last_write: dict[str, float] = {}
+
+        self._tokens = max_writes_per_second or 0.0
+        self._tokens_updated = clock()
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def observe(self, name: str, replicas: int | None) -> None:
+        """Records the replicas of a deployment as read from the cluster."""
+        if replicas is not None:
+            self.observed[name] = replicas
+
+    def apply(self, desired: dict[str, int]) -> dict[str, str]:
+        """
+        Scales the deployments whose desired replicas differ from the observed
+        ones.
+
+        Returns a dict mapping each deployment name (including previously
+        rate-limited ones) to one of `scaled`, `unchanged`, `rate_limited`
+        or `failed`.
+        """
+        with self._lock:
+            self.pending.update(desired)
+            to_write, results = self._select_writes()
+
+        if to_write:
+            futures = {
+                name: self._get_executor().submit(
+                    self.karmada_helper.scale_deployment, name, replicas
+                )
+                for name, replicas in to_write.items()
+            }
+            for name, future in futures.items():
+                try:
+                    future.result()
+                    results[name] = SCALED
+                    with self._lock:
+                        self.observed[name] = to_write[name]
+                except (ApiException, HTTPError, OSError) as e:
+                    print(f"Failed to scale {name} to {to_write[name]} replicas: {e}")
+                    results[name] = FAILED
+                    with self._lock:
+                        # Keep it for the next round unless superseded
+                        self.pending.setdefault(name, to_write[name])
+
+        return results
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _select_writes(self) -> tuple[dict[str, int], dict[str, str]]:
+        now = self.clock()
+        self._refill_tokens(now)
+
+        to_write = {}
+        results = {}
+        for name, replicas in list(self.pending.items()):
+            if self.observed.get(name) == replicas:
+                results[name] = UNCHANGED
+                del self.pending[name]
+                continue
+
+            last = self.last_write.get(name)
+            too_soon = last is not None and now - last < self.min_interval
+            no_budget = self.max_writes_per_second is not None and self._tokens < 1
+            if too_soon or no_budget:
+                results[name] = RATE_LIMITED
+                continue
+
+            if self.max_writes_per_second is not None:
+                self._tokens -= 1
+            self.last_write[name] = now
+            to_write[name] = replicas
+            del self.pending[name]
+        return to_write, results
+
+    def _refill_tokens(self, now: float) -> None:
+        if self.max_writes_per_second is None:
+            return
+        elapsed = now - self._tokens_updated
+        self._tokens = min(
+            self.max_writes_per_second,
+            self._tokens + elapsed * self.max_writes_per_second,
+        )
+        self._tokens_updated = now
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._executor
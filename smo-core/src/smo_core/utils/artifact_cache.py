@@ -0,0 +1,306 @@
+"""
+On-disk cache of the Helm charts and HDAG descriptors pulled from registries.
+
+Every helm install/upgrade of a service used to pull its chart from the OCI
+registry again, and every graph deployment from an artifact ran
+`hdarctl pull` into a fresh temporary directory. The cache keeps the pulled
+charts (as tarballs) and descriptors (parsed, as JSON) in a content-addressed
+blob store: each reference maps to the sha256 digest of its content, so
+references with the same content share a blob.
+
+References pinned to a digest (`...@sha256:...`) never change and are kept
+until evicted. References to a tag are pulled again once their entry is
+older than `tag_ttl`. When the blobs exceed `max_bytes`, the least recently
+used ones are evicted.
+
+Several processes can share a cache directory: the last use of a blob is
+its modification time (touched on each hit, without rewriting the index),
+and the index is merged with the one on disk, under a file lock, when it is
+written.
+"""
+
+import contextlib
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import yaml
+
+from .external_commands import DEFAULT_TIMEOUT, run_hdarctl, run_helm
+
+DEFAULT_MAX_BYTES = 2 * 1024**3
+DEFAULT_TAG_TTL = 3600.0
+
+CHART = "chart"
+DESCRIPTOR = "descriptor"
+
+
+def load_descriptor_from_dir(dirpath: str | Path) -> dict:
+    """Loads the (first) YAML descriptor found in a pulled artifact."""
+    for yaml_file_path in Path(dirpath).rglob("*.yml"):
+        with open(yaml_file_path) as yaml_file:
+            return yaml.safe_load(yaml_file)
+
+    for yaml_file_path in Path(dirpath).rglob("*.yaml"):
+        with open(yaml_file_path) as yaml_file:
+            return yaml.safe_load(yaml_file)
+
+    raise FileNotFoundError("No YAML descriptor found in artifact.")
+
+
+def is_pinned(ref: str) -> bool:
+    """Returns True if the reference designates immutable content (a digest)."""
+    return "@sha256:" in ref
+
+
+class ArtifactCache:
+    """Content-addressed cache of charts and descriptors, with LRU eviction."""
+
+    def __init__(
+        self,
+        root: str | Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        tag_ttl: float = DEFAULT_TAG_TTL,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.root = Path(root).expanduser()
+        self.blobs_dir = self.root / "blobs"
+        self.index_path = self.root / "index.json"
+        self.max_bytes = max_bytes
+        self.tag_ttl = tag_ttl
+        self.clock = clock
+
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        # "<kind>:<ref>" -> {digest, suffix, size, fetched_at}
+        self.index: dict[str, dict] = self._load_index()
+        # Entries added (or removed: None) since the index was last written
+        self._changes: dict[str, dict | None] = {}
+        # Parsed descriptors, by digest
+        self._descriptors: dict[str, dict] = {}
+        self._lock = threading.RLock()
+
+    # --- Charts ---
+
+    def get_chart(
+        self, ref: str, plain_http: bool = False, timeout: float = DEFAULT_TIMEOUT
+    ) -> Path:
+        """Returns the path of the chart tarball of a reference, pulling it if needed."""
+        with self._lock:
+            entry = self._lookup(CHART, ref)
+            if entry is not None:
+                return self._blob_path(entry)
+
+        with tempfile.TemporaryDirectory(dir=self.root) as tmpdir:
+            args = ["pull", ref, "--destination", tmpdir]
+            if plain_http:
+                args.append("--plain-http")
+            run_helm(*args, timeout=timeout)
+            tarball = next(Path(tmpdir).glob("*.tgz"), None)
+            if tarball is None:
+                raise FileNotFoundError(f"helm pull didn't produce a chart for {ref}")
+            with self._lock:
+                return self._store(CHART, ref, tarball.read_bytes(), ".tgz")
+
+    # --- Descriptors ---
+
+    def get_descriptor(self, ref: str, timeout: float = DEFAULT_TIMEOUT) -> dict:
+        """Returns the descriptor of an HDAG artifact, pulling it if needed."""
+        descriptor = self.lookup_descriptor(ref)
+        if descriptor is not None:
+            return descriptor
+
+        with tempfile.TemporaryDirectory(dir=self.root) as tmpdir:
+            print(f"Pulling artifact {ref}...")
+            print(
+                run_hdarctl(
+                    "pull", ref, "--untar", "--destination", tmpdir, timeout=timeout
+                )
+            )
+            descriptor = load_descriptor_from_dir(tmpdir)
+        self.put_descriptor(ref, descriptor)
+        return descriptor
+
+    def lookup_descriptor(self, ref: str) -> dict | None:
+        """Returns the cached descriptor of an artifact, or None."""
+        with self._lock:
+            entry = self._lookup(DESCRIPTOR, ref)
+            if entry is None:
+                return None
+            digest = entry["digest"]
+            if digest not in self._descriptors:
+                with self._blob_path(entry).open() as f:
+                    self._descriptors[digest] = json.load(f)
+            return self._descriptors[digest]
+
+    def put_descriptor(self, ref: str, descriptor: dict) -> None:
+        data = json.dumps(descriptor, sort_keys=True).encode()
+        with self._lock:
+            self._store(DESCRIPTOR, ref, data, ".json")
+            self._descriptors[hashlib.sha256(data).hexdigest()] = descriptor
+
+    # --- Maintenance ---
+
+    @property
+    def size(self) -> int:
+        """Total size (bytes) of the cached blobs."""
+        return sum(size for size, _ in self._blobs().values())
+
+    def clear(self) -> None:
+        with self._lock, self._index_lock():
+            for path in self.blobs_dir.iterdir():
+                path.unlink()
+            self.index.clear()
+            self._changes.clear()
+            self._descriptors.clear()
+            self._write_index({})
+
+    # --- Internals ---
+
+    def _lookup(self, kind: str, ref: str) -> dict | None:
+        key = f"{kind}:{ref}"
+        if key not in self.index:
+            # It may have been pulled by another process since
+            self.index = {**self._load_index(), **self.index}
+        entry = self.index.get(key)
+        if entry is None:
+            return None
+        now = self.clock()
+        if not is_pinned(ref) and now - entry["fetched_at"] > self.tag_ttl:
+            return None  # The tag may have moved
+        try:
+            os.utime(self._blob_path(entry), (now, now))
+        except FileNotFoundError:
+            return None
+        return entry
+
+    def _store(self, kind: str, ref: str, data: bytes, suffix: str) -> Path:
+        digest = hashlib.sha256(data).hexdigest()
+        now = self.clock()
+        entry = {
+            "digest": digest,
+            "suffix": suffix,
+            "size": len(data),
+            "fetched_at": now,
+        }
+        path = self._blob_path(entry)
+        if not path.exists():
+            # Write then rename, so that readers never see a partial blob
+            fd, tmp_path = tempfile.mkstemp(dir=self.blobs_dir)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        os.utime(path, (now, now))
+        key = f"{kind}:{ref}"
+        self.index[key] = entry
+        self._changes[key] = entry
+        self._evict(keep=path.name)
+        self._save_index()
+        return path
+
+    def _blobs(self) -> dict[str, tuple[int, float]]:
+        """Returns the size and last use of each blob (shared by several refs)."""
+        blobs = {}
+        for entry in self.index.values():
+            name = entry["digest"] + entry["suffix"]
+            if name in blobs:
+                continue
+            try:
+                last_used = (self.blobs_dir / name).stat().st_mtime
+            except FileNotFoundError:
+                continue
+            blobs[name] = (entry["size"], last_used)
+        return blobs
+
+    def _evict(self, keep: str) -> None:
+        blobs = self._blobs()
+        total = sum(size for size, _ in blobs.values())
+        for name, (size, _) in sorted(blobs.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            (self.blobs_dir / name).unlink(missing_ok=True)
+            for key, entry in list(self.index.items()):
+                if entry["digest"] + entry["suffix"] == name:
+                    del self.index[key]
+                    self._changes[key] = None
+            self._descriptors.pop(name.removesuffix(".json"), None)
+            total -= size
+
+    def _blob_path(self, entry: dict) -> Path:
+        return self.blobs_dir / (entry["digest"] + entry["suffix"])
+
+    def _load_index(self) -> dict:
+        try:
+            with self.index_path.open() as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save_index(self) -> None:
+        """
+        Writes the entries changed since the last write, merged with the
+        index on disk (which other processes may have updated meanwhile).
+        """
+        with self._index_lock():
+            index = self._load_index()
+            for key, entry in self._changes.items():
+                if entry is None:
+                    index.pop(key, None)
+                else:
+                    index[key] = entry
+            self._write_index(index)
+        self.index = index
+        self._changes.clear()
+
+    def _write_index(self, index: dict) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.root)
+        with os.fdopen(fd, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, self.index_path)
+
+    @contextlib.contextmanager
+    def _index_lock(self):
+        """Serializes the updates of the index between processes."""
+        with (self.root / "index.lock").open("a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+_caches: dict[Path, ArtifactCache] = {}
+_caches_lock = threading.Lock()
+
+
+def artifact_cache_from_config(config: dict) -> ArtifactCache | None:
+    """
+    Returns the artifact cache configured in the `artifact_cache` section of
+    a config (shared by all the callers of the process), or None if the
+    cache is not enabled.
+    """
+    settings = config.get("artifact_cache") or {}
+    if not settings.get("enabled"):
+        return None
+
+    root = Path(
+        settings.get("dir")
+        or Path(config.get("smo_dir", "~/.smo")) / "cache" / "artifacts"
+    ).expanduser()
+    with _caches_lock:
+        cache = _caches.get(root)
+        if cache is None:
+            cache = ArtifactCache(
+                root,
+                max_bytes=int(settings.get("max_size_mb", 2048)) * 1024**2,
+                tag_ttl=float(settings.get("tag_ttl_seconds", DEFAULT_TAG_TTL)),
+            )
+            _caches[root] = cache
+        return cache
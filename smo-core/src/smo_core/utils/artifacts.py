@@ -1,24 +1,44 @@
 import tempfile
-from pathlib import Path
-
-import yaml
 
 from smo_core.utils import run_hdarctl
+from smo_core.utils.artifact_cache import ArtifactCache, load_descriptor_from_dir
+from smo_core.utils.external_commands import run_hdarctl_async
+
 
+def get_graph_from_artifact(
+    artifact_ref: str, cache: ArtifactCache | None = None
+) -> dict:
+    """
+    Fetches a graph descriptor from an artifact reference (through the
+    artifact cache, if given).
+    """
+    if cache is not None:
+        return cache.get_descriptor(artifact_ref)
 
-def get_graph_from_artifact(artifact_ref: str) -> dict:
-    """Fetches a graph descriptor from an artifact reference."""
     with tempfile.TemporaryDirectory() as dirpath:
         print(f"Pulling artifact {artifact_ref}...")
         result = run_hdarctl("pull", artifact_ref, "--untar", "--destination", dirpath)
         print(result)
+        return load_descriptor_from_dir(dirpath)
+
 
-        for yaml_file_path in Path(dirpath).rglob("*.yml"):
-            with open(yaml_file_path) as yaml_file:
-                return yaml.safe_load(yaml_file)
+async def get_graph_from_artifact_async(
+    artifact_ref: str, cache: ArtifactCache | None = None
+) -> dict:
+    """Async counterpart of `get_graph_from_artifact`."""
+    if cache is not None:
+        descriptor = cache.lookup_descriptor(artifact_ref)
+        if descriptor is not None:
+            return descriptor
 
-        for yaml_file_path in Path(dirpath).rglob("*.yaml"):
-            with open(yaml_file_path) as yaml_file:
-                return yaml.safe_load(yaml_file)
+    with tempfile.TemporaryDirectory() as dirpath:
+        print(f"Pulling artifact {artifact_ref}...")
+        result = await run_hdarctl_async(
+            "pull", artifact_ref, "--untar", "--destination", dirpath
+        )
+        print(result.stdout)
+        descriptor = load_descriptor_from_dir(dirpath)
 
-    raise FileNotFoundError("No YAML descriptor found in artifact.")
+    if cache is not None:
+        cache.put_descriptor(artifact_ref, descriptor)
+    return descriptor
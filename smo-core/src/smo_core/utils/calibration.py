@@ -0,0 +1,108 @@
+"""
+Online calibration of the service capacity model used by the scaler.
+
+The replica optimizer assumes that `replicas` replicas of a service can
+handle up to `alpha * replicas + beta` requests per second. Instead of
+hand-tuning these coefficients, we estimate them from observed metrics:
+
+- For each sample, the capacity of the service at the current replica count
+  is extrapolated from its throughput and CPU utilization
+  (`throughput / utilization`), ignoring samples where the service is mostly
+  idle, since they carry little information about its capacity.
+- `alpha` and `beta` are then fitted by least squares over (replicas,
+  capacity) samples. The fit keeps only its sufficient statistics, with an
+  exponential forgetting factor, so it can be refreshed incrementally and
+  tracks changes in code and hardware.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class LinearFit:
+    """Weighted least-squares fit of `y = alpha * x + beta`, updatable online."""
+
+    weight: float = 0.0
+    sum_x: float = 0.0
+    sum_y: float = 0.0
+    sum_xx: float = 0.0
+    sum_xy: float = 0.0
+
+    def add(self, x: float, y: float, decay: float = 1.0) -> None:
+        """Adds a sample, after decaying the weight of the previous ones."""
+        self.weight = self.weight * decay + 1
+        self.sum_x = self.sum_x * decay + x
+        self.sum_y = self.sum_y * decay + y
+        self.sum_xx = self.sum_xx * decay + x * x
+        self.sum_xy = self.sum_xy * decay + x * y
+
+    def coefficients(self, min_weight: float = 1.0) -> tuple[float, float] | None:
+        """
+        Returns the fitted `(alpha, beta)`, or None if the fit is not usable:
+        fewer samples than `min_weight` (as decayed), or a capacity that
+        doesn't grow with the replicas (`alpha <= 0`, from noisy samples).
+
+        If all samples share the same `x` (e.g. a service that never scaled),
+        the slope can't be determined and a line through the origin is
+        returned instead.
+        """
+        if self.weight <= 0 or self.weight < min_weight or self.sum_x <= 0:
+            return None
+
+        variance = self.weight * self.sum_xx - self.sum_x**2
+        if variance <= 1e-9 * self.weight * self.sum_xx:
+            alpha, beta = self.sum_y / self.sum_x, 0.0
+        else:
+            alpha = (self.weight * self.sum_xy - self.sum_x * self.sum_y) / variance
+            beta = (self.sum_y - alpha * self.sum_x) / self.weight
+        if alpha <= 0:
+            return None
+        return alpha, beta
+
+
+def capacity_samples(
+    request_rates: list[tuple[float, float]],
+    cpu_usages: list[tuple[float, float]],
+    replicas: list[tuple[float, float]],
+    cpu_limit: float,
+    min_utilization: float = 0.2,
+) -> list[tuple[float, float, float]]:
+    """
+    Aligns (timestamp, value) series on their timestamps and returns
+    `(timestamp, replicas, estimated capacity)` samples.
+
+    Args:
+        request_rates: Observed throughput of the service (RPS).
+        cpu_usages: CPU used by all replicas of the service (cores).
+        replicas: Number of available replicas.
+        cpu_limit: CPU limit of a single replica (cores).
+        min_utilization: Samples below this CPU utilization are discarded.
+    """
+    usage_by_ts = dict(cpu_usages)
+    replicas_by_ts = dict(replicas)
+
+    samples = []
+    for ts, rate in request_rates:
+        usage = usage_by_ts.get(ts)
+        n_replicas = replicas_by_ts.get(ts)
+        if usage is None or not n_replicas or not cpu_limit:
+            continue
+
+        utilization = min(usage / (n_replicas * cpu_limit), 1.0)
+        if utilization < min_utilization:
+            continue
+
+        samples.append((ts, n_replicas, rate / utilization))
+    return samples
+
+
+def last_common_timestamp(*series: list[tuple[float, float]]) -> float | None:
+    """
+    Returns the last timestamp present in all the (timestamp, value) series,
+    or None if they have no timestamp in common.
+    """
+    common = None
+    for samples in series:
+        timestamps = {ts for ts, _value in samples}
+        common = timestamps if common is None else common & timestamps
+    return max(common) if common else None
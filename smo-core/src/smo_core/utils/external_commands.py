@@ -1,32 +1,69 @@
+import asyncio
 import subprocess
+import time
+import weakref
+from collections.abc import Callable
+from dataclasses import dataclass
 
+# Default deadline (seconds) of the helm and hdarctl commands
+DEFAULT_TIMEOUT = 300.0
 
-def run_hdarctl(command: str, *args: str) -> str:
+# Maximum number of external commands run concurrently by the async runner
+DEFAULT_MAX_CONCURRENT_COMMANDS = 8
+
+_max_concurrent_commands = DEFAULT_MAX_CONCURRENT_COMMANDS
+# One semaphore per event loop (asyncio primitives are bound to their loop)
+_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def run_hdarctl(
+    command: str, *args: str, timeout: float | None = DEFAULT_TIMEOUT
+) -> str:
     """
     Run the `hdarctl` command with the specified arguments and return the output.
 
     :param command: The command to run (e.g., 'status', 'start', 'stop').
     :param args: Additional arguments for the command.
+    :param timeout: Seconds after which the command is killed
+        (raises `subprocess.TimeoutExpired`).
     :return: The output of the command as a string.
     """
     cmd = ["hdarctl", command] + list(args)
     print(f"Running command: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    result = subprocess.run(
+        cmd, capture_output=True, text=True, check=True, timeout=timeout
+    )
     return result.stdout.strip()
 
 
-def run_helm(command: str, *args: str) -> str:
+def run_helm(
+    command: str,
+    *args: str,
+    timeout: float | None = DEFAULT_TIMEOUT,
+    input: str | None = None,
+) -> str:
     """
     Run the `helm` command with the specified arguments and return the output.
 
     :param command: The helm command to run (e.g., 'install', 'uninstall').
     :param args: Additional arguments for the command.
+    :param timeout: Seconds after which the command is killed
+        (raises `subprocess.TimeoutExpired`).
+    :param input: Data sent to the standard input of the command
+        (e.g. the values for `--values -`).
     :return: The output of the command as a string.
     """
-    cmd = ["helm", command] + [str(arg) for arg in args if arg is not None]
+    cmd = _helm_command(command, args)
     print(f"Running command: {' '.join(cmd)}")
     # result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    result = subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+        check=False,
+        timeout=timeout,
+        input=input,
+    )
 
     if result.returncode != 0:
         print(f"Command failed: {' '.join(cmd)}")
@@ -35,3 +72,153 @@ def run_helm(command: str, *args: str) -> str:
         raise subprocess.SubprocessError(msg)
 
     return result.stdout.strip()
+
+
+#
+# Async runner
+#
+@dataclass(frozen=True)
+class CommandResult:
+    """Result of a command run by `run_command_async`."""
+
+    args: list[str]
+    # None if the command was killed before exiting on its own
+    returncode: int | None
+    stdout: str
+    stderr: str
+    # Seconds, including the wait for a concurrency slot
+    duration: float
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out
+
+    def check(self) -> "CommandResult":
+        """Raises a `subprocess.SubprocessError` if the command failed."""
+        cmd = " ".join(self.args)
+        if self.timed_out:
+            raise subprocess.TimeoutExpired(
+                self.args, self.duration, self.stdout, self.stderr
+            )
+        if self.returncode != 0:
+            raise subprocess.SubprocessError(
+                f"Command '{cmd}' failed with return code {self.returncode}: "
+                f"{self.stderr.strip()}"
+            )
+        return self
+
+
+def set_max_concurrent_commands(value: int) -> None:
+    """Sets the global limit of concurrent commands (for the loops created afterwards)."""
+    global _max_concurrent_commands
+    _max_concurrent_commands = max(1, value)
+    _semaphores.clear()
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_max_concurrent_commands)
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+async def run_command_async(
+    args: list[str],
+    timeout: float | None = DEFAULT_TIMEOUT,
+    on_output: Callable[[str, str], None] | None = None,
+    input: str | None = None,
+) -> CommandResult:
+    """
+    Runs an external command without blocking the event loop.
+
+    At most `DEFAULT_MAX_CONCURRENT_COMMANDS` commands (see
+    `set_max_concurrent_commands`) run at once, the others wait for a slot.
+    The output is read as it is produced, and each line is passed to
+    `on_output("stdout" | "stderr", line)` if given. `input`, if given, is
+    written to the standard input of the command.
+
+    The command is killed if it doesn't complete within `timeout` seconds
+    (the result then has `timed_out` set), or if the calling task is
+    cancelled.
+    """
+    args = [str(arg) for arg in args]
+    start = time.monotonic()
+    async with _get_semaphore():
+        process = await asyncio.create_subprocess_exec(
+            *args,
+            stdin=asyncio.subprocess.PIPE if input is not None else None,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout: list[str] = []
+        stderr: list[str] = []
+
+        async def read(stream, lines, name):
+            async for line in stream:
+                text = line.decode(errors="replace")
+                lines.append(text)
+                if on_output is not None:
+                    on_output(name, text.rstrip("\n"))
+
+        async def write(stream, data):
+            # Written along with the reads, so that a command filling its
+            # output pipes before reading all its input doesn't block
+            try:
+                stream.write(data.encode())
+                await stream.drain()
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # The command exited without reading all its input
+            finally:
+                stream.close()
+
+        tasks = [
+            read(process.stdout, stdout, "stdout"),
+            read(process.stderr, stderr, "stderr"),
+            process.wait(),
+        ]
+        if input is not None:
+            tasks.append(write(process.stdin, input))
+
+        timed_out = False
+        try:
+            await asyncio.wait_for(asyncio.gather(*tasks), timeout)
+        except TimeoutError:
+            timed_out = True
+            await _kill(process)
+        except asyncio.CancelledError:
+            await asyncio.shield(_kill(process))
+            raise
+
+    return CommandResult(
+        args=args,
+        returncode=None if timed_out else process.returncode,
+        stdout="".join(stdout).strip(),
+        stderr="".join(stderr).strip(),
+        duration=time.monotonic() - start,
+        timed_out=timed_out,
+    )
+
+
+async def _kill(process: asyncio.subprocess.Process) -> None:
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+
+async def run_hdarctl_async(
+    command: str, *args: str, timeout: float | None = DEFAULT_TIMEOUT
+) -> CommandResult:
+    """Async counterpart of `run_hdarctl`, returning the (checked) result."""
+    cmd = ["hdarctl", command] + list(args)
+    print(f"Running command: {' '.join(cmd)}")
+    return (await run_command_async(cmd, timeout=timeout)).check()
+
+
+def _helm_command(command: str, args) -> list[str]:
+    return ["helm", command] + [str(arg) for arg in args if arg is not None]
@@ -0,0 +1,192 @@
+"""
+Dependency-aware parallel execution of the lifecycle operations of a graph.
+
+Installing, upgrading or uninstalling the services of a graph one at a time
+costs one helm round trip to the Karmada API server per service. The
+services of a graph are instead ordered by their dependencies (the services
+they connect to, `connectionPoints`, and the `trigger.auto.dependencies` of
+their descriptor) and run in waves: all the services of a wave only depend
+on services of the previous waves, and are run concurrently on a bounded
+worker pool.
+"""
+
+import subprocess
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import yaml
+from glom import glom
+from kubernetes.client.rest import ApiException
+from urllib3.exceptions import HTTPError
+
+OK = "ok"
+FAILED = "failed"
+# Not run because a service it depends on failed
+SKIPPED = "skipped"
+
+# Errors of the operation of a service: helm (or hdarctl) runs, rendering of
+# its manifests, and requests to the Karmada API server
+OPERATION_ERRORS = (
+    subprocess.SubprocessError,
+    OSError,
+    ValueError,
+    KeyError,
+    yaml.YAMLError,
+    ApiException,
+    HTTPError,
+)
+
+
+@dataclass(frozen=True)
+class OperationResult:
+    """Result of the operation of a single service."""
+
+    name: str
+    status: str
+    output: str = ""
+    error: str | None = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status == OK
+
+
+def service_dependencies(services_descriptor: list[dict]) -> dict[str, set[str]]:
+    """
+    Returns the services each service of a graph descriptor depends on, i.e.
+    must be deployed after: the services of its `connectionPoints` and its
+    `trigger.auto.dependencies`.
+    """
+    names = {s["id"] for s in services_descriptor}
+    dependencies = {}
+    for service in services_descriptor:
+        depends_on = set(
+            glom(service, "deployment.intent.connectionPoints", default=None) or []
+        )
+        depends_on.update(
+            glom(service, "deployment.trigger.auto.dependencies", default=None) or []
+        )
+        depends_on &= names
+        depends_on.discard(service["id"])
+        dependencies[service["id"]] = depends_on
+    return dependencies
+
+
+def execution_waves(
+    names: Iterable[str], dependencies: dict[str, set[str]]
+) -> list[list[str]]:
+    """
+    Groups the services in waves, each service coming after the services it
+    depends on. Dependencies on services not in `names` are ignored.
+
+    Services that are part of a dependency cycle are put together in a last
+    wave.
+    """
+    names = list(dict.fromkeys(names))
+    remaining = {
+        name: set(dependencies.get(name, ())) & set(names) - {name} for name in names
+    }
+    waves = []
+    while remaining:
+        wave = [name for name in names if name in remaining and not remaining[name]]
+        if not wave:
+            print(
+                f"Warning: dependency cycle between services {sorted(remaining)}, "
+                f"running them together."
+            )
+            waves.append([name for name in names if name in remaining])
+            break
+        waves.append(wave)
+        for name in wave:
+            del remaining[name]
+        for depends_on in remaining.values():
+            depends_on.difference_update(wave)
+    return waves
+
+
+class LifecycleExecutor:
+    """Runs per-service operations in dependency order, wave by wave."""
+
+    def __init__(self, max_workers: int = 8):
+        self.max_workers = max_workers
+
+    def run(
+        self,
+        operations: dict[str, Callable[[], str | None]],
+        dependencies: dict[str, set[str]],
+        reverse: bool = False,
+        skip_dependents: bool = True,
+    ) -> dict[str, OperationResult]:
+        """
+        Runs the operations (one per service name) and returns their results.
+
+        With `reverse` (e.g. for uninstalls), dependents come first. With
+        `skip_dependents`, the services that come after a failed one in
+        dependency order are not run.
+        """
+        waves = execution_waves(operations, dependencies)
+        if reverse:
+            waves.reverse()
+
+        results: dict[str, OperationResult] = {}
+        failed: set[str] = set()
+        with ThreadPoolExecutor(
+            max_workers=max(1, self.max_workers), thread_name_prefix="smo-lifecycle"
+        ) as executor:
+            for wave in waves:
+                to_run = []
+                for name in wave:
+                    if skip_dependents and self._blocked_by(
+                        name, failed, dependencies, reverse
+                    ):
+                        results[name] = OperationResult(name, SKIPPED)
+                        failed.add(name)
+                    else:
+                        to_run.append(name)
+
+                futures = {
+                    name: executor.submit(self._run_one, name, operations[name])
+                    for name in to_run
+                }
+                for name, future in futures.items():
+                    results[name] = future.result()
+                    if not results[name].ok:
+                        failed.add(name)
+
+        return {name: results[name] for name in operations}
+
+    @staticmethod
+    def _blocked_by(
+        name: str, failed: set[str], dependencies: dict[str, set[str]], reverse: bool
+    ) -> bool:
+        if reverse:
+            return any(name in dependencies.get(other, ()) for other in failed)
+        return bool(dependencies.get(name, set()) & failed)
+
+    @staticmethod
+    def _run_one(name: str, operation: Callable[[], str | None]) -> OperationResult:
+        start = time.monotonic()
+        try:
+            output = operation()
+        except OPERATION_ERRORS as e:
+            return OperationResult(
+                name, FAILED, error=str(e), duration=time.monotonic() - start
+            )
+        return OperationResult(
+            name, OK, output=output or "", duration=time.monotonic() - start
+        )
+
+
+def raise_for_failures(results: dict[str, OperationResult]) -> None:
+    """Raises a `SubprocessError` (as `run_helm` does) if an operation failed."""
+    failures = [r for r in results.values() if not r.ok]
+    if failures:
+        details = "; ".join(
+            f"{r.name}: {r.error or 'skipped (a dependency failed)'}" for r in failures
+        )
+        raise subprocess.SubprocessError(
+            f"{len(failures)} of {len(results)} service operation(s) failed: {details}"
+        )
@@ -0,0 +1,176 @@
+"""
+Make-before-break migration of services between clusters.
+
+Upgrading a service in place with a new `clustersAffinity` makes Karmada
+remove it from its old cluster while it is scheduled on the new one, so
+that it is unreachable until the new replicas are ready. A migration
+instead runs in four phases:
+
+1. expand: the service is propagated to both its source and target clusters;
+2. the executor waits until the service is ready on the target cluster, as
+   reported by Karmada;
+3. the services it connects to are imported into the target cluster
+   (`serviceImportClusters`), so that it can reach them from there;
+4. contract: the service is removed from its source cluster.
+
+If the service doesn't become ready in time (or its peers can't be
+updated), it is propagated back to its source cluster only. Migrations are
+run a few at a time (`max_concurrent`), so that rebalancing a graph doesn't
+move all its services at once.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from kubernetes.client.rest import ApiException
+from urllib3.exceptions import HTTPError
+
+from smo_core.utils.lifecycle import FAILED, OK, OPERATION_ERRORS, OperationResult
+
+DEFAULT_MAX_CONCURRENT = 2
+DEFAULT_READINESS_TIMEOUT = 300.0
+DEFAULT_POLL_INTERVAL = 5.0
+
+
+@dataclass(frozen=True)
+class Migration:
+    """Move of a service from its source cluster to a target cluster."""
+
+    name: str
+    source: str
+    target: str
+    # Services to import into the target cluster (those the service connects to)
+    peers: tuple[str, ...] = ()
+
+
+class MigrationExecutor:
+    """
+    Runs migrations, make-before-break, with at most `max_concurrent` at once.
+
+    The executor keeps the placement of each service as applied so far (its
+    clusters and import clusters), and applies it with
+    `apply(name, clusters, import_clusters)`. The placement of a service is
+    only changed by one thread at a time, so that the services connected to
+    several moving services accumulate their import clusters.
+    `is_ready(name, cluster)` tells whether a service is ready on a cluster.
+    """
+
+    def __init__(
+        self,
+        apply: Callable[[str, list[str], list[str]], str | None],
+        is_ready: Callable[[str, str], bool],
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        readiness_timeout: float = DEFAULT_READINESS_TIMEOUT,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        self.apply = apply
+        self.is_ready = is_ready
+        self.max_concurrent = max(1, max_concurrent)
+        self.readiness_timeout = readiness_timeout
+        self.poll_interval = poll_interval
+
+        self._clusters: dict[str, list[str]] = {}
+        self._imports: dict[str, list[str]] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def run(
+        self,
+        migrations: list[Migration],
+        clusters: dict[str, list[str]],
+        import_clusters: dict[str, list[str]],
+    ) -> dict[str, OperationResult]:
+        """
+        Runs the migrations, from the current placement of the services
+        (their `clusters` and `import_clusters`, by name). Returns the
+        result of each migration, by service name.
+        """
+        self._clusters = {name: list(c) for name, c in clusters.items()}
+        self._clusters.update({m.name: [m.source] for m in migrations})
+        self._imports = {
+            name: list(clusters) for name, clusters in import_clusters.items()
+        }
+        self._locks = {}
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrent, thread_name_prefix="smo-migration"
+        ) as executor:
+            futures = {
+                migration.name: executor.submit(self._run_one, migration)
+                for migration in migrations
+            }
+            return {name: future.result() for name, future in futures.items()}
+
+    def placement(self, name: str) -> tuple[list[str], list[str]]:
+        """Returns the clusters and import clusters last applied for a service."""
+        return list(self._clusters.get(name, [])), list(self._imports.get(name, []))
+
+    def _run_one(self, migration: Migration) -> OperationResult:
+        start = time.monotonic()
+        name = migration.name
+        try:
+            print(
+                f"Migrating service {name} from {migration.source} "
+                f"to {migration.target}..."
+            )
+            self._update(name, clusters=[migration.source, migration.target])
+            try:
+                if not self._wait_ready(name, migration.target):
+                    raise TimeoutError(
+                        f"Service {name} not ready on cluster {migration.target} "
+                        f"after {self.readiness_timeout:.0f}s"
+                    )
+                for peer in migration.peers:
+                    self._update(peer, add_import=migration.target)
+            except Exception:
+                print(f"Migration of {name} failed, keeping it on {migration.source}.")
+                self._update(name, clusters=[migration.source])
+                raise
+            self._update(name, clusters=[migration.target])
+        except OPERATION_ERRORS as e:
+            return OperationResult(
+                name, FAILED, error=str(e), duration=time.monotonic() - start
+            )
+        return OperationResult(
+            name,
+            OK,
+            output=f"Moved to {migration.target}",
+            duration=time.monotonic() - start,
+        )
+
+    def _update(
+        self,
+        name: str,
+        clusters: list[str] | None = None,
+        add_import: str | None = None,
+    ) -> None:
+        """Changes the placement of a service, and applies it."""
+        with self._lock:
+            lock = self._locks.setdefault(name, threading.Lock())
+        with lock:
+            imports = self._imports.get(name, [])
+            if add_import is not None:
+                if add_import in imports:
+                    return
+                imports = [*imports, add_import]
+            if clusters is None:
+                clusters = self._clusters.get(name, [])
+            self.apply(name, list(clusters), list(imports))
+            # Only recorded once applied
+            self._clusters[name] = list(clusters)
+            self._imports[name] = imports
+
+    def _wait_ready(self, name: str, cluster: str) -> bool:
+        deadline = time.monotonic() + self.readiness_timeout
+        while True:
+            try:
+                if self.is_ready(name, cluster):
+                    return True
+            except (ApiException, HTTPError, OSError) as e:
+                print(f"Warning: could not get the status of {name} on {cluster}: {e}")
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(self.poll_interval)
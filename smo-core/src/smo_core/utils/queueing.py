@@ -0,0 +1,119 @@
+"""
+Queueing-model (M/M/c) replica sizing.
+
+This is an alternative to the linear `alpha * replicas + beta` capacity model
+used by `decide_replicas`: each replica is modeled as one server of an M/M/c
+queue with service rate `mu` (requests per second a single replica handles),
+and we look for the minimum number of replicas that keeps the mean (or a
+percentile of the) waiting time under a target, using the Erlang-C formula.
+
+Since the Erlang-C formula is not linear in the number of replicas, it can't
+be used directly in the optimizer. Instead, for each service we precompute a
+lookup table of the maximum arrival rate sustainable for each replica count,
+and turn it into a lower bound on the replicas for the current rate.
+"""
+
+import math
+
+
+def erlang_c(servers: int, offered_load: float) -> float:
+    """
+    Returns the probability that a request has to wait (Erlang-C formula) for
+    `servers` servers and an offered load of `offered_load` Erlangs
+    (arrival rate / service rate).
+    """
+    if offered_load <= 0:
+        return 0.0
+    if offered_load >= servers:
+        return 1.0
+
+    # Erlang-B by recursion (numerically stable), then convert to Erlang-C
+    erlang_b = 1.0
+    for k in range(1, servers + 1):
+        erlang_b = offered_load * erlang_b / (k + offered_load * erlang_b)
+    utilization = offered_load / servers
+    return erlang_b / (1 - utilization + utilization * erlang_b)
+
+
+def waiting_time(
+    arrival_rate: float,
+    service_rate: float,
+    servers: int,
+    percentile: float | None = None,
+) -> float:
+    """
+    Returns the mean waiting time in queue (or the given percentile of it,
+    e.g. 0.95) of an M/M/c queue, in seconds. Returns `inf` if the queue is
+    unstable.
+    """
+    if arrival_rate <= 0:
+        return 0.0
+    spare_rate = servers * service_rate - arrival_rate
+    if spare_rate <= 0:
+        return math.inf
+
+    p_wait = erlang_c(servers, arrival_rate / service_rate)
+    if percentile is None:
+        return p_wait / spare_rate
+
+    # P(W > t) = C * exp(-(c * mu - lambda) * t)
+    if p_wait <= 1 - percentile:
+        return 0.0
+    return math.log(p_wait / (1 - percentile)) / spare_rate
+
+
+def min_replicas(
+    arrival_rate: float,
+    service_rate: float,
+    target_wait: float,
+    percentile: float | None = None,
+    maximum_replicas: int = 100,
+) -> int | None:
+    """
+    Returns the minimum number of replicas (at least 1) keeping the waiting
+    time under `target_wait`, or None if `maximum_replicas` are not enough.
+    """
+    for replicas in range(1, maximum_replicas + 1):
+        if (
+            waiting_time(arrival_rate, service_rate, replicas, percentile)
+            <= target_wait
+        ):
+            return replicas
+    return None
+
+
+def capacity_table(
+    service_rate: float,
+    target_wait: float,
+    percentile: float | None = None,
+    maximum_replicas: int = 20,
+    tolerance: float = 1e-3,
+) -> list[float]:
+    """
+    Precomputes, for 1 to `maximum_replicas` replicas, the maximum arrival
+    rate for which the waiting time target is met.
+
+    `table[r - 1]` is the capacity (in RPS) of `r` replicas.
+    """
+    table = []
+    for replicas in range(1, maximum_replicas + 1):
+        low, high = 0.0, replicas * service_rate
+        while high - low > tolerance * service_rate:
+            middle = (low + high) / 2
+            if waiting_time(middle, service_rate, replicas, percentile) <= target_wait:
+                low = middle
+            else:
+                high = middle
+        table.append(low)
+    return table
+
+
+def replicas_for_rate(table: list[float], arrival_rate: float) -> int | None:
+    """
+    Looks up the minimum number of replicas able to sustain `arrival_rate`
+    in a table built by `capacity_table`, or None if none is large enough.
+    """
+    for replicas, capacity in enumerate(table, start=1):
+        if capacity >= arrival_rate:
+            return replicas
+    return None
@@ -1,11 +1,17 @@
 """Replica scaling algorithm."""
 
+import math
 import time
+from collections import deque
 
 import cvxpy as cp
 import requests
+from glom import glom
 
 from smo_core.helpers import KarmadaHelper, PrometheusHelper
+from smo_core.helpers.karmada_helper import graph_label_selector
+from smo_core.utils.actuation import ScalingActuator
+from smo_core.utils.queueing import replicas_for_rate
 
 
 def scaling_loop(
@@ -21,26 +27,51 @@ def scaling_loop(
     config_file_path,
     prometheus_host,
     stop_event,
+    forecast_lead_time=None,
+    capacity_tables=None,
 ):
-    """Runs the scaling algorithm periodically."""
+    """
+    Runs the scaling algorithm periodically.
+
+    When `forecast_lead_time` (in seconds) is set, the solver is fed the
+    request rate forecast at `now + forecast_lead_time` instead of the
+    currently observed one (predictive mode).
+
+    When `capacity_tables` (one per service, see `queueing.capacity_table`)
+    are given, they replace the linear `alpha`/`beta` capacity model.
+    """
 
     karmada_helper = KarmadaHelper(config_file_path)
+    karmada_helper.start_deployment_cache()
     prometheus_helper = PrometheusHelper(prometheus_host, decision_interval)
+    # Wait until all the services are up, reading their status in bulk
     while True:
+        statuses = karmada_helper.get_deployments_status(
+            label_selector=graph_label_selector(graph_name), names=managed_services
+        )
         current_replicas = [
-            karmada_helper.get_replicas(service) for service in managed_services
+            statuses[service].available_replicas if service in statuses else None
+            for service in managed_services
         ]
         if None in current_replicas:
             time.sleep(5)
         else:
             break
 
-    current_replicas = [
-        karmada_helper.get_replicas(service) for service in managed_services
-    ]
-    cpu_limits = [karmada_helper.get_cpu_limit(service) for service in managed_services]
+    cpu_limits = [statuses[service].cpu_limit for service in managed_services]
+
+    actuator = ScalingActuator(karmada_helper)
+
+    forecasters = None
+    if forecast_lead_time:
+        forecasters = [
+            RequestRateForecaster(interval=decision_interval) for _ in managed_services
+        ]
 
     while not stop_event.is_set():
+        # Deployments may have been scaled by someone else since the last
+        # tick: the actuator diffs against their current spec.replicas
+        observe_replicas(actuator, statuses, managed_services)
         new_replicas = loop_step(
             acceleration,
             alpha,
@@ -55,10 +86,30 @@ def scaling_loop(
             maximum_replicas,
             current_replicas,
             prometheus_helper,
+            forecasters=forecasters,
+            forecast_lead_time=forecast_lead_time,
+            capacity_tables=capacity_tables,
+            actuator=actuator,
         )
         print(new_replicas)
         current_replicas = new_replicas
         time.sleep(decision_interval)
+        statuses = karmada_helper.get_deployments_status(
+            label_selector=graph_label_selector(graph_name), names=managed_services
+        )
+
+    actuator.close()
+    karmada_helper.stop_deployment_cache()
+
+
+def observe_replicas(actuator, statuses, managed_services):
+    """
+    Records the desired replicas (`spec.replicas`) of the managed services,
+    as read with `get_deployments_status`, in the actuator.
+    """
+    for service in managed_services:
+        status = statuses.get(service)
+        actuator.observe(service, status.desired_replicas if status else None)
 
 
 def loop_step(
@@ -75,6 +126,10 @@ def loop_step(
     maximum_replicas,
     previous_replicas,
     prometheus_helper,
+    forecasters=None,
+    forecast_lead_time=None,
+    capacity_tables=None,
+    actuator=None,
 ):
     request_rates = []
     for service in managed_services:
@@ -83,6 +138,15 @@ def loop_step(
         else:
             request_rates.append(prometheus_helper.get_request_rate(service))
 
+    if forecasters:
+        request_rates = predict_request_rates(
+            forecasters, request_rates, forecast_lead_time, managed_services
+        )
+
+    min_replicas = None
+    if capacity_tables:
+        min_replicas = minimum_replicas_from_tables(capacity_tables, request_rates)
+
     print(
         request_rates,
         previous_replicas,
@@ -104,9 +168,12 @@ def loop_step(
         cluster_capacity,
         cluster_acceleration,
         maximum_replicas,
+        min_replicas=min_replicas,
     )
     if new_replicas is None:
         requests.get(f"http://localhost:8000/graphs/{graph_name}/placement")
+    elif actuator is not None:
+        actuator.apply(dict(zip(managed_services, new_replicas)))
     else:
         for idx, replicas in enumerate(new_replicas):
             karmada_helper.scale_deployment(managed_services[idx], replicas)
@@ -114,6 +181,178 @@ def loop_step(
     return new_replicas
 
 
+def minimum_replicas_from_tables(capacity_tables, request_rates):
+    """
+    Returns the minimum replicas of each service according to its queueing
+    model capacity table.
+
+    A rate that no entry of the table can sustain yields a bound one above
+    the table size: `decide_replicas` has no upper bound on the replicas, so
+    the service is scaled past the table, unless the cluster CPU capacity
+    can't accommodate it (which makes the optimization infeasible).
+    """
+    return [
+        replicas_for_rate(table, rate) or len(table) + 1
+        for table, rate in zip(capacity_tables, request_rates)
+    ]
+
+
+def predict_request_rates(forecasters, request_rates, lead_time, managed_services):
+    """
+    Feeds the observed rates to the per-service forecasters and returns the
+    rates predicted at `now + lead_time`.
+
+    The prediction is never lower than the observed rate, so that a
+    forecast of a decreasing load doesn't scale down ahead of time.
+    """
+    predicted = []
+    for service, forecaster, rate in zip(managed_services, forecasters, request_rates):
+        forecaster.update(rate)
+        forecast = forecaster.forecast(lead_time)
+        metrics = forecaster.metrics()
+        if metrics["samples"]:
+            accuracy = f"MAE {metrics['mae']:.2f}"
+            # Undefined when all the observed rates were 0
+            if metrics["mape"] is not None:
+                accuracy += f", MAPE {metrics['mape']:.1%}"
+            print(
+                f"Forecast for {service}: {forecast:.2f} RPS in {lead_time}s "
+                f"({accuracy})"
+            )
+        predicted.append(max(rate, forecast))
+    return predicted
+
+
+def forecast_lead_time_from_intent(graph_descriptor, default=None):
+    """
+    Returns the provisioning lead time (in seconds) configured for the graph,
+    or `default` if predictive scaling is not enabled for it.
+
+    Predictive scaling is selected per graph in its descriptor::
+
+        hdaGraphIntent:
+          predictiveScaling:
+            enabled: True
+            leadTime: 60
+    """
+    settings = glom(graph_descriptor, "hdaGraphIntent.predictiveScaling", default=None)
+    if not settings or str(settings.get("enabled", False)) not in ("True", "true"):
+        return default
+    return float(settings.get("leadTime", default or 0))
+
+
+class RequestRateForecaster:
+    """
+    Holt (double exponential smoothing) forecaster for a request-rate series.
+
+    With `trend_smoothing=0` it degenerates to a plain EWMA. The forecaster
+    also keeps track of its own accuracy: each prediction is compared to the
+    value actually observed `lead_time` seconds later (online backtest).
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        level_smoothing: float = 0.5,
+        trend_smoothing: float = 0.3,
+        max_pending: int = 1000,
+    ):
+        self.interval = interval
+        self.level_smoothing = level_smoothing
+        self.trend_smoothing = trend_smoothing
+
+        self.level = None
+        self.trend = 0.0
+        self.step = 0
+
+        # Predictions waiting for their actual value: (target_step, prediction)
+        self._pending = deque(maxlen=max_pending)
+        self._abs_errors = 0.0
+        self._sq_errors = 0.0
+        self._pct_errors = 0.0
+        self._pct_samples = 0
+        self._samples = 0
+
+    def update(self, value: float) -> None:
+        """Adds an observation, taken `interval` seconds after the previous one."""
+        if value is None or math.isnan(value):
+            return
+
+        self.step += 1
+        self._score(value)
+
+        if self.level is None:
+            self.level = value
+            return
+
+        previous_level = self.level
+        self.level = self.level_smoothing * value + (1 - self.level_smoothing) * (
+            self.level + self.trend
+        )
+        self.trend = (
+            self.trend_smoothing * (self.level - previous_level)
+            + (1 - self.trend_smoothing) * self.trend
+        )
+
+    def forecast(self, lead_time: float) -> float:
+        """Returns the predicted rate `lead_time` seconds from now (never negative)."""
+        if self.level is None:
+            return 0.0
+
+        steps = lead_time / self.interval if self.interval else 0
+        prediction = max(0.0, self.level + steps * self.trend)
+        self._pending.append((self.step + math.ceil(steps), prediction))
+        return prediction
+
+    def metrics(self) -> dict:
+        """Returns the backtesting metrics accumulated so far."""
+        if not self._samples:
+            return {"samples": 0, "mae": None, "rmse": None, "mape": None}
+        return {
+            "samples": self._samples,
+            "mae": self._abs_errors / self._samples,
+            "rmse": math.sqrt(self._sq_errors / self._samples),
+            "mape": (
+                self._pct_errors / self._pct_samples if self._pct_samples else None
+            ),
+        }
+
+    def _score(self, actual: float) -> None:
+        while self._pending and self._pending[0][0] <= self.step:
+            target_step, prediction = self._pending.popleft()
+            if target_step < self.step:
+                continue  # Missed sample, can't be scored
+            error = prediction - actual
+            self._samples += 1
+            self._abs_errors += abs(error)
+            self._sq_errors += error * error
+            if actual:
+                self._pct_errors += abs(error) / abs(actual)
+                self._pct_samples += 1
+
+
+def backtest_forecaster(
+    history, interval, lead_time, level_smoothing=0.5, trend_smoothing=0.3
+) -> dict:
+    """
+    Replays a request-rate history through a forecaster and returns its
+    accuracy metrics (MAE, RMSE, MAPE) for the given lead time.
+
+    Useful to tune the smoothing factors of a graph before enabling
+    predictive scaling on it.
+    """
+    forecaster = RequestRateForecaster(
+        interval,
+        level_smoothing=level_smoothing,
+        trend_smoothing=trend_smoothing,
+        max_pending=len(history) + 1,
+    )
+    for value in history:
+        forecaster.update(value)
+        forecaster.forecast(lead_time)
+    return forecaster.metrics()
+
+
 def decide_replicas(
     request_rates,
     previous_replicas,
@@ -124,6 +363,7 @@ def decide_replicas(
     cluster_capacity,
     cluster_acceleration,
     maximum_replicas,
+    min_replicas=None,
 ):
     """
     Parameters
@@ -138,6 +378,9 @@ def decide_replicas(
     beta: Coefficient in the same equation as alpha mentioned above
     cluster_capacity: Cluster CPU capacity in cores
     cluster_acceleration: Acceleration enabled for cluster flag
+    min_replicas: Optional list of minimum replicas for each service, as
+           computed by a queueing model (see `minimum_replicas_from_tables`).
+           When given, it replaces the alpha/beta capacity constraint.
 
     Return value
     ---
@@ -177,8 +420,11 @@ def decide_replicas(
     # Per-node constraints
     for s in range(num_nodes):
         constraints.append(acceleration[s] <= cluster_acceleration)
-        constraints.append(alpha[s] * r_current[s] + beta[s] >= request_rates[s])
-        constraints.append(r_current[s] >= 1)
+        if min_replicas is None:
+            constraints.append(alpha[s] * r_current[s] + beta[s] >= request_rates[s])
+            constraints.append(r_current[s] >= 1)
+        else:
+            constraints.append(r_current[s] >= max(1, min_replicas[s]))
 
     objective = cp.Minimize(
         w_util
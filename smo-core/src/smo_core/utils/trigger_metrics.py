@@ -0,0 +1,92 @@
+"""
+Latency of the event-triggered deployments of conditional services.
+
+Two durations are measured for each triggered service: the end-to-end
+latency, from the moment its trigger fired (the `startsAt` of the
+Prometheus alert, or the end of the grace period evaluated by SMO) to the
+moment its resources were applied, and the duration of the deployment
+itself. Both are logged with the deployment path (`staged` when the
+pre-rendered manifests were applied, `cold` otherwise). The end-to-end
+latency of the last trigger of each service is stored on the service
+(`triggered_at`, `trigger_latency`), so that it can be exported, in the
+Prometheus text format, by any process sharing the database (see
+`render_trigger_metrics`), whichever process deployed the service.
+"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from smo_core.models import Service
+
+STAGED = "staged"
+COLD = "cold"
+
+
+def parse_timestamp(value: str | None) -> datetime | None:
+    """
+    Parses an RFC 3339 timestamp, as sent by Alertmanager (with nanoseconds
+    and a `Z` suffix). Returns None if the value is missing or invalid.
+    """
+    if not value or value.startswith("0001-01-01"):
+        return None
+    text = value.strip().replace("Z", "+00:00")
+    if "." in text:
+        # datetime only supports microseconds
+        head, _, rest = text.partition(".")
+        digits = len(rest) - len(rest.lstrip("0123456789"))
+        text = f"{head}.{rest[:digits][:6].ljust(6, '0')}{rest[digits:]}"
+    try:
+        timestamp = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    return timestamp
+
+
+def _labels(service: Service) -> str:
+    return f'graph="{service.graph.name}",service="{service.name}"'
+
+
+def render_trigger_metrics(db_session: Session) -> str:
+    """
+    Returns the trigger metrics of the services triggered so far, in the
+    Prometheus text exposition format.
+    """
+    stmt = (
+        select(Service).where(Service.triggered_at.is_not(None)).order_by(Service.name)
+    )
+    services = db_session.scalars(stmt).all()
+
+    lines = [
+        (
+            "# HELP smo_trigger_latency_seconds Time from the last firing of the "
+            "trigger of a conditional service to its deployment."
+        ),
+        "# TYPE smo_trigger_latency_seconds gauge",
+    ]
+    for service in services:
+        if service.trigger_latency is not None:
+            lines.append(
+                f"smo_trigger_latency_seconds{{{_labels(service)}}} "
+                f"{service.trigger_latency}"
+            )
+    lines += [
+        (
+            "# HELP smo_trigger_timestamp_seconds Time of the last firing of the "
+            "trigger of a conditional service."
+        ),
+        "# TYPE smo_trigger_timestamp_seconds gauge",
+    ]
+    for service in services:
+        triggered_at = service.triggered_at
+        # SQLite doesn't keep the time zone of the (UTC) timestamps
+        if triggered_at.tzinfo is None:
+            triggered_at = triggered_at.replace(tzinfo=UTC)
+        lines.append(
+            f"smo_trigger_timestamp_seconds{{{_labels(service)}}} "
+            f"{triggered_at.timestamp()}"
+        )
+    return "\n".join(lines) + "\n"
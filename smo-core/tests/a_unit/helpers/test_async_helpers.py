@@ -0,0 +1,48 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+from smo_core.helpers.async_helpers import AsyncKarmadaHelper, AsyncPrometheusHelper
+
+
+def test_async_karmada_helper_runs_calls_off_the_event_loop():
+    loop_thread = threading.get_ident()
+    threads = []
+
+    def get_replicas(name):
+        threads.append(threading.get_ident())
+        return {"svc-a": 1, "svc-b": 3}[name]
+
+    helper = MagicMock()
+    helper.get_replicas.side_effect = get_replicas
+    karmada = AsyncKarmadaHelper(helper)
+
+    async def main():
+        return await asyncio.gather(
+            karmada.get_replicas("svc-a"), karmada.get_replicas("svc-b")
+        )
+
+    assert asyncio.run(main()) == [1, 3]
+    assert loop_thread not in threads
+
+
+def test_async_karmada_helper_scale_deployment():
+    helper = MagicMock()
+    karmada = AsyncKarmadaHelper(helper)
+
+    asyncio.run(karmada.scale_deployment("svc-a", 4, namespace="ns"))
+
+    helper.scale_deployment.assert_called_once_with("svc-a", 4, "ns")
+
+
+def test_async_prometheus_helper():
+    helper = MagicMock()
+    helper.query.return_value = 1.5
+    prometheus = AsyncPrometheusHelper(helper)
+
+    async def main():
+        await prometheus.update_alert_rules({"alert": "a"}, "add")
+        return await prometheus.query("up")
+
+    assert asyncio.run(main()) == 1.5
+    helper.update_alert_rules.assert_called_once_with({"alert": "a"}, "add")
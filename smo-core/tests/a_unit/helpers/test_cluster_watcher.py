@@ -0,0 +1,151 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from smo_core.helpers.cluster_watcher import ClusterWatcher
+
+
+def make_cluster(name, allocated_cpu="2", ready="True", resource_version="1"):
+    return {
+        "metadata": {"name": name, "resourceVersion": resource_version},
+        "status": {
+            "resourceSummary": {
+                "allocatable": {"cpu": "4", "memory": "16Gi"},
+                "allocated": {"cpu": allocated_cpu, "memory": "8Gi"},
+            },
+            "conditions": [{"reason": "ClusterReady", "status": ready}],
+        },
+    }
+
+
+@pytest.fixture
+def custom_api():
+    api = MagicMock()
+    api.list_cluster_custom_object.return_value = {
+        "metadata": {"resourceVersion": "10"},
+        "items": [make_cluster("cluster1")],
+    }
+    return api
+
+
+def test_relist_reports_snapshot(custom_api):
+    on_change = MagicMock()
+    watcher = ClusterWatcher(custom_api, on_change)
+
+    watcher.relist()
+
+    clusters, removed, snapshot = on_change.call_args.args
+    assert clusters["cluster1"]["remaining_cpu"] == 2.0
+    assert removed == set()
+    assert snapshot is True
+    assert watcher.resource_version == "10"
+
+
+def test_handle_events_skips_unchanged_clusters(custom_api):
+    on_change = MagicMock()
+    watcher = ClusterWatcher(custom_api, on_change)
+    watcher.relist()
+    on_change.reset_mock()
+
+    # Heartbeat: the status is rewritten, but the capacity is the same
+    watcher.handle_event({"type": "MODIFIED", "object": make_cluster("cluster1")})
+    on_change.assert_not_called()
+
+    watcher.handle_event(
+        {"type": "MODIFIED", "object": make_cluster("cluster1", allocated_cpu="3")}
+    )
+    clusters, _removed, snapshot = on_change.call_args.args
+    assert clusters["cluster1"]["remaining_cpu"] == 1.0
+    assert snapshot is False
+
+    watcher.handle_event(
+        {"type": "DELETED", "object": make_cluster("cluster1", resource_version="12")}
+    )
+    assert on_change.call_args.args == ({}, {"cluster1"}, False)
+    assert watcher.resource_version == "12"
+
+
+def test_relist_reports_clusters_deleted_while_disconnected(custom_api):
+    on_change = MagicMock()
+    watcher = ClusterWatcher(custom_api, on_change)
+    watcher.relist()
+
+    custom_api.list_cluster_custom_object.return_value = {
+        "metadata": {"resourceVersion": "20"},
+        "items": [],
+    }
+    watcher.relist()
+
+    assert on_change.call_args.args == ({}, {"cluster1"}, True)
+
+
+def test_start_retries_initial_list(custom_api):
+    response = custom_api.list_cluster_custom_object.return_value
+    custom_api.list_cluster_custom_object.side_effect = [
+        ConnectionRefusedError("Karmada is not up"),
+        response,
+    ]
+    on_change = MagicMock()
+    watcher = ClusterWatcher(custom_api, on_change, retry_delay=0)
+    watcher._watch_once = lambda: watcher._stop_event.wait(0.01)
+
+    watcher.start()
+    try:
+        for _ in range(100):
+            if on_change.called:
+                break
+            threading.Event().wait(0.01)
+    finally:
+        watcher.stop()
+
+    clusters, _removed, snapshot = on_change.call_args.args
+    assert set(clusters) == {"cluster1"}
+    assert snapshot is True
+
+
+def test_clusters_without_status_are_reported_once_complete(custom_api):
+    joining = {"metadata": {"name": "cluster2", "resourceVersion": "11"}}
+    custom_api.list_cluster_custom_object.return_value["items"].append(joining)
+    on_change = MagicMock()
+    watcher = ClusterWatcher(custom_api, on_change)
+
+    watcher.relist()
+    clusters, _removed, _snapshot = on_change.call_args.args
+    assert set(clusters) == {"cluster1"}
+
+    on_change.reset_mock()
+    watcher.handle_event({"type": "ADDED", "object": joining})
+    on_change.assert_not_called()
+    assert watcher.resource_version == "11"
+
+    watcher.handle_event({"type": "MODIFIED", "object": make_cluster("cluster2")})
+    clusters, _removed, _snapshot = on_change.call_args.args
+    assert set(clusters) == {"cluster2"}
+
+
+def test_watch_survives_unexpected_errors(custom_api):
+    on_change = MagicMock()
+    watcher = ClusterWatcher(custom_api, on_change, retry_delay=0)
+    calls = []
+
+    def watch_once():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("unexpected")
+        watcher._stop_event.wait(0.01)
+
+    watcher._watch_once = watch_once
+
+    watcher.start()
+    try:
+        for _ in range(100):
+            if len(calls) > 1:
+                break
+            threading.Event().wait(0.01)
+    finally:
+        watcher.stop()
+
+    assert len(calls) > 1
+    # Started over from a new list
+    assert custom_api.list_cluster_custom_object.call_count >= 2
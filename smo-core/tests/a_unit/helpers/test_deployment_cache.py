@@ -0,0 +1,148 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from smo_core.helpers.deployment_cache import DeploymentCache
+from smo_core.helpers.karmada_helper import KarmadaHelper
+
+
+def make_deployment(name, replicas, resource_version):
+    deployment = MagicMock()
+    deployment.metadata.name = name
+    deployment.metadata.resource_version = resource_version
+    deployment.spec.replicas = replicas
+    deployment.status.available_replicas = replicas
+    return deployment
+
+
+@pytest.fixture
+def apps_api():
+    api = MagicMock()
+    response = MagicMock()
+    response.items = [make_deployment("svc-a", 1, "10")]
+    response.metadata.resource_version = "10"
+    api.list_namespaced_deployment.return_value = response
+    return api
+
+
+def test_relist(apps_api):
+    cache = DeploymentCache(apps_api, "default")
+
+    cache.relist()
+
+    assert cache.is_synced
+    assert cache.resource_version == "10"
+    assert cache.get("svc-a").deployment.spec.replicas == 1
+
+
+def test_handle_events(apps_api):
+    cache = DeploymentCache(apps_api, "default")
+    cache.relist()
+
+    cache.handle_event(
+        {"type": "MODIFIED", "object": make_deployment("svc-a", 3, "11")}
+    )
+    cache.handle_event({"type": "ADDED", "object": make_deployment("svc-b", 1, "12")})
+    cache.handle_event({"type": "DELETED", "object": make_deployment("svc-a", 3, "13")})
+    cache.handle_event(
+        {
+            "type": "BOOKMARK",
+            "object": None,
+            "raw_object": {"metadata": {"resourceVersion": "20"}},
+        }
+    )
+
+    assert cache.get("svc-a") is None
+    assert cache.get("svc-b").resource_version == "12"
+    assert cache.resource_version == "20"
+
+
+def test_watch_resumes_from_resource_version(apps_api):
+    cache = DeploymentCache(apps_api, "default")
+    cache.relist()
+
+    with patch("smo_core.helpers.deployment_cache.watch.Watch") as mock_watch:
+        mock_watch.return_value.stream.return_value = iter(
+            [{"type": "MODIFIED", "object": make_deployment("svc-a", 2, "11")}]
+        )
+        cache._watch_once()
+
+    kwargs = mock_watch.return_value.stream.call_args.kwargs
+    assert kwargs["resource_version"] == "10"
+    assert cache.get("svc-a").deployment.spec.replicas == 2
+
+
+def test_expired_resource_version_triggers_relist(apps_api):
+    cache = DeploymentCache(apps_api, "default")
+    cache.relist()
+
+    def watch_once():
+        cache._stop_event.set()
+        raise ApiException(status=410, reason="Gone")
+
+    with patch.object(cache, "_watch_once", side_effect=watch_once):
+        cache._stop_event.clear()
+        cache._run()
+
+    # The relist happens before the stop is honored
+    assert apps_api.list_namespaced_deployment.call_count >= 1
+
+
+def test_failed_watch_unsyncs_the_cache(apps_api):
+    cache = DeploymentCache(apps_api, "default", retry_delay=0)
+    cache.relist()
+    synced_during_retry = []
+
+    def watch_once():
+        if not synced_during_retry:
+            synced_during_retry.append(cache.is_synced)
+            raise ConnectionResetError("connection lost")
+        synced_during_retry.append(cache.is_synced)
+        # The watch is back: its events sync the cache again
+        cache.handle_event(
+            {"type": "MODIFIED", "object": make_deployment("svc-a", 2, "11")}
+        )
+        synced_during_retry.append(cache.is_synced)
+        cache._stop_event.set()
+
+    with patch.object(cache, "_watch_once", side_effect=watch_once):
+        cache._stop_event.clear()
+        cache._run()
+
+    assert synced_during_retry == [True, False, True]
+    # The thread ended: the cache is no longer read
+    assert not cache.is_synced
+
+
+def test_watch_thread_dying_unsyncs_the_cache(apps_api):
+    cache = DeploymentCache(apps_api, "default")
+    cache.relist()
+
+    with (
+        patch.object(cache, "_watch_once", side_effect=RuntimeError("boom")),
+        pytest.raises(RuntimeError),
+    ):
+        cache._run()
+
+    assert not cache.is_synced
+
+
+@patch("kubernetes.config.load_kube_config")
+def test_karmada_helper_reads_from_cache(mock_load, apps_api):
+    with (
+        patch("kubernetes.client.CustomObjectsApi"),
+        patch("kubernetes.client.AppsV1Api", return_value=apps_api),
+        patch("smo_core.helpers.deployment_cache.threading.Thread"),
+    ):
+        helper = KarmadaHelper("/tmp/fake.config")
+        helper.start_deployment_cache()
+
+        assert helper.get_replicas("svc-a") == 1
+        assert helper.get_desired_replicas("svc-a") == 1
+        assert helper.get_deployment_freshness("svc-a")["source"] == "cache"
+        apps_api.read_namespaced_deployment.assert_not_called()
+
+        # Unknown deployments fall back to the API server
+        helper.get_replicas("other")
+        apps_api.read_namespaced_deployment.assert_called_once_with("other", "default")
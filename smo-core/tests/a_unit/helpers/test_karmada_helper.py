@@ -2,7 +2,11 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from smo_core.helpers.karmada_helper import KarmadaHelper
+from smo_core.helpers.karmada_helper import (
+    DeploymentStatus,
+    KarmadaHelper,
+    graph_label_selector,
+)
 
 
 @pytest.fixture
@@ -62,3 +66,91 @@ def test_scale_deployment(mock_load, mock_k8s_client):
     helper.scale_deployment("test-deployment", 5)
 
     mock_k8s_client["apps"].patch_namespaced_deployment_scale.assert_called_once()
+
+
+def make_deployment(name, labels=None, cpu="500m", memory="256Mi"):
+    deployment = MagicMock()
+    deployment.metadata.name = name
+    deployment.metadata.labels = labels or {}
+    deployment.spec.replicas = 2
+    deployment.status.available_replicas = 1
+    deployment.spec.template.spec.containers[0].resources.limits = {
+        "cpu": cpu,
+        "memory": memory,
+    }
+    return deployment
+
+
+@patch("kubernetes.config.load_kube_config")
+def test_get_deployments_status(mock_load, mock_k8s_client):
+    labels = {"smo/graph": "g1"}
+    labeled = MagicMock(items=[make_deployment("svc-a", labels)])
+    everything = MagicMock(
+        items=[
+            make_deployment("svc-a", labels),
+            make_deployment("svc-b"),
+            make_deployment("other"),
+        ]
+    )
+    mock_k8s_client["apps"].list_namespaced_deployment.side_effect = [
+        labeled,
+        everything,
+    ]
+
+    helper = KarmadaHelper("/tmp/fake.config")
+    result = helper.get_deployments_status(
+        namespace="proj",
+        label_selector=graph_label_selector("g1"),
+        names=["svc-a", "svc-b"],
+    )
+
+    assert sorted(result) == ["svc-a", "svc-b"]
+    assert result["svc-a"] == DeploymentStatus("svc-a", 2, 1, 0.5, 256 * 1024**2)
+    first_call = mock_k8s_client["apps"].list_namespaced_deployment.call_args_list[0]
+    assert first_call.args == ("proj",)
+    assert first_call.kwargs == {"label_selector": "smo/graph=g1"}
+
+
+@patch("kubernetes.config.load_kube_config")
+def test_get_deployments_status_from_cache(mock_load, mock_k8s_client):
+    helper = KarmadaHelper("/tmp/fake.config")
+    helper.deployment_cache = MagicMock(namespace="default", is_synced=True)
+    helper.deployment_cache.list.return_value = [
+        MagicMock(deployment=make_deployment("svc-a", {"smo/graph": "g1"})),
+        MagicMock(deployment=make_deployment("svc-b", {"smo/graph": "g2"})),
+    ]
+
+    result = helper.get_deployments_status(label_selector="smo/graph=g1")
+
+    assert list(result) == ["svc-a"]
+    mock_k8s_client["apps"].list_namespaced_deployment.assert_not_called()
+
+
+@patch("kubernetes.config.load_kube_config")
+def test_is_ready_on_cluster(mock_load, mock_k8s_client):
+    mock_k8s_client["custom"].get_namespaced_custom_object.return_value = {
+        "status": {
+            "aggregatedStatus": [
+                {
+                    "clusterName": "cluster-1",
+                    "applied": True,
+                    "health": "Healthy",
+                    "status": {"replicas": 2, "availableReplicas": 2},
+                },
+                {
+                    "clusterName": "cluster-2",
+                    "applied": True,
+                    "health": "Unknown",
+                    "status": {"replicas": 2, "availableReplicas": 1},
+                },
+            ]
+        }
+    }
+
+    helper = KarmadaHelper("/tmp/fake.config")
+
+    assert helper.is_ready_on_cluster("svc-a", "cluster-1", "proj")
+    assert not helper.is_ready_on_cluster("svc-a", "cluster-2", "proj")
+    assert not helper.is_ready_on_cluster("svc-a", "cluster-3", "proj")
+    args = mock_k8s_client["custom"].get_namespaced_custom_object.call_args.args
+    assert args[2:] == ("proj", "resourcebindings", "svc-a-deployment")
@@ -0,0 +1,63 @@
+from unittest.mock import patch
+
+import pytest
+
+from smo_core.helpers.karmada_helper import KarmadaHelper
+from smo_core.helpers.kube_client import (
+    KubeClientSettings,
+    TokenBucket,
+    clear_api_clients,
+    get_api_client,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_clients():
+    clear_api_clients()
+    yield
+    clear_api_clients()
+
+
+@patch("kubernetes.config.load_kube_config")
+def test_api_client_is_shared_per_kubeconfig_and_context(mock_load):
+    settings = KubeClientSettings(pool_size=4, qps=None)
+
+    api_client = get_api_client("/tmp/a.config", settings=settings)
+
+    assert get_api_client("/tmp/a.config") is api_client
+    assert get_api_client("/tmp/a.config", context="other") is not api_client
+    assert get_api_client("/tmp/b.config") is not api_client
+    assert mock_load.call_count == 3
+    assert api_client.configuration.connection_pool_maxsize == 4
+    assert api_client.rate_limiter is None
+
+
+@patch("kubernetes.config.load_kube_config")
+def test_helpers_share_the_api_client(mock_load):
+    first = KarmadaHelper("/tmp/fake.config")
+    second = KarmadaHelper("/tmp/fake.config", namespace="other")
+
+    assert first.api_client is second.api_client
+    mock_load.assert_called_once()
+
+
+def test_settings_from_dict():
+    settings = KubeClientSettings.from_dict({"pool_size": 32, "qps": 5})
+
+    assert settings == KubeClientSettings(pool_size=32, qps=5, burst=100)
+    assert KubeClientSettings.from_dict(None) == KubeClientSettings()
+
+
+def test_token_bucket_throttles_after_burst():
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(qps=10, burst=2, clock=lambda: now[0], sleep=sleep)
+    for _ in range(3):
+        bucket.acquire()
+
+    assert sleeps == [pytest.approx(0.1)]
@@ -0,0 +1,83 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.dynamic.exceptions import NotFoundError
+
+from smo_core.helpers.manifest_applier import (
+    ManifestApplier,
+    parse_manifests,
+    resource_ref,
+)
+
+RENDERED = """
+---
+# Source: chart/templates/service.yaml
+apiVersion: v1
+kind: Service
+metadata:
+  name: web
+---
+# Source: chart/templates/deployment.yaml
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: web
+  namespace: other
+---
+"""
+
+
+@pytest.fixture
+def dynamic_client():
+    client = MagicMock()
+    client.resources.get.side_effect = lambda api_version, kind: kind
+    with patch(
+        "smo_core.helpers.manifest_applier.get_dynamic_client", return_value=client
+    ):
+        yield client
+
+
+def test_parse_manifests():
+    manifests = parse_manifests(RENDERED)
+
+    assert [m["kind"] for m in manifests] == ["Service", "Deployment"]
+    assert resource_ref(manifests[0], "ns") == {
+        "apiVersion": "v1",
+        "kind": "Service",
+        "name": "web",
+        "namespace": "ns",
+    }
+    assert resource_ref(manifests[1], "ns")["namespace"] == "other"
+
+
+def test_apply_creates_the_namespace_once_and_prunes(dynamic_client):
+    applier = ManifestApplier(MagicMock())
+    manifests = parse_manifests(RENDERED)
+    stale = {"apiVersion": "v1", "kind": "ConfigMap", "name": "old", "namespace": "ns"}
+
+    refs = applier.apply(manifests, "ns")
+    applier.apply(manifests, "ns", previous=refs + [stale])
+
+    applied = [c.args[0] for c in dynamic_client.server_side_apply.call_args_list]
+    assert applied == ["Namespace", "Service", "Deployment", "Service", "Deployment"]
+    call = dynamic_client.server_side_apply.call_args_list[1]
+    assert call.kwargs["namespace"] == "ns"
+    assert call.kwargs["field_manager"] == "smo"
+    assert call.kwargs["force_conflicts"] is True
+    dynamic_client.delete.assert_called_once_with(
+        "ConfigMap", name="old", namespace="ns"
+    )
+
+
+def test_delete_ignores_missing_resources(dynamic_client):
+    applier = ManifestApplier(MagicMock())
+    refs = [resource_ref(m, "ns") for m in parse_manifests(RENDERED)]
+    dynamic_client.delete.side_effect = NotFoundError(MagicMock(status=404))
+
+    applier.delete(refs)
+
+    # Reverse order: dependents (declared last) first
+    assert [c.args[0] for c in dynamic_client.delete.call_args_list] == [
+        "Deployment",
+        "Service",
+    ]
@@ -2,8 +2,10 @@ import math
 from unittest.mock import MagicMock, patch
 
 import pytest
+import requests
+from kubernetes.client.rest import ApiException
 
-from smo_core.helpers.prometheus_helper import PrometheusHelper
+from smo_core.helpers.prometheus_helper import PrometheusHelper, PrometheusQueryError
 
 
 @pytest.fixture
@@ -25,11 +27,25 @@ def test_get_request_rate_success(mock_requests):
     assert result == 15.5
     mock_requests.assert_called_once_with(
         "http://prometheus/api/v1/query",
-        params={"query": 'sum(rate(http_requests_total{job="test-job"}[1m]))'},
+        params={"query": 'sum(smo:service_request_rate{job="test-job"})'},
         timeout=5,
     )
 
 
+def test_get_request_rate_falls_back_to_raw_counter(mock_requests):
+    empty, rate = MagicMock(), MagicMock()
+    empty.json.return_value = {"data": {"result": []}}
+    rate.json.return_value = {"data": {"result": [{"value": [123, "4"]}]}}
+    mock_requests.side_effect = [empty, rate]
+
+    helper = PrometheusHelper("http://prometheus")
+    result = helper.get_request_rate("svc")
+
+    assert result == 4.0
+    query = mock_requests.call_args.kwargs["params"]["query"]
+    assert query.startswith('sum(rate(flask_http_request_total{service="svc"}')
+
+
 def test_get_request_rate_no_data(mock_requests):
     # Setup empty response
     mock_response = MagicMock()
@@ -43,6 +59,56 @@ def test_get_request_rate_no_data(mock_requests):
     assert math.isnan(result)
 
 
+def test_get_request_rates_by_job(mock_requests):
+    mock_response = MagicMock()
+    mock_response.json.return_value = {
+        "data": {
+            "result": [
+                {"metric": {"job": "svc-a"}, "value": [123, "1.5"]},
+                {"metric": {"job": "svc-b"}, "value": [123, "2"]},
+            ]
+        }
+    }
+    mock_requests.return_value = mock_response
+
+    helper = PrometheusHelper("http://prometheus")
+    result = helper.get_request_rates_by_job(["svc-a", "svc-b"])
+
+    assert result == {"svc-a": 1.5, "svc-b": 2.0}
+    mock_requests.assert_called_once()
+
+
+def test_get_request_rate_history(mock_requests):
+    mock_response = MagicMock()
+    mock_response.json.return_value = {
+        "data": {"result": [{"values": [[100, "1.5"], [130, "2"]]}]}
+    }
+    mock_requests.return_value = mock_response
+
+    helper = PrometheusHelper("http://prometheus")
+    result = helper.get_request_rate_history("svc", 100, 130, 30)
+
+    assert result == [(100.0, 1.5), (130.0, 2.0)]
+    assert mock_requests.call_args.args[0] == "http://prometheus/api/v1/query_range"
+
+
+def test_query_vector_strict_raises_on_errors(mock_requests):
+    rejected = requests.Response()
+    rejected.status_code = 400
+    mock_requests.return_value = rejected
+
+    helper = PrometheusHelper("http://prometheus")
+    assert helper.query_vector("up{") == []
+    with pytest.raises(PrometheusQueryError) as exc_info:
+        helper.query_vector("up{", strict=True)
+    assert exc_info.value.bad_query
+
+    mock_requests.side_effect = requests.ConnectionError("refused")
+    with pytest.raises(PrometheusQueryError) as exc_info:
+        helper.query_vector("up", strict=True)
+    assert not exc_info.value.bad_query
+
+
 @patch("requests.post")
 def test_update_alert_rules(mock_post, mock_requests):
     mock_post.return_value.status_code = 200
@@ -56,7 +122,7 @@ def test_update_alert_rules(mock_post, mock_requests):
         }
 
         # Test
-        helper = PrometheusHelper("http://prometheus")
+        helper = PrometheusHelper("http://prometheus", reload_window=0)
         alert = {
             "alert": "test-alert",
             "annotations": {"description": "test"},
@@ -68,3 +134,115 @@ def test_update_alert_rules(mock_post, mock_requests):
 
         # Verify Kubernetes API was called
         mock_coa.return_value.replace_namespaced_custom_object.assert_called_once()
+
+
+@patch("requests.post")
+def test_update_alert_rules_batch_retries_on_conflict(mock_post, mock_requests):
+    existing = {"alert": "old-alert", "expr": "up == 0"}
+    with (
+        patch("kubernetes.config.load_kube_config"),
+        patch("kubernetes.client.CustomObjectsApi") as mock_coa,
+    ):
+        api = mock_coa.return_value
+        api.get_namespaced_custom_object.side_effect = lambda **kwargs: {
+            "metadata": {"resourceVersion": "1"},
+            "spec": {"groups": [{"name": "smo-alerts", "rules": [dict(existing)]}]},
+        }
+        api.replace_namespaced_custom_object.side_effect = [
+            ApiException(status=409),
+            None,
+        ]
+
+        helper = PrometheusHelper("http://prometheus", reload_window=0)
+        changed = helper.update_alert_rules_batch(
+            add=[{"alert": "a1"}, {"alert": "a2"}], remove=[existing]
+        )
+
+    assert changed
+    assert api.get_namespaced_custom_object.call_count == 2
+    body = api.replace_namespaced_custom_object.call_args.kwargs["body"]
+    assert body["spec"]["groups"][0]["rules"] == [{"alert": "a1"}, {"alert": "a2"}]
+    mock_post.assert_called_once_with("http://prometheus/-/reload", timeout=10)
+
+
+@pytest.fixture
+def rules_api():
+    with (
+        patch("kubernetes.config.load_kube_config"),
+        patch("kubernetes.client.CustomObjectsApi") as mock_coa,
+        patch("requests.post"),
+    ):
+        yield mock_coa.return_value
+
+
+def test_create_graph_rules(rules_api):
+    helper = PrometheusHelper("http://prometheus", reload_window=0)
+
+    assert helper.create_graph_rules("g1", [{"alert": "a1"}])
+
+    body = rules_api.create_namespaced_custom_object.call_args.kwargs["body"]
+    assert body["metadata"]["name"] == "smo-g1"
+    assert body["metadata"]["labels"]["smo/graph"] == "g1"
+    assert body["metadata"]["labels"]["release"] == "kube-prometheus-stack"
+    assert body["spec"]["groups"] == [{"name": "smo-g1", "rules": [{"alert": "a1"}]}]
+
+
+def test_create_graph_rules_with_recording_rules(rules_api):
+    helper = PrometheusHelper("http://prometheus", reload_window=0)
+
+    assert helper.create_graph_rules("g1", [], service_names=["svc-a", "svc.b"])
+
+    body = rules_api.create_namespaced_custom_object.call_args.kwargs["body"]
+    recording = body["spec"]["groups"][1]
+    assert recording["name"] == "smo-g1-recording"
+    assert {rule["record"] for rule in recording["rules"]} == {
+        "smo:service_request_rate"
+    }
+    assert 'service=~"svc\\\\-a|svc\\\\.b"' in recording["rules"][0]["expr"]
+
+
+def test_create_graph_rules_replaces_existing_object(rules_api, capsys):
+    rules_api.create_namespaced_custom_object.side_effect = ApiException(status=409)
+    rules_api.get_namespaced_custom_object.return_value = {
+        "metadata": {"resourceVersion": "7"}
+    }
+    helper = PrometheusHelper("http://prometheus", reload_window=0)
+
+    assert helper.create_graph_rules("g1", [])
+
+    body = rules_api.replace_namespaced_custom_object.call_args.kwargs["body"]
+    assert body["metadata"]["resourceVersion"] == "7"
+    assert "PrometheusRule 'smo-g1' replaced." in capsys.readouterr().out
+
+
+def test_update_graph_alert_rules(rules_api):
+    rules_api.get_namespaced_custom_object.return_value = {
+        "metadata": {"resourceVersion": "1"},
+        "spec": {
+            "groups": [{"name": "smo-g1", "rules": [{"alert": "a1"}, {"record": "r"}]}]
+        },
+    }
+    helper = PrometheusHelper("http://prometheus", reload_window=0)
+
+    assert helper.update_alert_rules_batch(
+        add=[{"alert": "a2"}], remove=[{"alert": "a1"}], graph_name="g1"
+    )
+
+    kwargs = rules_api.replace_namespaced_custom_object.call_args.kwargs
+    assert kwargs["name"] == "smo-g1"
+    assert kwargs["body"]["spec"]["groups"][0]["rules"] == [
+        {"record": "r"},
+        {"alert": "a2"},
+    ]
+
+
+def test_delete_graph_rules(rules_api):
+    helper = PrometheusHelper("http://prometheus", reload_window=0)
+
+    assert helper.delete_graph_rules("g1")
+    assert rules_api.delete_namespaced_custom_object.call_args.kwargs["name"] == (
+        "smo-g1"
+    )
+
+    rules_api.delete_namespaced_custom_object.side_effect = ApiException(status=404)
+    assert not helper.delete_graph_rules("g1")
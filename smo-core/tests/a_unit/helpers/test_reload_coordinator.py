@@ -0,0 +1,66 @@
+import threading
+from unittest.mock import MagicMock
+
+from smo_core.helpers.reload_coordinator import ReloadCoordinator
+
+
+def test_requests_within_window_trigger_a_single_reload():
+    reloaded = threading.Event()
+    reload = MagicMock(side_effect=lambda: reloaded.set() or True)
+    coordinator = ReloadCoordinator(reload, window=0.05)
+
+    for _ in range(5):
+        coordinator.request()
+
+    assert reloaded.wait(timeout=2)
+    assert reload.call_count == 1
+    assert [r.updates for r in coordinator.history] == [5]
+    assert coordinator.pending == 0
+
+
+def test_zero_window_reloads_immediately():
+    reload = MagicMock(return_value=False)
+    records = []
+    coordinator = ReloadCoordinator(reload, window=0, on_reload=records.append)
+
+    coordinator.request()
+    coordinator.request()
+
+    assert reload.call_count == 2
+    assert [(r.updates, r.success) for r in records] == [(1, False), (1, False)]
+
+
+def test_flush_reloads_pending_requests_now():
+    reload = MagicMock(return_value=True)
+    coordinator = ReloadCoordinator(reload, window=60)
+
+    coordinator.request()
+    coordinator.request()
+    record = coordinator.flush()
+
+    assert record.updates == 2
+    reload.assert_called_once()
+    # Nothing left to reload
+    assert coordinator.flush() is None
+    reload.assert_called_once()
+
+
+def test_requests_during_a_reload_wait_for_the_next_window():
+    coordinator = None
+    delays = []
+
+    def reload():
+        # A request made while the reload runs is scheduled a window later
+        coordinator.request()
+        delays.append(coordinator._timer.interval)
+        coordinator._timer.cancel()
+        return True
+
+    coordinator = ReloadCoordinator(reload, window=60)
+    coordinator.request()
+    coordinator.flush()  # The first window starts here
+    coordinator._last_reload -= 120  # ...then two windows elapse
+    coordinator.request()
+    coordinator.flush()
+
+    assert delays[1] > 59
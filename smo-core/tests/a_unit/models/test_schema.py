@@ -0,0 +1,106 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from smo_core.models import Graph, Service, init_db, upgrade_schema
+
+# The graph and service tables as created before the columns of ADDED_COLUMNS
+PRE_SERIES_SCHEMA = [
+    """
+    CREATE TABLE graph (
+        id INTEGER NOT NULL PRIMARY KEY,
+        name VARCHAR(255) NOT NULL UNIQUE,
+        status VARCHAR(255) NOT NULL,
+        project VARCHAR(255) NOT NULL,
+        grafana VARCHAR(255),
+        graph_descriptor JSON NOT NULL,
+        placement JSON
+    )
+    """,
+    """
+    CREATE TABLE service (
+        id INTEGER NOT NULL PRIMARY KEY,
+        name VARCHAR(255) NOT NULL UNIQUE,
+        status VARCHAR(255),
+        grafana VARCHAR(255),
+        cluster_affinity VARCHAR(255),
+        artifact_ref VARCHAR(255),
+        artifact_type VARCHAR(255),
+        artifact_implementer VARCHAR(255),
+        cpu VARCHAR(255),
+        memory VARCHAR(255),
+        storage VARCHAR(255),
+        gpu VARCHAR(255),
+        values_overwrite JSON,
+        alert JSON,
+        graph_id INTEGER NOT NULL REFERENCES graph (id)
+    )
+    """,
+    """
+    INSERT INTO graph (id, name, status, project, graph_descriptor)
+    VALUES (1, 'g1', 'Running', 'p', '{}')
+    """,
+    """
+    INSERT INTO service (id, name, status, graph_id)
+    VALUES (1, 's1', 'Running', 1)
+    """,
+]
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'smo.db'}")
+    with engine.begin() as connection:
+        for statement in PRE_SERIES_SCHEMA:
+            connection.execute(text(statement))
+    return engine
+
+
+def test_init_db_adds_the_missing_columns(engine):
+    init_db(engine)
+
+    inspector = inspect(engine)
+    service_columns = {c["name"] for c in inspector.get_columns("service")}
+    graph_columns = {c["name"] for c in inspector.get_columns("graph")}
+    assert {"applied_digest", "triggered_at", "trigger_latency"} <= service_columns
+    assert "deploy_state" in graph_columns
+    # The tables added since are created
+    assert "job" in inspector.get_table_names()
+
+    with sessionmaker(bind=engine)() as session:
+        graph = session.query(Graph).filter_by(name="g1").one()
+        service = session.query(Service).filter_by(name="s1").one()
+        # The existing rows are kept
+        assert graph.deploy_state is None
+        assert service.applied_digest is None
+
+        graph.deploy_state = {"step": "services"}
+        service.applied_digest = "a" * 64
+        service.triggered_at = datetime(2026, 1, 1)
+        service.trigger_latency = 1.5
+        session.commit()
+
+    with sessionmaker(bind=engine)() as session:
+        assert session.query(Graph).one().deploy_state == {"step": "services"}
+        service = session.query(Service).one()
+        assert service.applied_digest == "a" * 64
+        assert service.triggered_at == datetime(2026, 1, 1)
+        assert service.trigger_latency == 1.5
+
+
+def test_upgrade_schema_is_idempotent(engine):
+    assert upgrade_schema(engine) == [
+        "service.applied_digest",
+        "service.triggered_at",
+        "service.trigger_latency",
+        "graph.deploy_state",
+    ]
+    assert upgrade_schema(engine) == []
+
+
+def test_upgrade_schema_skips_missing_tables(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'empty.db'}")
+
+    assert upgrade_schema(engine) == []
@@ -0,0 +1,94 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from smo_core.models import ServiceCapacity
+from smo_core.services.calibration_service import CalibrationService
+
+
+@pytest.fixture
+def mock_karmada_helper():
+    helper = MagicMock()
+    helper.get_cpu_limit.return_value = 1.0
+    return helper
+
+
+@pytest.fixture
+def mock_prom_helper():
+    helper = MagicMock()
+    # 1 replica handles 20 RPS at 50% CPU, 2 replicas 60 RPS at 75% CPU
+    helper.get_request_rate_history.return_value = [(100, 10.0), (130, 60.0)]
+    helper.get_cpu_usage_history.return_value = [(100, 0.5), (130, 1.5)]
+    helper.get_replicas_history.return_value = [(100, 1), (130, 2)]
+    return helper
+
+
+def test_refresh_fits_and_persists(db_session, mock_karmada_helper, mock_prom_helper):
+    service = CalibrationService(
+        db_session, mock_karmada_helper, mock_prom_helper, min_samples=1
+    )
+
+    result = service.refresh(["svc"], now=200)
+
+    assert result["svc"] == pytest.approx((60, -40))
+    capacity = service.get_capacity("svc")
+    assert capacity.alpha == pytest.approx(60)
+    assert capacity.last_sample_at == 130
+
+
+def test_refresh_ignores_unusable_fits(
+    db_session, mock_karmada_helper, mock_prom_helper
+):
+    service = CalibrationService(db_session, mock_karmada_helper, mock_prom_helper)
+
+    # Too few samples
+    assert service.refresh(["svc"], now=200) == {"svc": None}
+
+    # Capacity decreasing with the replicas (noisy samples)
+    mock_prom_helper.get_request_rate_history.return_value = [(160, 60.0), (190, 10.0)]
+    mock_prom_helper.get_cpu_usage_history.return_value = [(160, 0.75), (190, 0.5)]
+    mock_prom_helper.get_replicas_history.return_value = [(160, 1), (190, 2)]
+    service = CalibrationService(
+        db_session, mock_karmada_helper, mock_prom_helper, min_samples=1
+    )
+    assert service.refresh(["noisy"], now=300) == {"noisy": None}
+    assert service.get_coefficients(["noisy"]) == ([1], [0])
+
+
+def test_refresh_is_incremental(db_session, mock_karmada_helper, mock_prom_helper):
+    db_session.add(ServiceCapacity(service_name="svc", last_sample_at=130))
+    db_session.commit()
+    service = CalibrationService(db_session, mock_karmada_helper, mock_prom_helper)
+
+    service.refresh(["svc"], now=300)
+
+    start = mock_prom_helper.get_request_rate_history.call_args.args[1]
+    assert start == 130 + service.step
+
+
+def test_refresh_waits_for_lagging_series(
+    db_session, mock_karmada_helper, mock_prom_helper
+):
+    # The replica count at 130 is not scraped yet
+    mock_prom_helper.get_replicas_history.return_value = [(100, 1)]
+    service = CalibrationService(db_session, mock_karmada_helper, mock_prom_helper)
+
+    service.refresh(["svc"], now=200)
+
+    assert service.get_capacity("svc").last_sample_at == 100
+
+
+def test_get_coefficients_falls_back_to_defaults(db_session):
+    db_session.add(ServiceCapacity(service_name="fitted", alpha=2.0, beta=1.0))
+    db_session.add(ServiceCapacity(service_name="negative", alpha=-2.0, beta=50.0))
+    db_session.commit()
+    service = CalibrationService(db_session, MagicMock(), MagicMock())
+
+    alpha, beta = service.get_coefficients(
+        ["fitted", "other", "unknown", "negative"],
+        default_alpha={"other": 5.0},
+        default_beta={"other": -1.0},
+    )
+
+    assert alpha == [2.0, 5.0, 1, 1]
+    assert beta == [1.0, -1.0, 0, 0]
@@ -94,7 +94,7 @@ def test_fetch_clusters_existing_cluster(
     existing_cluster = Cluster(
         name="cluster1", available_cpu=5.0, available_ram="5.00 GiB", availability=False
     )
-    mock_db_session.scalars.return_value.first.return_value = existing_cluster
+    mock_db_session.scalars.return_value.all.return_value = [existing_cluster]
 
     # Setup service
     service = ClusterService(
@@ -109,3 +109,62 @@ def test_fetch_clusters_existing_cluster(
     assert len(result) == 1
     assert result[0]["available_cpu"] == 10.0  # Updated from mock
     mock_db_session.add.assert_not_called()  # Shouldn't add existing cluster
+
+
+def make_cluster_service(db_session, mock_grafana_helper):
+    return ClusterService(
+        db_session=db_session,
+        karmada_helper=MagicMock(),
+        grafana_helper=mock_grafana_helper,
+        config={"grafana": {"host": "http://grafana"}},
+    )
+
+
+CLUSTER1_INFO = {
+    "remaining_cpu": 10.0,
+    "remaining_memory_bytes": "10.00 GiB",
+    "availability": True,
+}
+
+
+def test_sync_clusters_only_reports_changes(db_session, mock_grafana_helper):
+    service = make_cluster_service(db_session, mock_grafana_helper)
+
+    events = service.sync_clusters({"cluster1": CLUSTER1_INFO})
+    assert events == [{"type": "added", "cluster": "cluster1", "changes": {}}]
+
+    assert service.sync_clusters({"cluster1": CLUSTER1_INFO}) == []
+
+    events = service.sync_clusters(
+        {"cluster1": {**CLUSTER1_INFO, "remaining_cpu": 4.0}}
+    )
+    assert events == [
+        {
+            "type": "updated",
+            "cluster": "cluster1",
+            "changes": {"available_cpu": [10.0, 4.0]},
+        }
+    ]
+    assert service.get_cluster("cluster1").available_cpu == 4.0
+    mock_grafana_helper.publish_dashboard.assert_called_once()
+
+
+def test_sync_clusters_marks_removed_clusters_unavailable(
+    db_session, mock_grafana_helper
+):
+    service = make_cluster_service(db_session, mock_grafana_helper)
+    service.sync_clusters({"cluster1": CLUSTER1_INFO, "cluster2": CLUSTER1_INFO})
+
+    events = service.sync_clusters({}, removed={"cluster1"})
+    assert events == [
+        {
+            "type": "removed",
+            "cluster": "cluster1",
+            "changes": {"availability": [True, False]},
+        }
+    ]
+
+    # A snapshot without cluster2 removes it too, cluster1 is not reported again
+    events = service.sync_clusters({}, snapshot=True)
+    assert [e["cluster"] for e in events] == ["cluster2"]
+    assert not service.get_cluster("cluster2").availability
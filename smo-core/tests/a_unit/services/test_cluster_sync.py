@@ -0,0 +1,61 @@
+from unittest.mock import MagicMock
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from smo_core.models.base import Base
+from smo_core.models.cluster import Cluster
+from smo_core.services.cluster_sync import ClusterInventorySync
+
+CLUSTER_INFO = {
+    "remaining_cpu": 10.0,
+    "remaining_memory_bytes": "10.00 GiB",
+    "availability": True,
+}
+
+
+def test_apply_changes_writes_db_and_notifies_listeners():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+
+    grafana = MagicMock()
+    grafana.publish_dashboard.return_value = {"url": "/d/test"}
+    listener = MagicMock()
+    cluster_sync = ClusterInventorySync(
+        MagicMock(),
+        grafana,
+        {"grafana": {"host": "http://grafana"}},
+        session_factory,
+        listeners=[listener],
+    )
+
+    cluster_sync.apply_changes({"cluster1": CLUSTER_INFO}, set(), True)
+
+    assert cluster_sync.is_synced
+    listener.assert_called_once_with(
+        [{"type": "added", "cluster": "cluster1", "changes": {}}]
+    )
+    with session_factory() as session:
+        cluster = session.query(Cluster).filter_by(name="cluster1").one()
+        assert cluster.available_cpu == 10.0
+
+
+def test_apply_changes_resyncs_on_db_error():
+    engine = create_engine("sqlite:///:memory:")  # No tables
+    listener = MagicMock()
+    cluster_sync = ClusterInventorySync(
+        MagicMock(),
+        MagicMock(),
+        {"grafana": {"host": "http://grafana"}},
+        sessionmaker(bind=engine),
+        listeners=[listener],
+    )
+    cluster_sync.watcher = MagicMock()
+
+    events = cluster_sync.apply_changes({"cluster1": CLUSTER_INFO}, set(), True)
+
+    assert events == []
+    assert not cluster_sync.is_synced
+    cluster_sync.watcher.resync.assert_called_once()
+    listener.assert_not_called()
@@ -1,9 +1,14 @@
+import subprocess
 from unittest.mock import MagicMock, patch
 
 import pytest
+import yaml
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
 
-from smo_core.models import Cluster, Graph, Service
-from smo_core.services.graph_service import GraphService
+from smo_core.models import Cluster, Graph, Release, Service
+from smo_core.models.base import Base
+from smo_core.services.graph_service import GraphService, values_digest
 
 
 @pytest.fixture
@@ -18,6 +23,7 @@ def mock_db_session():
 def mock_karmada_helper():
     helper = MagicMock()
     helper.get_replicas.return_value = 1
+    helper.get_deployments_status.return_value = {}
     return helper
 
 
@@ -145,6 +151,17 @@ def test_deploy_graph_new_graph(
     mock_db_session.commit.assert_called()
     mock_grafana_helper.publish_dashboard.assert_called()
 
+    # The deployments of the graph are labeled through the Helm values
+    services = [
+        c.args[0]
+        for c in mock_db_session.add.call_args_list
+        if isinstance(c.args[0], Service)
+    ]
+    assert services[0].values_overwrite["commonLabels"] == {
+        "smo/graph": "test-graph",
+        "smo/project": "test-project",
+    }
+
 
 def test_start_graph(mock_db_session, mock_karmada_helper, mock_prom_helper, mocker):
     # Setup test graph with stopped service
@@ -356,3 +373,396 @@ def test_trigger_placement(mock_db_session, mock_karmada_helper):
     # Verify
     assert graph.placement is not None
     mock_db_session.commit.assert_called()
+
+
+def test_helm_install_artifact_passes_values_on_stdin(mock_db_session, mocker):
+    service = GraphService(
+        db_session=mock_db_session,
+        karmada_helper=MagicMock(),
+        grafana_helper=MagicMock(),
+        prom_helper=MagicMock(),
+        config={"karmada_kubeconfig": "/tmp/kubeconfig"},
+    )
+    run_helm = mocker.patch(
+        "smo_core.services.graph_service.run_helm", return_value="Mock helm output"
+    )
+
+    service._helm_install_artifact(
+        "test-service", "test-image", {"key": "value"}, "test-namespace", "install"
+    )
+
+    args = run_helm.call_args.args
+    assert args[args.index("--values") + 1] == "-"
+    assert run_helm.call_args.kwargs["input"] == "key: value\n"
+
+
+def test_apply_services_skips_unchanged_services(mock_db_session, mocker):
+    graph = Graph(name="test-graph", project="test-project", status="Running")
+    unchanged = Service(name="svc-a", artifact_ref="chart-a", values_overwrite={"a": 1})
+    unchanged.applied_digest = values_digest("chart-a", {"a": 1})
+    changed = Service(name="svc-b", artifact_ref="chart-b", values_overwrite={"b": 2})
+    changed.applied_digest = values_digest("chart-b", {"b": 1})
+    graph.services = [unchanged, changed]
+    run_helm = mocker.patch(
+        "smo_core.services.graph_service.run_helm", return_value="Mock helm output"
+    )
+    service = GraphService(
+        db_session=mock_db_session,
+        karmada_helper=MagicMock(),
+        grafana_helper=MagicMock(),
+        prom_helper=MagicMock(),
+        config={"karmada_kubeconfig": "/tmp/kubeconfig"},
+    )
+
+    results = service._apply_services(graph, graph.services, "upgrade")
+
+    assert all(result.ok for result in results.values())
+    run_helm.assert_called_once()
+    assert run_helm.call_args.args[1] == "svc-b"
+    assert changed.applied_digest == values_digest("chart-b", {"b": 2})
+
+
+def test_native_engine_renders_once_and_applies(mock_db_session, mocker):
+    graph = Graph(name="test-graph", project="test-project", status="Running")
+    svc = Service(name="svc-a", artifact_ref="chart-a", values_overwrite={"a": 1})
+    graph.services = [svc]
+    rendered = "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: svc-a\n"
+    run_helm = mocker.patch(
+        "smo_core.services.graph_service.run_helm", return_value=rendered
+    )
+    mock_db_session.scalars.return_value.first.return_value = None
+    karmada_helper = MagicMock()
+    service = GraphService(
+        db_session=mock_db_session,
+        karmada_helper=karmada_helper,
+        grafana_helper=MagicMock(),
+        prom_helper=MagicMock(),
+        config={"karmada_kubeconfig": "/tmp/kubeconfig", "helm": {"engine": "native"}},
+    )
+
+    results = service._apply_services(graph, graph.services, "install")
+
+    assert results["svc-a"].ok
+    assert run_helm.call_args.args[0] == "template"
+    manifests = [
+        {"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": "svc-a"}}
+    ]
+    karmada_helper.manifest_applier.apply.assert_called_once_with(
+        manifests, "test-project", []
+    )
+    release = mock_db_session.add.call_args.args[0]
+    assert isinstance(release, Release)
+    assert (release.name, release.status, release.revision) == ("svc-a", "deployed", 1)
+    assert release.digest == values_digest("chart-a", {"a": 1})
+
+    # Re-applied (e.g. after a stop) from the recorded manifests, without helm
+    run_helm.reset_mock()
+    release.status = "uninstalled"
+    svc.applied_digest = None
+    mock_db_session.scalars.return_value.first.return_value = release
+
+    assert service._apply_services(graph, graph.services, "install")["svc-a"].ok
+    run_helm.assert_not_called()
+    assert release.revision == 2
+
+
+def test_native_engine_uninstall_deletes_the_release_resources(mock_db_session, mocker):
+    graph = Graph(name="test-graph", project="test-project", status="Running")
+    graph.services = [Service(name="svc-a", status="Deployed")]
+    release = Release(
+        name="svc-a",
+        namespace="test-project",
+        status="deployed",
+        manifests=[
+            {"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": "c"}}
+        ],
+    )
+    mock_db_session.scalars.return_value.first.return_value = release
+    run_helm = mocker.patch("smo_core.services.graph_service.run_helm")
+    karmada_helper = MagicMock()
+    service = GraphService(
+        db_session=mock_db_session,
+        karmada_helper=karmada_helper,
+        grafana_helper=MagicMock(),
+        prom_helper=MagicMock(),
+        config={"karmada_kubeconfig": "/tmp/kubeconfig", "helm": {"engine": "native"}},
+    )
+
+    results = service._helm_uninstall_graph(graph)
+
+    assert results["svc-a"].ok
+    run_helm.assert_not_called()
+    karmada_helper.manifest_applier.delete.assert_called_once_with(
+        [
+            {
+                "apiVersion": "v1",
+                "kind": "ConfigMap",
+                "name": "c",
+                "namespace": "test-project",
+            }
+        ]
+    )
+    assert release.status == "uninstalled"
+
+
+def test_conditional_services_are_staged_then_applied_on_trigger(
+    mock_db_session, mocker, capsys
+):
+    graph = Graph(name="test-graph", project="test-project", status="Running")
+    svc = Service(
+        name="svc-a", status="Pending", artifact_ref="chart-a", values_overwrite={}
+    )
+    svc.graph = graph
+    rendered = "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: svc-a\n"
+    run_helm = mocker.patch(
+        "smo_core.services.graph_service.run_helm", return_value=rendered
+    )
+    mock_db_session.scalars.return_value.first.return_value = None
+    karmada_helper = MagicMock()
+    service = GraphService(
+        db_session=mock_db_session,
+        karmada_helper=karmada_helper,
+        grafana_helper=MagicMock(),
+        prom_helper=MagicMock(),
+        config={"karmada_kubeconfig": "/tmp/kubeconfig", "helm": {"engine": "native"}},
+    )
+
+    service._stage_services(graph, [svc])
+
+    assert run_helm.call_args.args[0] == "template"
+    karmada_helper.manifest_applier.apply.assert_not_called()
+    release = mock_db_session.add.call_args.args[0]
+    assert (release.status, release.revision) == ("staged", 0)
+
+    # On trigger, the staged manifests are applied without running helm
+    run_helm.reset_mock()
+    mock_db_session.scalars.return_value.first.return_value = release
+    service._deploy_pending_service(svc)
+
+    run_helm.assert_not_called()
+    karmada_helper.manifest_applier.apply.assert_called_once()
+    assert (svc.status, release.status, release.revision) == ("Deployed", "deployed", 1)
+    assert svc.trigger_latency is not None
+    assert "(staged," in capsys.readouterr().out
+
+
+def _static_descriptor(services: dict[str, dict]) -> dict:
+    """A graph descriptor with static placement, for services given by name and values."""
+    return {
+        "id": "test-graph",
+        "hdaGraphIntent": {"useStaticPlacement": True},
+        "services": [
+            {
+                "id": name,
+                "artifact": {
+                    "ociImage": f"chart-{name}",
+                    "ociConfig": {"implementer": "HELM", "type": "App"},
+                    "valuesOverwrite": values,
+                },
+                "deployment": {
+                    "intent": {"compute": {"gpu": {"enabled": "False"}}},
+                    "trigger": {},
+                },
+            }
+            for name, values in services.items()
+        ],
+    }
+
+
+def _sqlite_graph_service() -> GraphService:
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    grafana_helper = MagicMock()
+    grafana_helper.publish_dashboard.return_value = {"url": "/d/test"}
+    return GraphService(
+        db_session=sessionmaker(bind=engine)(),
+        karmada_helper=MagicMock(),
+        grafana_helper=grafana_helper,
+        prom_helper=MagicMock(),
+        config={"grafana": {"host": "http://grafana"}, "karmada_kubeconfig": "k"},
+    )
+
+
+def test_failed_deploy_resumes_from_the_failed_step(mocker):
+    descriptor = _static_descriptor({"svc-a": {}, "svc-b": {}})
+    service = _sqlite_graph_service()
+    grafana_helper = service.grafana_helper
+    prom_helper = service.prom_helper
+
+    def failing_helm(command, name, *args, **kwargs):
+        if name == "svc-b":
+            raise subprocess.SubprocessError("install failed")
+        return "ok"
+
+    run_helm = mocker.patch(
+        "smo_core.services.graph_service.run_helm", side_effect=failing_helm
+    )
+    with pytest.raises(subprocess.SubprocessError):
+        service.deploy_graph("test-project", descriptor)
+
+    graph = service.get_graph("test-graph")
+    assert graph.status == "Failed"
+    assert graph.deploy_state["failed_step"] == "install"
+    assert "rules" in graph.deploy_state["completed"]
+    assert {s.name: s.status for s in graph.services} == {
+        "svc-a": "Deployed",
+        "svc-b": "Not deployed",
+    }
+
+    # The retry only installs the failed service, and redoes nothing else
+    run_helm.reset_mock(side_effect=True)
+    run_helm.return_value = "ok"
+    service.deploy_graph("test-project", descriptor)
+
+    assert graph.status == "Running"
+    assert [c.args[1] for c in run_helm.call_args_list] == ["svc-b"]
+    prom_helper.create_graph_rules.assert_called_once()
+    # Two service dashboards, and the graph dashboard
+    assert grafana_helper.publish_dashboard.call_count == 3
+    assert "failed_step" not in graph.deploy_state
+
+    with pytest.raises(ValueError, match="already exists"):
+        service.deploy_graph("test-project", descriptor)
+
+
+def test_failed_rule_write_is_retried_on_resume(mocker):
+    descriptor = _static_descriptor({"svc-a": {}})
+    service = _sqlite_graph_service()
+    prom_helper = service.prom_helper
+    prom_helper.manages_rules = True
+    prom_helper.create_graph_rules.return_value = False
+    run_helm = mocker.patch(
+        "smo_core.services.graph_service.run_helm", return_value="ok"
+    )
+
+    with pytest.raises(RuntimeError, match="PrometheusRule"):
+        service.deploy_graph("test-project", descriptor)
+
+    graph = service.get_graph("test-graph")
+    assert graph.status == "Failed"
+    assert graph.deploy_state["failed_step"] == "rules"
+    assert "rules" not in graph.deploy_state["completed"]
+    run_helm.assert_not_called()
+
+    prom_helper.create_graph_rules.return_value = True
+    service.deploy_graph("test-project", descriptor)
+
+    assert graph.status == "Running"
+    assert prom_helper.create_graph_rules.call_count == 2
+    assert "rules" in graph.deploy_state["completed"]
+
+
+def test_update_graph_only_acts_on_changed_services(mocker):
+    service = _sqlite_graph_service()
+    run_helm = mocker.patch(
+        "smo_core.services.graph_service.run_helm", return_value="ok"
+    )
+    service.deploy_graph(
+        "test-project",
+        _static_descriptor({"svc-a": {"replicas": 1}, "svc-b": {}, "svc-c": {}}),
+    )
+    run_helm.reset_mock()
+    service.prom_helper.reset_mock()
+    service.grafana_helper.reset_mock()
+
+    diff = service.update_graph(
+        "test-graph",
+        _static_descriptor({"svc-a": {"replicas": 2}, "svc-b": {}, "svc-d": {}}),
+    )
+
+    assert diff == {
+        "added": ["svc-d"],
+        "removed": ["svc-c"],
+        "changed": ["svc-a"],
+        "unchanged": ["svc-b"],
+    }
+    # svc-b is neither uninstalled nor upgraded
+    assert sorted((c.args[0], c.args[1]) for c in run_helm.call_args_list) == [
+        ("install", "svc-d"),
+        ("uninstall", "svc-c"),
+        ("upgrade", "svc-a"),
+    ]
+    graph = service.get_graph("test-graph")
+    assert {s.name: s.status for s in graph.services} == {
+        "svc-a": "Deployed",
+        "svc-b": "Deployed",
+        "svc-d": "Deployed",
+    }
+    svc_a = next(s for s in graph.services if s.name == "svc-a")
+    assert svc_a.values_overwrite["replicas"] == 2
+    assert [s["id"] for s in graph.graph_descriptor["services"]] == [
+        "svc-a",
+        "svc-b",
+        "svc-d",
+    ]
+    service.prom_helper.create_graph_rules.assert_called_once()
+
+    # Updating to the same descriptor does nothing
+    run_helm.reset_mock()
+    service.update_graph(
+        "test-graph",
+        _static_descriptor({"svc-a": {"replicas": 2}, "svc-b": {}, "svc-d": {}}),
+    )
+    run_helm.assert_not_called()
+
+
+def test_placement_changes_move_services_make_before_break(mocker):
+    service = _sqlite_graph_service()
+    session = service.db_session
+    graph = Graph(
+        name="test-graph",
+        project="test-project",
+        status="Running",
+        graph_descriptor={
+            "id": "test-graph",
+            "services": [
+                {
+                    "id": "front",
+                    "deployment": {"intent": {"connectionPoints": ["back"]}},
+                },
+                {"id": "back", "deployment": {"intent": {"connectionPoints": []}}},
+            ],
+        },
+    )
+    for name, imports in [("front", []), ("back", ["c1"])]:
+        values = {"clustersAffinity": ["c1"], "serviceImportClusters": imports}
+        graph.services.append(
+            Service(
+                name=name,
+                status="Deployed",
+                cluster_affinity="c1",
+                artifact_ref=f"chart-{name}",
+                values_overwrite=values,
+                applied_digest=values_digest(f"chart-{name}", values),
+            )
+        )
+    session.add(graph)
+    session.commit()
+    service.karmada_helper.is_ready_on_cluster.return_value = True
+    run_helm = mocker.patch(
+        "smo_core.services.graph_service.run_helm", return_value="ok"
+    )
+
+    # front moves to c2, back stays on c1
+    service._apply_placement_changes(graph, [[0, 1], [1, 0]], {"names": ["c1", "c2"]})
+
+    applied = [
+        (call.args[1], yaml.safe_load(call.kwargs["input"]))
+        for call in run_helm.call_args_list
+    ]
+    assert [
+        (name, values["clustersAffinity"], values["serviceImportClusters"])
+        for name, values in applied
+    ] == [
+        ("front", ["c1", "c2"], []),
+        ("back", ["c1"], ["c1", "c2"]),
+        ("front", ["c2"], []),
+        # The old cluster is only dropped from the imports once front moved
+        ("back", ["c1"], ["c2"]),
+    ]
+    service.karmada_helper.is_ready_on_cluster.assert_called_with(
+        "front", "c2", "test-project"
+    )
+    front = next(s for s in graph.services if s.name == "front")
+    assert front.cluster_affinity == "c2"
+    assert graph.placement == [[0, 1], [1, 0]]
@@ -0,0 +1,133 @@
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from smo_core.models.base import Base
+from smo_core.services.job_service import (
+    FAILED,
+    QUEUED,
+    RUNNING,
+    SUCCEEDED,
+    JobService,
+    utcnow,
+)
+from smo_core.services.job_worker import JobWorker
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)
+
+
+def test_jobs_of_a_graph_run_one_at_a_time(session_factory):
+    with session_factory() as session:
+        jobs = JobService(session)
+        first = jobs.enqueue("deploy", "g1", "p", {"descriptor": {}})
+        second = jobs.enqueue("start", "g1")
+        other = jobs.enqueue("stop", "g2")
+
+        assert jobs.claim_next("w1").id == first.id
+        # The second job of g1 waits for the first one
+        assert jobs.claim_next("w2").id == other.id
+        assert jobs.claim_next("w3") is None
+
+        jobs.complete(first.id, "w1")
+        claimed = jobs.claim_next("w3")
+        assert (claimed.id, claimed.status, claimed.worker) == (
+            second.id,
+            RUNNING,
+            "w3",
+        )
+        assert claimed.attempts == 1
+
+
+def test_failed_jobs_are_retried_with_backoff(session_factory):
+    with session_factory() as session:
+        jobs = JobService(session)
+        job = jobs.enqueue("start", "g1", max_attempts=2)
+
+        jobs.claim_next("w1")
+        job = jobs.fail(job.id, "w1", "boom", retry_delay=60)
+        assert job.status == QUEUED
+        assert job.available_at > utcnow() + timedelta(seconds=50)
+        # Not due yet
+        assert jobs.claim_next("w1") is None
+
+        job.available_at = utcnow()
+        session.commit()
+        assert jobs.claim_next("w1").attempts == 2
+        job = jobs.fail(job.id, "w1", "boom again")
+        assert (job.status, job.error) == (FAILED, "boom again")
+
+        # Manual retry
+        assert jobs.retry(job.id).status == QUEUED
+        assert jobs.claim_next("w1").id == job.id
+        with pytest.raises(ValueError):
+            jobs.retry(job.id)
+
+
+def test_jobs_of_dead_workers_are_requeued(session_factory):
+    with session_factory() as session:
+        jobs = JobService(session)
+        job = jobs.enqueue("stop", "g1", max_attempts=2)
+        jobs.claim_next("w1")
+        job.heartbeat_at = utcnow() - timedelta(seconds=600)
+        session.commit()
+
+        assert jobs.requeue_stale(timeout=300) == 1
+        assert jobs.get_job(job.id).status == QUEUED
+
+
+def test_only_the_worker_running_a_job_finishes_it(session_factory):
+    with session_factory() as session:
+        jobs = JobService(session)
+        job = jobs.enqueue("stop", "g1", max_attempts=2)
+        jobs.claim_next("w1")
+        # w1 is considered dead, and w2 runs the job again
+        job.heartbeat_at = utcnow() - timedelta(seconds=600)
+        session.commit()
+        jobs.requeue_stale(timeout=300)
+        job.available_at = utcnow()
+        session.commit()
+        assert jobs.claim_next("w2").id == job.id
+
+        # w1 completes late: its outcome is ignored
+        assert jobs.complete(job.id, "w1") is None
+        assert jobs.fail(job.id, "w1", "boom") is None
+        assert (jobs.get_job(job.id).status, jobs.get_job(job.id).worker) == (
+            RUNNING,
+            "w2",
+        )
+
+        assert jobs.complete(job.id, "w2").status == SUCCEEDED
+        # Already finished
+        assert jobs.complete(job.id, "w2") is None
+
+
+def test_worker_runs_the_graph_operation(session_factory):
+    with session_factory() as session:
+        jobs = JobService(session)
+        ok = jobs.enqueue("start", "g1")
+        ko = jobs.enqueue("stop", "g2")
+        ok_id, ko_id = ok.id, ko.id
+    worker = JobWorker(MagicMock(), MagicMock(), MagicMock(), {}, session_factory)
+
+    with patch("smo_core.services.job_worker.GraphService") as graph_service:
+        graph_service.return_value.stop_graph.side_effect = ValueError("Not found")
+        assert worker.run_once("w1")
+        assert worker.run_once("w1")
+        assert not worker.run_once("w1")
+
+    graph_service.return_value.start_graph.assert_called_once_with("g1")
+    with session_factory() as session:
+        jobs = JobService(session)
+        assert jobs.get_job(ok_id).status == SUCCEEDED
+        assert (jobs.get_job(ko_id).status, jobs.get_job(ko_id).error) == (
+            FAILED,
+            "Not found",
+        )
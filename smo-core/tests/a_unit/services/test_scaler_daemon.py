@@ -0,0 +1,145 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from smo_core.models import ScalingPolicy
+from smo_core.services.scaler_daemon import (
+    ScalerDaemon,
+    load_policies_from_db,
+    load_policies_from_yaml,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_policy(name, **kwargs):
+    data = {
+        "target_deployment": name,
+        "up_threshold": 10,
+        "down_threshold": 2,
+        "up_replicas": 3,
+        "down_replicas": 1,
+    }
+    data.update(kwargs)
+    return ScalingPolicy.from_dict(data)
+
+
+@pytest.fixture
+def mock_karmada_helper():
+    helper = MagicMock()
+    helper.get_desired_replicas_in_namespace.return_value = {"svc-a": 1, "svc-b": 1}
+    return helper
+
+
+@pytest.fixture
+def mock_prometheus_helper():
+    helper = MagicMock()
+    helper.get_request_rates_by_job.return_value = {"svc-a": 20.0, "svc-b": 5.0}
+    return helper
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+def test_tick_batches_reads_and_scales(
+    mock_karmada_helper, mock_prometheus_helper, executor
+):
+    clock = FakeClock()
+    daemon = ScalerDaemon(
+        mock_karmada_helper,
+        mock_prometheus_helper,
+        [make_policy("svc-a"), make_policy("svc-b")],
+        clock=clock,
+    )
+
+    clock.now = 15
+    results = daemon.tick(executor)
+
+    assert results[("default", "svc-a")]["action"] == "scale_up"
+    assert results[("default", "svc-b")]["action"] == "none"
+    mock_prometheus_helper.get_request_rates_by_job.assert_called_once()
+    mock_karmada_helper.get_desired_replicas_in_namespace.assert_called_once_with(
+        "default"
+    )
+    mock_karmada_helper.scale_deployment.assert_called_once_with(
+        "svc-a", 3, namespace="default"
+    )
+
+
+def test_tick_respects_per_target_intervals(
+    mock_karmada_helper, mock_prometheus_helper, executor
+):
+    clock = FakeClock()
+    daemon = ScalerDaemon(
+        mock_karmada_helper,
+        mock_prometheus_helper,
+        [
+            make_policy("svc-a", poll_interval=10),
+            make_policy("svc-b", poll_interval=30),
+        ],
+        clock=clock,
+    )
+
+    clock.now = 10
+    assert set(daemon.tick(executor)) == {("default", "svc-a")}
+    assert daemon.next_run_time() == 20
+
+    clock.now = 30
+    assert set(daemon.tick(executor)) == {("default", "svc-a"), ("default", "svc-b")}
+
+
+def test_tick_respects_cooldown(mock_karmada_helper, mock_prometheus_helper, executor):
+    clock = FakeClock()
+    daemon = ScalerDaemon(
+        mock_karmada_helper,
+        mock_prometheus_helper,
+        [make_policy("svc-a", poll_interval=10, cooldown_period=60)],
+        clock=clock,
+    )
+
+    clock.now = 10
+    daemon.tick(executor)
+    clock.now = 20
+    results = daemon.tick(executor)
+
+    assert results[("default", "svc-a")]["reason"] == "In cooldown period."
+    assert mock_karmada_helper.scale_deployment.call_count == 1
+
+
+def test_load_policies_from_yaml(tmp_path):
+    path = tmp_path / "policies.yaml"
+    path.write_text(
+        "policies:\n"
+        "  - target_deployment: svc-a\n"
+        "    up_threshold: 10\n"
+        "    down_threshold: 2\n"
+        "    up_replicas: 3\n"
+        "    down_replicas: 1\n"
+        "    poll_interval: 5\n"
+    )
+
+    policies = load_policies_from_yaml(path)
+
+    assert len(policies) == 1
+    assert policies[0].key == ("default", "svc-a")
+    assert policies[0].poll_interval == 5
+
+
+def test_load_policies_from_db(db_session):
+    db_session.add(make_policy("svc-a"))
+    db_session.add(make_policy("svc-b", enabled=False))
+    db_session.commit()
+
+    policies = load_policies_from_db(db_session)
+
+    assert [p.target_deployment for p in policies] == ["svc-a"]
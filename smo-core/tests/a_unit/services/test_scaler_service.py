@@ -12,6 +12,7 @@ def mock_karmada_helper():
     mock_deployment.spec.replicas = 2
     mock_deployment.status.available_replicas = 2
     helper.v1_api_client.read_namespaced_deployment.return_value = mock_deployment
+    helper.get_desired_replicas.return_value = 2
     return helper
 
 
@@ -106,3 +107,31 @@ def test_scaler_service_run_iteration(mock_karmada_helper, mock_prometheus_helpe
 
     assert "action" in result
     assert "reason" in result
+
+
+def test_run_queueing_scaler_iteration_scale_up(
+    mock_karmada_helper, mock_prometheus_helper
+):
+    mock_prometheus_helper.get_request_rate_by_job.return_value = 25.0
+    scaler_service = ScalerService(mock_karmada_helper, mock_prometheus_helper)
+
+    result = scaler_service.run_queueing_scaler_iteration(
+        "test-deployment", "default", capacity_table=[8.0, 18.0, 28.0, 38.0]
+    )
+
+    assert result["action"] == "scale_up"
+    assert result["new_replicas"] == 3
+    mock_karmada_helper.scale_deployment.assert_called_once_with("test-deployment", 3)
+
+
+def test_run_queueing_scaler_iteration_no_change(
+    mock_karmada_helper, mock_prometheus_helper
+):
+    scaler_service = ScalerService(mock_karmada_helper, mock_prometheus_helper)
+
+    result = scaler_service.run_queueing_scaler_iteration(
+        "test-deployment", "default", capacity_table=[8.0, 18.0, 28.0]
+    )
+
+    assert result["action"] == "none"
+    mock_karmada_helper.scale_deployment.assert_not_called()
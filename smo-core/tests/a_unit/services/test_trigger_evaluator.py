@@ -0,0 +1,138 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from smo_core.helpers.prometheus_helper import PrometheusQueryError
+from smo_core.models import Graph, Service
+from smo_core.models.base import Base
+from smo_core.services.trigger_evaluator import (
+    TriggerEvaluator,
+    build_trigger_query,
+    parse_duration,
+)
+
+
+def test_parse_duration():
+    assert parse_duration("2m") == 120
+    assert parse_duration("1m30s") == 90
+    assert parse_duration("500ms") == 0.5
+    assert parse_duration(None) == 0
+    with pytest.raises(ValueError):
+        parse_duration("2 minutes")
+
+
+def test_build_trigger_query():
+    query = build_trigger_query({"a": "up > 1", "b": "x"})
+
+    assert query == (
+        'label_replace((up > 1), "smo_service", "a", "", "") '
+        'or label_replace((x), "smo_service", "b", "", "")'
+    )
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    with session_factory() as session:
+        graph = Graph(name="g1", project="p", status="Running", graph_descriptor={})
+        session.add(graph)
+        session.flush()
+        for name, status in [("svc-a", "Pending"), ("svc-b", "Deployed")]:
+            session.add(
+                Service(
+                    name=name,
+                    graph_id=graph.id,
+                    status=status,
+                    values_overwrite={},
+                    alert={"alert": "e1", "expr": "up > 1", "for": "1m"},
+                )
+            )
+        session.commit()
+    return session_factory
+
+
+def test_evaluate_applies_grace_period_then_deploys(session_factory):
+    now = [1000.0]
+    prometheus = MagicMock()
+    prometheus.query_vector.return_value = [({"smo_service": "svc-a"}, 1.0)]
+    on_trigger = MagicMock()
+    evaluator = TriggerEvaluator(
+        MagicMock(),
+        MagicMock(),
+        prometheus,
+        {"karmada_kubeconfig": "kubeconfig"},
+        session_factory,
+        clock=lambda: now[0],
+        on_trigger=on_trigger,
+    )
+
+    with patch("smo_core.services.graph_service.run_helm") as run_helm:
+        assert evaluator.evaluate() == []
+        now[0] += 61
+        assert evaluator.evaluate() == ["svc-a"]
+
+    run_helm.assert_called_once()
+    on_trigger.assert_called_once_with("svc-a", 61)
+    # Only the pending service is evaluated
+    query = prometheus.query_vector.call_args.args[0]
+    assert '"svc-a"' in query and '"svc-b"' not in query
+    with session_factory() as session:
+        service = session.query(Service).filter_by(name="svc-a").one()
+        assert service.status == "Deployed"
+        # The grace period ended 1s before the evaluation
+        assert 1.0 <= service.trigger_latency < 5.0
+
+
+def test_evaluate_resets_grace_period_when_condition_stops(session_factory):
+    now = [1000.0]
+    prometheus = MagicMock()
+    evaluator = TriggerEvaluator(
+        MagicMock(), MagicMock(), prometheus, {}, session_factory, clock=lambda: now[0]
+    )
+
+    prometheus.query_vector.return_value = [({"smo_service": "svc-a"}, 1.0)]
+    evaluator.evaluate()
+    prometheus.query_vector.return_value = []
+    now[0] += 30
+    evaluator.evaluate()
+
+    assert evaluator.active_since == {}
+
+
+def test_evaluate_keeps_grace_period_when_prometheus_is_down(session_factory):
+    now = [1000.0]
+    prometheus = MagicMock()
+    evaluator = TriggerEvaluator(
+        MagicMock(), MagicMock(), prometheus, {}, session_factory, clock=lambda: now[0]
+    )
+
+    prometheus.query_vector.return_value = [({"smo_service": "svc-a"}, 1.0)]
+    evaluator.evaluate()
+    prometheus.query_vector.side_effect = PrometheusQueryError("down")
+    now[0] += 30
+    with pytest.raises(PrometheusQueryError):
+        evaluator.evaluate()
+
+    assert evaluator.active_since == {"svc-a": 1000.0}
+
+
+def test_firing_services_falls_back_to_single_conditions():
+    def query_vector(query, strict=False):
+        if "bad(" in query:
+            raise PrometheusQueryError("parse error", bad_query=True)
+        return [
+            ({"smo_service": name}, 1.0) for name in ("a", "b") if f'"{name}"' in query
+        ]
+
+    prometheus = MagicMock()
+    prometheus.query_vector.side_effect = query_vector
+    evaluator = TriggerEvaluator(MagicMock(), MagicMock(), prometheus, {}, MagicMock())
+
+    firing, failed = evaluator.firing_services({"a": "up", "b": "up", "c": "bad("})
+
+    assert firing == {"a", "b"}
+    assert failed == {"c"}
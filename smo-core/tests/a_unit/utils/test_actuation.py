@@ -0,0 +1,82 @@
+from unittest.mock import MagicMock
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from smo_core.utils.actuation import (
+    FAILED,
+    RATE_LIMITED,
+    SCALED,
+    UNCHANGED,
+    ScalingActuator,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def karmada_helper():
+    return MagicMock()
+
+
+def test_apply_skips_unchanged(karmada_helper):
+    actuator = ScalingActuator(karmada_helper)
+    actuator.observe("svc-a", 2)
+    actuator.observe("svc-b", 1)
+
+    results = actuator.apply({"svc-a": 2, "svc-b": 3})
+
+    assert results == {"svc-a": UNCHANGED, "svc-b": SCALED}
+    karmada_helper.scale_deployment.assert_called_once_with("svc-b", 3)
+
+    # The new value is now the observed one
+    assert actuator.apply({"svc-b": 3}) == {"svc-b": UNCHANGED}
+    actuator.close()
+
+
+def test_apply_rate_limits_and_coalesces(karmada_helper):
+    clock = FakeClock()
+    actuator = ScalingActuator(karmada_helper, min_interval=30, clock=clock)
+    actuator.observe("svc", 1)
+
+    assert actuator.apply({"svc": 2}) == {"svc": SCALED}
+
+    clock.now = 10
+    assert actuator.apply({"svc": 3}) == {"svc": RATE_LIMITED}
+    clock.now = 20
+    assert actuator.apply({"svc": 4}) == {"svc": RATE_LIMITED}
+
+    # Only the latest desired value is applied once the interval is over
+    clock.now = 31
+    assert actuator.apply({}) == {"svc": SCALED}
+    assert karmada_helper.scale_deployment.call_count == 2
+    karmada_helper.scale_deployment.assert_called_with("svc", 4)
+    actuator.close()
+
+
+def test_apply_global_write_budget(karmada_helper):
+    clock = FakeClock()
+    actuator = ScalingActuator(karmada_helper, max_writes_per_second=2, clock=clock)
+
+    results = actuator.apply({"a": 1, "b": 1, "c": 1})
+
+    assert sorted(results.values()) == [RATE_LIMITED, SCALED, SCALED]
+
+    clock.now = 1
+    assert list(actuator.apply({}).values()) == [SCALED]
+    actuator.close()
+
+
+def test_apply_failed_write_is_retried(karmada_helper):
+    karmada_helper.scale_deployment.side_effect = [ApiException(500, "boom"), None]
+    actuator = ScalingActuator(karmada_helper)
+
+    assert actuator.apply({"svc": 2}) == {"svc": FAILED}
+    assert actuator.apply({}) == {"svc": SCALED}
+    actuator.close()
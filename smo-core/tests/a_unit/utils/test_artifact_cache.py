@@ -0,0 +1,131 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from smo_core.utils.artifact_cache import ArtifactCache, artifact_cache_from_config
+
+REF = "oci://registry/test/chart:1.0"
+
+
+def fake_helm_pull(content: bytes):
+    def run_helm(command, ref, flag, destination, *args, timeout=None):
+        assert (command, flag) == ("pull", "--destination")
+        (Path(destination) / "chart-1.0.tgz").write_bytes(content)
+        return ""
+
+    return run_helm
+
+
+def test_get_chart_pulls_once(tmp_path):
+    cache = ArtifactCache(tmp_path)
+
+    with patch(
+        "smo_core.utils.artifact_cache.run_helm", side_effect=fake_helm_pull(b"chart")
+    ) as run_helm:
+        path = cache.get_chart(REF, plain_http=True)
+        assert cache.get_chart(REF) == path
+
+    run_helm.assert_called_once()
+    assert "--plain-http" in run_helm.call_args.args
+    assert path.read_bytes() == b"chart"
+    # The index survives the process
+    assert ArtifactCache(tmp_path).index == cache.index
+
+
+def test_tag_refs_expire_but_pinned_refs_do_not(tmp_path):
+    now = [1000.0]
+    cache = ArtifactCache(tmp_path, tag_ttl=60, clock=lambda: now[0])
+    pinned = "oci://registry/test/chart@sha256:abcd"
+
+    with patch(
+        "smo_core.utils.artifact_cache.run_helm", side_effect=fake_helm_pull(b"chart")
+    ) as run_helm:
+        cache.get_chart(REF)
+        cache.get_chart(pinned)
+        now[0] += 61
+        cache.get_chart(REF)
+        cache.get_chart(pinned)
+
+    assert [c.args[1] for c in run_helm.call_args_list] == [REF, pinned, REF]
+
+
+def test_hits_do_not_rewrite_the_index(tmp_path):
+    cache = ArtifactCache(tmp_path)
+    with patch(
+        "smo_core.utils.artifact_cache.run_helm", side_effect=fake_helm_pull(b"chart")
+    ):
+        cache.get_chart(REF)
+
+    with patch.object(cache, "_write_index") as write_index:
+        cache.get_chart(REF)
+
+    write_index.assert_not_called()
+
+
+def test_processes_sharing_a_cache_keep_each_others_entries(tmp_path):
+    cache_a, cache_b = ArtifactCache(tmp_path), ArtifactCache(tmp_path)
+    other = "oci://registry/test/other:1.0"
+
+    with patch(
+        "smo_core.utils.artifact_cache.run_helm", side_effect=fake_helm_pull(b"a")
+    ):
+        cache_a.get_chart(REF)
+    with patch(
+        "smo_core.utils.artifact_cache.run_helm", side_effect=fake_helm_pull(b"b")
+    ) as run_helm:
+        cache_b.get_chart(other)
+        # Pulled by the other process
+        assert cache_b.get_chart(REF).read_bytes() == b"a"
+
+    run_helm.assert_called_once()
+    assert set(ArtifactCache(tmp_path).index) == {f"chart:{REF}", f"chart:{other}"}
+
+
+def test_lru_eviction(tmp_path):
+    now = [1000.0]
+    cache = ArtifactCache(tmp_path, max_bytes=10, clock=lambda: now[0])
+
+    for i, name in enumerate(["a", "b", "c"]):
+        now[0] += 1
+        with patch(
+            "smo_core.utils.artifact_cache.run_helm",
+            side_effect=fake_helm_pull(str(i).encode() * 4),
+        ):
+            cache.get_chart(f"oci://registry/{name}:1")
+        if name == "b":
+            # Use "a" again, so that "b" is the least recently used
+            now[0] += 1
+            cache.get_chart("oci://registry/a:1")
+
+    assert set(cache.index) == {"chart:oci://registry/a:1", "chart:oci://registry/c:1"}
+    assert cache.size == 8
+
+
+def test_descriptors_are_parsed_once(tmp_path):
+    cache = ArtifactCache(tmp_path)
+
+    def run_hdarctl(command, ref, untar, flag, destination, timeout=None):
+        (Path(destination) / "hdag.yaml").write_text("hdaGraph:\n  id: g1\n")
+        return ""
+
+    with patch(
+        "smo_core.utils.artifact_cache.run_hdarctl", side_effect=run_hdarctl
+    ) as mock:
+        assert cache.get_descriptor(REF) == {"hdaGraph": {"id": "g1"}}
+        assert cache.get_descriptor(REF) == {"hdaGraph": {"id": "g1"}}
+
+    mock.assert_called_once()
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_artifact_cache_from_config(tmp_path, enabled):
+    config = {"artifact_cache": {"enabled": enabled, "dir": str(tmp_path)}}
+
+    cache = artifact_cache_from_config(config)
+
+    if enabled:
+        assert cache is artifact_cache_from_config(config)
+        assert cache.root == tmp_path
+    else:
+        assert cache is None
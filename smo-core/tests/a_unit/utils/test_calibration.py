@@ -0,0 +1,71 @@
+import pytest
+
+from smo_core.utils.calibration import (
+    LinearFit,
+    capacity_samples,
+    last_common_timestamp,
+)
+
+
+def test_linear_fit_recovers_coefficients():
+    fit = LinearFit()
+    for replicas in [1, 2, 3, 4]:
+        fit.add(replicas, 30 * replicas + 10)
+
+    alpha, beta = fit.coefficients()
+    assert alpha == pytest.approx(30)
+    assert beta == pytest.approx(10)
+
+
+def test_linear_fit_single_replica_count_goes_through_origin():
+    fit = LinearFit()
+    fit.add(2, 40)
+    fit.add(2, 60)
+
+    assert fit.coefficients() == pytest.approx((25, 0))
+
+
+def test_linear_fit_empty():
+    assert LinearFit().coefficients() is None
+
+
+def test_linear_fit_rejects_unusable_fits():
+    fit = LinearFit()
+    for replicas in [1, 2, 3]:
+        fit.add(replicas, 100 - 20 * replicas)
+    # Capacity decreasing with the replicas
+    assert fit.coefficients() is None
+
+    fit = LinearFit()
+    fit.add(1, 30)
+    fit.add(2, 60)
+    assert fit.coefficients(min_weight=3) is None
+    assert fit.coefficients(min_weight=2) == pytest.approx((30, 0))
+
+
+def test_linear_fit_decay_favors_recent_samples():
+    fit = LinearFit()
+    for _ in range(50):
+        fit.add(1, 10, decay=0.5)
+    for _ in range(50):
+        fit.add(1, 20, decay=0.5)
+
+    alpha, _beta = fit.coefficients()
+    assert alpha == pytest.approx(20, rel=1e-3)
+
+
+def test_capacity_samples():
+    rates = [(0, 10.0), (30, 20.0), (60, 1.0)]
+    cpu = [(0, 0.5), (30, 1.0), (60, 0.05)]
+    replicas = [(0, 1), (30, 2), (60, 2)]
+
+    samples = capacity_samples(rates, cpu, replicas, cpu_limit=1.0)
+
+    # 1 replica at 50% => 20 RPS capacity, 2 replicas at 50% => 40 RPS capacity,
+    # the last sample is mostly idle and is discarded.
+    assert samples == [(0, 1, 20.0), (30, 2, 40.0)]
+
+
+def test_last_common_timestamp():
+    assert last_common_timestamp([(1, 0), (2, 0), (3, 0)], [(1, 0), (2, 0)]) == 2
+    assert last_common_timestamp([(1, 0)], [(2, 0)]) is None
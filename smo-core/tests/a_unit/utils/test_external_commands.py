@@ -0,0 +1,81 @@
+import asyncio
+import subprocess
+import sys
+import time
+
+import pytest
+
+from smo_core.utils.external_commands import run_command_async
+
+
+def python(code: str) -> list[str]:
+    return [sys.executable, "-c", code]
+
+
+def test_run_command_async_captures_output():
+    lines = []
+
+    result = asyncio.run(
+        run_command_async(
+            python("import sys; print('out'); print('err', file=sys.stderr)"),
+            on_output=lambda name, line: lines.append((name, line)),
+        )
+    )
+
+    assert result.ok
+    assert result.returncode == 0
+    assert (result.stdout, result.stderr) == ("out", "err")
+    assert sorted(lines) == [("stderr", "err"), ("stdout", "out")]
+    assert result.duration > 0
+
+
+def test_run_command_async_input():
+    # Larger than the pipe buffers, echoed back while it is written
+    data = "x" * 99 + "\n"
+    data *= 10_000
+
+    result = asyncio.run(
+        run_command_async(
+            python("import sys; sys.stdout.write(sys.stdin.read())"), input=data
+        )
+    )
+
+    assert result.ok
+    assert result.stdout == data.strip()
+
+
+def test_run_command_async_failure():
+    result = asyncio.run(run_command_async(python("import sys; sys.exit(3)")))
+
+    assert not result.ok
+    assert result.returncode == 3
+    with pytest.raises(subprocess.SubprocessError, match="return code 3"):
+        result.check()
+
+
+def test_run_command_async_timeout_kills_command():
+    start = time.monotonic()
+    result = asyncio.run(
+        run_command_async(python("import time; time.sleep(30)"), timeout=0.5)
+    )
+
+    assert result.timed_out
+    assert result.returncode is None
+    assert time.monotonic() - start < 10
+    with pytest.raises(subprocess.TimeoutExpired):
+        result.check()
+
+
+def test_run_command_async_cancellation_kills_command():
+    async def main():
+        task = asyncio.create_task(
+            run_command_async(python("import time; time.sleep(30)"))
+        )
+        await asyncio.sleep(0.5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    start = time.monotonic()
+    asyncio.run(main())
+    assert time.monotonic() - start < 10
@@ -0,0 +1,115 @@
+import subprocess
+import threading
+
+import pytest
+
+from smo_core.utils.lifecycle import (
+    FAILED,
+    OK,
+    SKIPPED,
+    LifecycleExecutor,
+    execution_waves,
+    raise_for_failures,
+    service_dependencies,
+)
+
+DESCRIPTOR = [
+    {
+        "id": "compression",
+        "deployment": {
+            "trigger": {"auto": {"dependencies": []}},
+            "intent": {"connectionPoints": ["noise-reduction"]},
+        },
+    },
+    {
+        "id": "noise-reduction",
+        "deployment": {
+            "trigger": {"auto": {"dependencies": []}},
+            "intent": {"connectionPoints": ["detection"]},
+        },
+    },
+    {
+        "id": "detection",
+        "deployment": {"trigger": {"auto": {}}, "intent": {"connectionPoints": []}},
+    },
+    {
+        "id": "dashboard",
+        "deployment": {
+            "trigger": {"auto": {"dependencies": ["detection"]}},
+            "intent": {},
+        },
+    },
+]
+
+
+def test_service_dependencies():
+    assert service_dependencies(DESCRIPTOR) == {
+        "compression": {"noise-reduction"},
+        "noise-reduction": {"detection"},
+        "detection": set(),
+        "dashboard": {"detection"},
+    }
+
+
+def test_execution_waves():
+    dependencies = service_dependencies(DESCRIPTOR)
+    names = ["compression", "noise-reduction", "detection", "dashboard"]
+
+    assert execution_waves(names, dependencies) == [
+        ["detection"],
+        ["noise-reduction", "dashboard"],
+        ["compression"],
+    ]
+    # Dependencies outside of the given services are ignored
+    assert execution_waves(["compression"], dependencies) == [["compression"]]
+
+
+def test_execution_waves_with_cycle():
+    assert execution_waves(["a", "b", "c"], {"a": {"b"}, "b": {"a"}}) == [
+        ["c"],
+        ["a", "b"],
+    ]
+
+
+def test_executor_runs_waves_in_order():
+    order = []
+    lock = threading.Lock()
+
+    def operation(name):
+        def run():
+            with lock:
+                order.append(name)
+            return f"{name} done"
+
+        return run
+
+    names = ["compression", "noise-reduction", "detection", "dashboard"]
+    results = LifecycleExecutor(max_workers=4).run(
+        {name: operation(name) for name in names},
+        service_dependencies(DESCRIPTOR),
+    )
+
+    assert all(result.status == OK for result in results.values())
+    assert results["detection"].output == "detection done"
+    assert order[0] == "detection"
+    assert order[-1] == "compression"
+
+
+def test_executor_skips_dependents_of_failed_services():
+    def fail():
+        raise subprocess.SubprocessError("helm failed")
+
+    operations = {
+        "compression": lambda: "",
+        "noise-reduction": lambda: "",
+        "detection": fail,
+        "dashboard": lambda: "",
+    }
+    results = LifecycleExecutor().run(operations, service_dependencies(DESCRIPTOR))
+
+    assert results["detection"].status == FAILED
+    assert results["detection"].error == "helm failed"
+    assert {results[n].status for n in ("compression", "noise-reduction")} == {SKIPPED}
+    assert results["dashboard"].status == SKIPPED
+    with pytest.raises(subprocess.SubprocessError, match="4 of 4"):
+        raise_for_failures(results)
@@ -0,0 +1,77 @@
+import threading
+import time
+
+from smo_core.utils.lifecycle import FAILED, OK
+from smo_core.utils.migration import Migration, MigrationExecutor
+
+
+def test_migration_is_make_before_break():
+    applied = []
+    executor = MigrationExecutor(
+        apply=lambda name, clusters, imports: applied.append((name, clusters, imports)),
+        is_ready=lambda name, cluster: True,
+    )
+
+    results = executor.run(
+        [Migration("front", "c1", "c2", peers=("back",))],
+        clusters={"front": ["c1"], "back": ["c1"]},
+        import_clusters={"front": [], "back": ["c1"]},
+    )
+
+    assert results["front"].status == OK
+    assert applied == [
+        ("front", ["c1", "c2"], []),  # Running on both clusters
+        ("back", ["c1"], ["c1", "c2"]),  # Reachable from the new cluster
+        ("front", ["c2"], []),  # Removed from the old one
+    ]
+    assert executor.placement("back") == (["c1"], ["c1", "c2"])
+
+
+def test_migration_not_ready_is_rolled_back():
+    applied = []
+    executor = MigrationExecutor(
+        apply=lambda name, clusters, imports: applied.append((name, clusters)),
+        is_ready=lambda name, cluster: False,
+        readiness_timeout=0.05,
+        poll_interval=0.01,
+    )
+
+    results = executor.run(
+        [Migration("front", "c1", "c2")], {"front": ["c1"]}, {"front": []}
+    )
+
+    assert results["front"].status == FAILED
+    assert "not ready" in results["front"].error
+    assert applied == [("front", ["c1", "c2"]), ("front", ["c1"])]
+
+
+def test_migrations_respect_the_concurrency_limit():
+    lock = threading.Lock()
+    waiting = 0
+    max_waiting = 0
+
+    def is_ready(name, cluster):
+        nonlocal waiting, max_waiting
+        with lock:
+            waiting += 1
+            max_waiting = max(max_waiting, waiting)
+        time.sleep(0.02)
+        with lock:
+            waiting -= 1
+        return True
+
+    executor = MigrationExecutor(
+        apply=lambda name, clusters, imports: None,
+        is_ready=is_ready,
+        max_concurrent=2,
+    )
+    names = [f"svc-{i}" for i in range(6)]
+
+    results = executor.run(
+        [Migration(name, "c1", "c2") for name in names],
+        {name: ["c1"] for name in names},
+        {},
+    )
+
+    assert all(result.ok for result in results.values())
+    assert max_waiting == 2
@@ -0,0 +1,62 @@
+import math
+
+import pytest
+
+from smo_core.utils.queueing import (
+    capacity_table,
+    erlang_c,
+    min_replicas,
+    replicas_for_rate,
+    waiting_time,
+)
+
+
+def test_erlang_c_single_server_is_utilization():
+    # For M/M/1, the probability of waiting is the utilization
+    assert erlang_c(1, 0.7) == pytest.approx(0.7)
+
+
+def test_erlang_c_known_value():
+    # Classic call-center example: 10 agents, 8 Erlangs
+    assert erlang_c(10, 8) == pytest.approx(0.409, abs=1e-3)
+
+
+def test_erlang_c_bounds():
+    assert erlang_c(3, 0) == 0.0
+    assert erlang_c(3, 3) == 1.0
+
+
+def test_waiting_time_mm1_mean():
+    # M/M/1: Wq = rho / (mu - lambda)
+    assert waiting_time(5, 10, 1) == pytest.approx(0.5 / 5)
+
+
+def test_waiting_time_unstable():
+    assert waiting_time(20, 10, 2) == math.inf
+
+
+def test_waiting_time_percentile_above_mean_tail():
+    mean = waiting_time(8, 10, 1)
+    p95 = waiting_time(8, 10, 1, percentile=0.95)
+    assert p95 > mean
+
+
+@pytest.mark.parametrize(
+    "arrival_rate, expected",
+    [(0, 1), (2, 1), (5, 2), (18, 3), (45, 6)],
+)
+def test_min_replicas(arrival_rate, expected):
+    assert min_replicas(arrival_rate, 10, target_wait=0.05) == expected
+
+
+def test_capacity_table_is_consistent_with_min_replicas():
+    table = capacity_table(10, target_wait=0.05, maximum_replicas=8)
+
+    assert len(table) == 8
+    assert table == sorted(table)
+    for rate in [1, 9, 18, 33, 45]:
+        assert replicas_for_rate(table, rate) == min_replicas(rate, 10, 0.05)
+
+
+def test_replicas_for_rate_out_of_table():
+    assert replicas_for_rate([5.0, 12.0], 20) is None
@@ -1,6 +1,17 @@
 from unittest.mock import patch
 
-from smo_core.utils.scaling import decide_replicas, scaling_loop
+import pytest
+
+from smo_core.helpers.karmada_helper import DeploymentStatus
+from smo_core.utils.scaling import (
+    RequestRateForecaster,
+    backtest_forecaster,
+    decide_replicas,
+    forecast_lead_time_from_intent,
+    minimum_replicas_from_tables,
+    predict_request_rates,
+    scaling_loop,
+)
 
 
 def test_decide_replicas_feasible():
@@ -111,18 +122,44 @@ def test_decide_replicas_minimum_replicas_constraint():
     assert solution == [1], "Minimum replicas should be at least 1"
 
 
+def test_decide_replicas_with_queueing_model():
+    solution = decide_replicas(
+        request_rates=[50, 80],
+        previous_replicas=[1, 1],
+        cpu_limits=[0.5, 1],
+        acceleration=[False, False],
+        alpha=None,
+        beta=None,
+        cluster_capacity=10,
+        cluster_acceleration=False,
+        maximum_replicas=[10, 10],
+        min_replicas=[4, 2],
+    )
+
+    assert solution == [4, 2]
+
+
+def test_minimum_replicas_from_tables():
+    tables = [[10.0, 25.0, 40.0], [10.0]]
+
+    assert minimum_replicas_from_tables(tables, [20, 50]) == [2, 2]
+
+
 def test_scaling_loop(mocker):
     """Test the scaling loop function."""
     mock_karmada = mocker.MagicMock()
-    mock_karmada.get_replicas.return_value = 1
-    mock_karmada.get_cpu_limit.return_value = 0.5
+    mock_karmada.get_deployments_status.return_value = {
+        "svc1": DeploymentStatus("svc1", 1, 1, 0.5, None)
+    }
 
     mock_prom = mocker.MagicMock()
-    mock_prom.get_request_rate.return_value = 10.0
+    mock_prom.get_request_rate.return_value = 30.0  # Needs 2 replicas
 
     mock_stop = mocker.MagicMock()
     mock_stop.is_set.side_effect = [False, True]  # Run one iteration then stop
 
+    mocker.patch("smo_core.utils.scaling.PrometheusHelper", return_value=mock_prom)
+
     # Mock KarmadaHelper to avoid loading kubeconfig
     with patch("smo_core.utils.scaling.KarmadaHelper") as mock_karmada_helper:
         mock_karmada_helper.return_value = mock_karmada
@@ -143,4 +180,144 @@ def test_scaling_loop(mocker):
                 mock_stop,
             )
 
-            mock_karmada.scale_deployment.assert_called_once()
+            mock_karmada.scale_deployment.assert_called_once_with("svc1", 2)
+            mock_karmada.get_deployments_status.assert_called_with(
+                label_selector="smo/graph=test-graph", names=["svc1"]
+            )
+
+
+def test_scaling_loop_skips_unchanged_replicas(mocker):
+    mock_karmada = mocker.MagicMock()
+    mock_karmada.get_deployments_status.return_value = {
+        "svc1": DeploymentStatus("svc1", 1, 1, 0.5, None)
+    }
+
+    mock_stop = mocker.MagicMock()
+    mock_stop.is_set.side_effect = [False, True]
+
+    mocker.patch("smo_core.utils.scaling.KarmadaHelper", return_value=mock_karmada)
+    mock_prom = mocker.patch("smo_core.utils.scaling.PrometheusHelper").return_value
+    mock_prom.get_request_rate.return_value = 10.0  # 1 replica is enough
+    mocker.patch("smo_core.utils.scaling.time.sleep")
+
+    scaling_loop(
+        "test-graph",
+        [False],
+        [20],
+        [5],
+        10.0,
+        False,
+        [5],
+        ["svc1"],
+        5,
+        "/tmp/kubeconfig",
+        "http://prometheus",
+        mock_stop,
+    )
+
+    mock_karmada.scale_deployment.assert_not_called()
+
+
+def test_scaling_loop_observes_replicas_at_each_tick(mocker):
+    mock_karmada = mocker.MagicMock()
+    # Scaled to 2 replicas by someone else after the first tick
+    mock_karmada.get_deployments_status.side_effect = [
+        {"svc1": DeploymentStatus("svc1", 1, 1, 0.5, None)},
+        {"svc1": DeploymentStatus("svc1", 2, 2, 0.5, None)},
+        {"svc1": DeploymentStatus("svc1", 2, 2, 0.5, None)},
+    ]
+
+    mock_stop = mocker.MagicMock()
+    mock_stop.is_set.side_effect = [False, False, True]
+
+    mocker.patch("smo_core.utils.scaling.KarmadaHelper", return_value=mock_karmada)
+    mock_prom = mocker.patch("smo_core.utils.scaling.PrometheusHelper").return_value
+    mock_prom.get_request_rate.return_value = 10.0  # 1 replica is enough
+    mocker.patch("smo_core.utils.scaling.time.sleep")
+
+    scaling_loop(
+        "test-graph",
+        [False],
+        [20],
+        [5],
+        10.0,
+        False,
+        [5],
+        ["svc1"],
+        5,
+        "/tmp/kubeconfig",
+        "http://prometheus",
+        mock_stop,
+    )
+
+    mock_karmada.scale_deployment.assert_called_once_with("svc1", 1)
+
+
+def test_forecaster_extrapolates_linear_trend():
+    forecaster = RequestRateForecaster(
+        interval=10, level_smoothing=1.0, trend_smoothing=1.0
+    )
+    for value in [10, 20, 30, 40]:
+        forecaster.update(value)
+
+    # Rate increases by 10 RPS every 10s: expect +30 RPS in 30s
+    assert forecaster.forecast(30) == pytest.approx(70)
+
+
+def test_forecaster_ewma_without_trend():
+    forecaster = RequestRateForecaster(
+        interval=5, level_smoothing=0.5, trend_smoothing=0.0
+    )
+    for value in [10, 10, 20]:
+        forecaster.update(value)
+
+    assert forecaster.forecast(60) == pytest.approx(15)
+
+
+def test_forecaster_never_negative():
+    forecaster = RequestRateForecaster(interval=10, level_smoothing=1.0)
+    for value in [40, 30, 20, 10]:
+        forecaster.update(value)
+
+    assert forecaster.forecast(100) == 0.0
+
+
+def test_backtest_forecaster_perfect_on_constant_series():
+    metrics = backtest_forecaster([5.0] * 20, interval=10, lead_time=30)
+
+    assert metrics["samples"] > 0
+    assert metrics["mae"] == pytest.approx(0.0)
+    assert metrics["mape"] == pytest.approx(0.0)
+
+
+def test_predict_request_rates_does_not_go_below_observed():
+    forecasters = [RequestRateForecaster(interval=10, level_smoothing=1.0)]
+    predict_request_rates(forecasters, [100.0], 60, ["svc"])
+    rates = predict_request_rates(forecasters, [50.0], 60, ["svc"])
+
+    assert rates == [50.0]
+
+
+def test_predict_request_rates_of_an_idle_service(capsys):
+    forecasters = [RequestRateForecaster(interval=10)]
+    for _ in range(10):
+        rates = predict_request_rates(forecasters, [0.0], 10, ["svc"])
+
+    assert rates == [0.0]
+    assert forecasters[0].metrics()["mape"] is None
+    output = capsys.readouterr().out
+    assert "MAE 0.00" in output
+    assert "MAPE" not in output
+
+
+@pytest.mark.parametrize(
+    "intent, expected",
+    [
+        ({}, None),
+        ({"predictiveScaling": {"enabled": False, "leadTime": 60}}, None),
+        ({"predictiveScaling": {"enabled": True, "leadTime": 60}}, 60.0),
+        ({"predictiveScaling": {"enabled": "True", "leadTime": "45"}}, 45.0),
+    ],
+)
+def test_forecast_lead_time_from_intent(intent, expected):
+    assert forecast_lead_time_from_intent({"hdaGraphIntent": intent}) == expected
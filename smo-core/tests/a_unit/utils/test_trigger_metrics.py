@@ -0,0 +1,51 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from smo_core.models import Graph, Service
+from smo_core.models.base import Base
+from smo_core.utils.trigger_metrics import parse_timestamp, render_trigger_metrics
+
+
+def test_parse_timestamp():
+    assert parse_timestamp("2025-03-01T12:00:01.123456789Z") == datetime(
+        2025, 3, 1, 12, 0, 1, 123456, tzinfo=UTC
+    )
+    assert parse_timestamp("2025-03-01T12:00:01+02:00").hour == 12
+    assert parse_timestamp("2025-03-01T12:00:01.5Z").microsecond == 500000
+    # Go zero time, sent when unknown
+    assert parse_timestamp("0001-01-01T00:00:00Z") is None
+    assert parse_timestamp("not a date") is None
+    assert parse_timestamp(None) is None
+
+
+def test_render_trigger_metrics():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    triggered_at = datetime(2025, 3, 1, 12, 0, 0, tzinfo=UTC)
+
+    with sessionmaker(bind=engine)() as session:
+        graph = Graph(name="g1", project="p", status="Running", graph_descriptor={})
+        graph.services = [
+            Service(
+                name="s1",
+                status="Deployed",
+                triggered_at=triggered_at,
+                trigger_latency=1.5,
+            ),
+            # Never triggered
+            Service(name="s2", status="Pending"),
+        ]
+        session.add(graph)
+        session.commit()
+
+        lines = render_trigger_metrics(session).splitlines()
+
+    assert "# TYPE smo_trigger_latency_seconds gauge" in lines
+    assert 'smo_trigger_latency_seconds{graph="g1",service="s1"} 1.5' in lines
+    assert (
+        'smo_trigger_timestamp_seconds{graph="g1",service="s1"} '
+        f"{triggered_at.timestamp()}"
+    ) in lines
+    assert not any('service="s2"' in line for line in lines)
@@ -7,6 +7,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from smo_core.context import SmoCoreContext
+from smo_core.helpers.karmada_helper import DeploymentStatus
 from smo_core.models.base import Base
 from smo_core.utils import format_memory
 
@@ -51,6 +52,15 @@ class MockKarmadaHelper:
     def get_replicas(self, name):
         return self.deployments.get(name, {}).get("replicas", 0)
 
+    def get_deployments_status(self, namespace=None, label_selector=None, names=None):
+        return {
+            name: DeploymentStatus(
+                name, d["replicas"], d["replicas"], d["cpu_limit"], None
+            )
+            for name, d in self.deployments.items()
+            if names is None or name in names
+        }
+
     def get_cpu_limit(self, name):
         return self.deployments.get(name, {}).get("cpu_limit", 0)
 
@@ -65,11 +75,14 @@ class MockPrometheusHelper:
 
     def __init__(self, *args, **kwargs):
         self.update_alert_rules = MagicMock()
+        self.update_alert_rules_batch = MagicMock()
+        self.create_graph_rules = MagicMock()
+        self.delete_graph_rules = MagicMock()
 
     def get_request_rate(self, name):
         return 10.0
 
-    # update_alert_rules is a MagicMock, so we can assert calls on it
+    # The rule update methods are MagicMocks, so we can assert calls on them
 
 
 class MockGrafanaHelper:
@@ -0,0 +1,197 @@
+from http import HTTPStatus
+from typing import Any, cast
+
+import httpx
+
+from ... import errors
+from ...client import AuthenticatedClient, Client
+from ...models.problem import Problem
+from ...models.smo_web_handlers_graph_update_json_body import (
+    SmoWebHandlersGraphUpdateJsonBody,
+)
+from ...types import Response
+
+
+def _get_kwargs(
+    name: str,
+    *,
+    body: SmoWebHandlersGraphUpdateJsonBody,
+) -> dict[str, Any]:
+    headers: dict[str, Any] = {}
+
+    _kwargs: dict[str, Any] = {
+        "method": "put",
+        "url": f"/graphs/{name}",
+    }
+
+    _kwargs["json"] = body.to_dict()
+
+    headers["Content-Type"] = "application/json"
+
+    _kwargs["headers"] = headers
+    return _kwargs
+
+
+def _parse_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response
+) -> Any | Problem | None:
+    if response.status_code == 202:
+        response_202 = cast(Any, None)
+        return response_202
+    if response.status_code == 400:
+        response_400 = Problem.from_dict(response.json())
+
+        return response_400
+    if response.status_code == 404:
+        response_404 = Problem.from_dict(response.json())
+
+        return response_404
+    if client.raise_on_unexpected_status:
+        raise errors.UnexpectedStatus(response.status_code, response.content)
+    else:
+        return None
+
+
+def _build_response(
+    *, client: AuthenticatedClient | Client, response: httpx.Response
+) -> Response[Any | Problem]:
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
+
+
+def sync_detailed(
+    name: str,
+    *,
+    client: AuthenticatedClient | Client,
+    body: SmoWebHandlersGraphUpdateJsonBody,
+) -> Response[Any | Problem]:
+    """Update a graph
+
+     Updates a graph to a new version of its descriptor. Only the services that changed are acted
+    on: removed services are uninstalled, added ones installed, and changed ones upgraded and placed
+    again.
+
+    Args:
+        name (str):
+        body (SmoWebHandlersGraphUpdateJsonBody):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[Any, Problem]]
+    """
+
+    kwargs = _get_kwargs(
+        name=name,
+        body=body,
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _build_response(client=client, response=response)
+
+
+def sync(
+    name: str,
+    *,
+    client: AuthenticatedClient | Client,
+    body: SmoWebHandlersGraphUpdateJsonBody,
+) -> Any | Problem | None:
+    """Update a graph
+
+     Updates a graph to a new version of its descriptor. Only the services that changed are acted
+    on: removed services are uninstalled, added ones installed, and changed ones upgraded and placed
+    again.
+
+    Args:
+        name (str):
+        body (SmoWebHandlersGraphUpdateJsonBody):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[Any, Problem]
+    """
+
+    return sync_detailed(
+        name=name,
+        client=client,
+        body=body,
+    ).parsed
+
+
+async def asyncio_detailed(
+    name: str,
+    *,
+    client: AuthenticatedClient | Client,
+    body: SmoWebHandlersGraphUpdateJsonBody,
+) -> Response[Any | Problem]:
+    """Update a graph
+
+     Updates a graph to a new version of its descriptor. Only the services that changed are acted
+    on: removed services are uninstalled, added ones installed, and changed ones upgraded and placed
+    again.
+
+    Args:
+        name (str):
+        body (SmoWebHandlersGraphUpdateJsonBody):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Response[Union[Any, Problem]]
+    """
+
+    kwargs = _get_kwargs(
+        name=name,
+        body=body,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _build_response(client=client, response=response)
+
+
+async def asyncio(
+    name: str,
+    *,
+    client: AuthenticatedClient | Client,
+    body: SmoWebHandlersGraphUpdateJsonBody,
+) -> Any | Problem | None:
+    """Update a graph
+
+     Updates a graph to a new version of its descriptor. Only the services that changed are acted
+    on: removed services are uninstalled, added ones installed, and changed ones upgraded and placed
+    again.
+
+    Args:
+        name (str):
+        body (SmoWebHandlersGraphUpdateJsonBody):
+
+    Raises:
+        errors.UnexpectedStatus: If the server returns an undocumented status code and Client.raise_on_unexpected_status is True.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Union[Any, Problem]
+    """
+
+    return (
+        await asyncio_detailed(
+            name=name,
+            client=client,
+            body=body,
+        )
+    ).parsed
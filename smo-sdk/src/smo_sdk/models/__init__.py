@@ -6,6 +6,7 @@ from .graph_services_item import GraphServicesItem
 from .problem import Problem
 from .smo_web_handlers_graph_alert_body import SmoWebHandlersGraphAlertBody
 from .smo_web_handlers_graph_deploy_json_body import SmoWebHandlersGraphDeployJsonBody
+from .smo_web_handlers_graph_update_json_body import SmoWebHandlersGraphUpdateJsonBody
 
 __all__ = (
     "Cluster",
@@ -14,4 +15,5 @@ __all__ = (
     "Problem",
     "SmoWebHandlersGraphAlertBody",
     "SmoWebHandlersGraphDeployJsonBody",
+    "SmoWebHandlersGraphUpdateJsonBody",
 )
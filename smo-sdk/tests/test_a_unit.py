@@ -1,11 +1,13 @@
 from smo_sdk.api.clusters import smo_web_handlers_cluster_get_clusters as clusters_api
 from smo_sdk.api.graph import smo_web_handlers_graph_deploy as deploy_api
 from smo_sdk.api.graph import smo_web_handlers_graph_get_graph as get_graph_api
+from smo_sdk.api.graph import smo_web_handlers_graph_update as update_api
 from smo_sdk.client import Client
 from smo_sdk.models import (
     Cluster,
     Problem,
     SmoWebHandlersGraphDeployJsonBody,
+    SmoWebHandlersGraphUpdateJsonBody,
 )
 
 
@@ -46,6 +48,22 @@ def test_post_request_construction(sync_client, mocked_api):
     assert last_request.content == b'{"hdaGraph":{"id":"new-graph"}}'
 
 
+def test_put_update_request_construction(sync_client, mocked_api):
+    """
+    Tests that a graph update is sent as a PUT on the graph, with its descriptor.
+    """
+    request_dict = {"hdaGraph": {"id": "my-graph"}}
+    request_body_model = SmoWebHandlersGraphUpdateJsonBody.from_dict(request_dict)
+
+    route = mocked_api.put("/graphs/my-graph").respond(202, text="Accepted")
+
+    update_api.sync(client=sync_client, name="my-graph", body=request_body_model)
+
+    assert route.called
+    last_request = route.calls.last.request
+    assert last_request.content == b'{"hdaGraph":{"id":"my-graph"}}'
+
+
 def test_api_returns_404_error(sync_client, mocked_api):
     """
     Tests that a documented 404 error returns a Problem model, not an exception.
@@ -6,8 +6,15 @@ from dishka import Provider, Scope, provide
 from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
-from smo_core.helpers import GrafanaHelper, KarmadaHelper, PrometheusHelper
-from smo_core.models.base import Base
+from smo_core.helpers import (
+    AsyncKarmadaHelper,
+    AsyncPrometheusHelper,
+    GrafanaHelper,
+    KarmadaHelper,
+    KubeClientSettings,
+    PrometheusHelper,
+)
+from smo_core.models import init_db
 from smo_core.services.cluster_service import ClusterService
 from smo_core.services.graph_service import GraphService
 from smo_core.services.scaler_service import ScalerService
@@ -22,8 +29,11 @@ CONFIG = {
     },
     "helm": {"insecure_registry": True},
     "karmada_kubeconfig": "/Users/fermigier/.kube/karmada-apiserver.config",
+    "kubernetes": {"pool_size": 16, "qps": 50, "burst": 100},
     "prometheus_host": "http://localhost:9090",
+    "prometheus_reload_window": 1.0,
     "scaling": {"interval_seconds": 30},
+    "artifact_cache": {"enabled": True},
     "db": {
         "url": f"sqlite:///{SMO_DIR}/smo.db",
     },
@@ -45,7 +55,7 @@ class DbProvider(Provider):
     @provide(scope=Scope.REQUEST)
     def get_db_engine(self, config: Config) -> Engine:
         engine = create_engine(config.get("db.url"))
-        Base.metadata.create_all(engine)
+        init_db(engine)
         return engine
 
     @provide(scope=Scope.REQUEST)
@@ -66,15 +76,29 @@ class InfraProvider(Provider):
 
     @provide
     def get_karmada(self, config: Config) -> KarmadaHelper:
-        return KarmadaHelper(config.get("karmada_kubeconfig"))
+        return KarmadaHelper(
+            config.get("karmada_kubeconfig"),
+            settings=KubeClientSettings.from_dict(config.get("kubernetes")),
+        )
 
     @provide
     def get_prometheus(self, config: Config) -> PrometheusHelper:
         return PrometheusHelper(
             config.get("prometheus_host"),
             time_window=str(config.get("scaling.interval_seconds")),
+            reload_window=float(config.get("prometheus_reload_window", 1.0)),
         )
 
+    @provide
+    def get_async_karmada(self, karmada: KarmadaHelper) -> AsyncKarmadaHelper:
+        return AsyncKarmadaHelper(karmada)
+
+    @provide
+    def get_async_prometheus(
+        self, prometheus: PrometheusHelper
+    ) -> AsyncPrometheusHelper:
+        return AsyncPrometheusHelper(prometheus)
+
     @provide
     def get_grafana(self, config: Config) -> GrafanaHelper:
         return GrafanaHelper(
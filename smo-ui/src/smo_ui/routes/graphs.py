@@ -1,12 +1,16 @@
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
 from fastapi import APIRouter, Form, HTTPException, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
+from kubernetes.client.rest import ApiException
 from sqlalchemy.orm import Session
 from starlette.status import HTTP_303_SEE_OTHER
+from urllib3.exceptions import HTTPError
 
+from smo_core.helpers import AsyncKarmadaHelper
+from smo_core.helpers.karmada_helper import graph_label_selector
 from smo_core.models import Graph
 from smo_core.services.graph_service import GraphService
-from smo_core.utils import get_graph_from_artifact
+from smo_core.utils import get_graph_from_artifact_async
 from smo_ui.templating import templates
 
 router = APIRouter(prefix="/graphs", route_class=DishkaRoute)
@@ -41,7 +45,11 @@ async def deploy_post(
     descriptor_url: str = Form(..., alias="descriptor-url"),
     project_name: str = Form(..., alias="project-name"),
 ):
-    graph_descriptor = get_graph_from_artifact(descriptor_url)["hdaGraph"]
+    graph_descriptor = (
+        await get_graph_from_artifact_async(
+            descriptor_url, graph_service.artifact_cache
+        )
+    )["hdaGraph"]
     graph_service.deploy_graph(project_name, graph_descriptor)
     graph_id = graph_descriptor["id"]
     # Redirect to the new graph's detail page
@@ -72,16 +80,29 @@ async def graph_details(
     request: Request,
     graph_id: str,
     graph_service: FromDishka[GraphService],
+    karmada: FromDishka[AsyncKarmadaHelper],
 ):
     graph = graph_service.get_graph(graph_id)
     if not graph:
         raise HTTPException(status_code=404, detail=f"Graph '{graph_id}' not found.")
 
+    # Read the status of all the deployments of the graph at once, off the event loop
+    try:
+        statuses = await karmada.get_deployments_status(
+            namespace=graph.project,
+            label_selector=graph_label_selector(graph.name),
+            names=[service.name for service in graph.services],
+        )
+    except (ApiException, HTTPError, OSError) as e:
+        print(f"Warning: could not read the deployments of graph {graph_id}: {e}")
+        statuses = {}
+
     return templates.TemplateResponse(
         request,
         "graph_details.html",
         {
             "graph": graph.to_dict(),
+            "statuses": {name: st.to_dict() for name, st in statuses.items()},
             "graph_id": graph_id,
             "active_page": "projects",
         },
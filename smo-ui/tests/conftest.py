@@ -5,6 +5,8 @@ import pytest
 from dishka import Provider, Scope, make_async_container, provide
 from fastapi.testclient import TestClient
 
+from smo_core.helpers import AsyncKarmadaHelper
+from smo_core.helpers.karmada_helper import DeploymentStatus
 from smo_core.models import Cluster, Graph
 from smo_core.services.cluster_service import ClusterService
 from smo_core.services.graph_service import GraphService
@@ -64,6 +66,13 @@ class MockGraphService:
         return {"id": "graph-from-oci", "hdaGraph": {"id": "graph-from-oci"}}
 
 
+class MockAsyncKarmadaHelper:
+    async def get_deployments_status(
+        self, namespace=None, label_selector=None, names=None
+    ) -> dict:
+        return {name: DeploymentStatus(name, 2, 2, 0.5, None) for name in names or []}
+
+
 @pytest.fixture
 def mock_graph_service() -> MockGraphService:
     """Fixture to provide an instance of the mock graph service."""
@@ -96,6 +105,10 @@ def client(
         def get_cluster_service(self) -> ClusterService:
             return MockClusterService()
 
+        @provide
+        def get_async_karmada(self) -> AsyncKarmadaHelper:
+            return MockAsyncKarmadaHelper()
+
     providers = [
         DbProvider(),
         ConfigProvider(),
@@ -1,7 +1,10 @@
+import contextlib
+
 import connexion
 from connexion.options import SwaggerUIOptions
 
 from .error_handlers import register_error_handlers
+from .util import start_cluster_sync, start_job_worker
 
 swagger_ui_options = SwaggerUIOptions(
     swagger_ui=True,
@@ -9,9 +12,25 @@ swagger_ui_options = SwaggerUIOptions(
 )
 
 
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    """Runs the workers of the graph jobs and the cluster sync along with the app."""
+    cluster_sync = start_cluster_sync()
+    worker = start_job_worker()
+    try:
+        yield
+    finally:
+        if worker is not None:
+            # Interrupted jobs are run again once their heartbeat is stale
+            worker.stop(timeout=5)
+        if cluster_sync is not None:
+            cluster_sync.stop()
+
+
 def create_app(config_name: str = "") -> connexion.AsyncApp:
     app = connexion.AsyncApp(
         __name__,
+        lifespan=lifespan,
         specification_dir="swagger",
         swagger_ui_options=swagger_ui_options,
     )
@@ -22,15 +22,27 @@ ENV_VARS = {
     "DB_NAME": "smo",
     "SQLALCHEMY_URI": "",
     "KARMADA_KUBECONFIG": "karmada-apiserver.config",
-    #
     "GRAFANA_HOST": "http://grafana.orb.local/",
     "GRAFANA_USERNAME": "admin",
     "GRAFANA_PASSWORD": "admin",
     "PROMETHEUS_HOST": "http://127.0.0.1:30090",
-    #
     "SCALING_INTERVAL": "30",
     "SCALING_ENABLED": "False",
     "INSECURE_REGISTRY": "True",
+    # "helm" (run helm) or "native" (server-side apply of the rendered charts)
+    "HELM_ENGINE": "helm",
+    # Services moved at once by a re-placement, and how long (seconds) to
+    # wait for a moved service to be ready on its new cluster
+    "MIGRATION_MAX_CONCURRENT": "2",
+    "MIGRATION_READINESS_TIMEOUT": "300",
+    # Background workers running the graph lifecycle jobs (0: none in the
+    # web process), and attempts of each job before giving up
+    "JOBS_WORKERS": "4",
+    "JOBS_MAX_ATTEMPTS": "3",
+    # Keep the cluster table in sync with Karmada (watch) in the web process
+    "CLUSTER_SYNC_ENABLED": "True",
+    "ARTIFACT_CACHE_ENABLED": "True",
+    "ARTIFACT_CACHE_DIR": str(Path(HOME) / ".smo" / "cache" / "artifacts"),
 }
 
 # Please the static checker
@@ -46,6 +58,14 @@ GRAFANA_USERNAME = ""
 GRAFANA_PASSWORD = ""
 PROMETHEUS_HOST = ""
 INSECURE_REGISTRY = True
+HELM_ENGINE = ""
+MIGRATION_MAX_CONCURRENT = ""
+MIGRATION_READINESS_TIMEOUT = ""
+JOBS_WORKERS = ""
+JOBS_MAX_ATTEMPTS = ""
+CLUSTER_SYNC_ENABLED = True
+ARTIFACT_CACHE_ENABLED = True
+ARTIFACT_CACHE_DIR = ""
 
 
 def get_boolean(value: str | bool) -> bool:
@@ -85,6 +105,22 @@ SMO_CORE_CONFIG = {
     "prometheus_host": PROMETHEUS_HOST,
     "helm": {
         "insecure_registry": get_boolean(INSECURE_REGISTRY),
+        "engine": HELM_ENGINE,
+    },
+    "migration": {
+        "max_concurrent": int(MIGRATION_MAX_CONCURRENT),
+        "readiness_timeout_seconds": float(MIGRATION_READINESS_TIMEOUT),
+    },
+    "jobs": {
+        "workers": int(JOBS_WORKERS),
+        "max_attempts": int(JOBS_MAX_ATTEMPTS),
+    },
+    "cluster_sync": {
+        "enabled": get_boolean(CLUSTER_SYNC_ENABLED),
+    },
+    "artifact_cache": {
+        "enabled": get_boolean(ARTIFACT_CACHE_ENABLED),
+        "dir": ARTIFACT_CACHE_DIR,
     },
 }
 
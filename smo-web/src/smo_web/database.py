@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from smo_core.models.base import Base
+from smo_core.models import init_db
 
 
 @dataclass
@@ -29,9 +29,8 @@ class DbManager:
 
     def init_db(self):
         """
-        Creates all tables in the database.
-        This function imports all necessary models from smo_core before calling create_all
-        to ensure they are registered on the Base's metadata.
+        Creates all tables in the database, and adds the columns missing from
+        the tables created by earlier versions (see smo_core.models.schema).
         """
         engine = self.get_engine()
-        Base.metadata.create_all(bind=engine)
+        init_db(engine)
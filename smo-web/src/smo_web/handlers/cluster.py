@@ -1,17 +1,23 @@
-from connexion import request
-from devtools import debug
-
-from smo_core.services import cluster_service
+from smo_core.services.cluster_service import ClusterService
 from smo_web.util import get_core_context, get_db_session
 
 
 def get_clusters():
-    """Handler for GET /clusters, linked by operationId."""
-    debug(request)
-    debug(dir(request))
-    debug(vars(request))
+    """
+    Handler for GET /clusters, linked by operationId.
+
+    Clusters are read from the DB, which is kept up to date in the background
+    by the `ClusterInventorySync` started with the app (see `app.lifespan`),
+    so the request doesn't wait for a full sync with Karmada.
+    """
     context = get_core_context()
     db_session = get_db_session()
 
-    clusters = cluster_service.fetch_clusters(context, db_session)
+    cluster_service = ClusterService(
+        db_session=db_session,
+        karmada_helper=context.karmada,
+        grafana_helper=context.grafana,
+        config=context.config,
+    )
+    clusters = [c.to_dict() for c in cluster_service.list_clusters()]
     return clusters, 200, {"Content-Type": "application/json"}
@@ -1,4 +1,13 @@
-from smo_core.services import GraphService
+from smo_core.services import GraphService, JobService
+from smo_core.services.job_service import (
+    DEPLOY,
+    PLACEMENT,
+    REMOVE,
+    START,
+    STOP,
+    UPDATE,
+)
+from smo_core.utils import get_graph_from_artifact
 from smo_web.util import get_core_context, get_db_session
 
 
@@ -23,14 +32,31 @@ def get_all_for_project(project):
     return [graph for graph in graphs], 200, {"Content-Type": "application/json"}
 
 
-def deploy(project, body):
-    """Handler for POST /project/{project}/graphs."""
-    graph_service = _get_graph_service()
+def _enqueue(kind: str, name: str, project=None, payload=None):
+    """Queues a lifecycle job of a graph, run in the background by a `JobWorker`."""
+    context = get_core_context()
+    job_service = JobService(get_db_session())
+    job = job_service.enqueue(
+        kind,
+        name,
+        project=project,
+        payload=payload,
+        max_attempts=context.config.get("jobs", {}).get("max_attempts", 1),
+    )
+    return job.to_dict(), 202, {"Location": f"/jobs/{job.id}"}
+
+
+def _get_existing_graph(graph_service: GraphService, name: str):
+    graph = graph_service.get_graph(name)
+    if not graph:
+        raise ValueError(f"Graph with name {name} not found")
+    return graph
 
+
+def _get_graph_descriptor(graph_service: GraphService, body) -> dict:
     if isinstance(body, dict) and "artifact" in body:
-        # FIXME
-        descriptor = graph_service.get_descriptor_from_artifact(
-            project, body["artifact"]
+        descriptor = get_graph_from_artifact(
+            body["artifact"], graph_service.artifact_cache
         )
     else:
         descriptor = body
@@ -38,54 +64,60 @@ def deploy(project, body):
     graph_descriptor = descriptor.get("hdaGraph")
     if not graph_descriptor:
         raise ValueError("hdaGraph key not found in the provided descriptor")
+    return graph_descriptor
+
+
+def deploy(project, body):
+    """Handler for POST /project/{project}/graphs."""
+    graph_service = _get_graph_service()
 
-    graph_service.deploy_graph(project, graph_descriptor)
-    return "Graph deployment triggered successfully", 202
+    graph_descriptor = _get_graph_descriptor(graph_service, body)
+    name = graph_descriptor["id"]
+    graph = graph_service.get_graph(name)
+    if graph is not None and not graph_service.can_resume_deploy(
+        graph, project, graph_descriptor
+    ):
+        # A failed deployment of the same descriptor is resumed
+        raise ValueError(f"Graph with name {name} already exists")
+
+    return _enqueue(DEPLOY, name, project, {"descriptor": graph_descriptor})
 
 
 def get_graph(name):
     graph_service = _get_graph_service()
-    graph = graph_service.get_graph(name)
-    if not graph:
-        raise ValueError(f"Graph with name {name} not found")
+    graph = _get_existing_graph(graph_service, name)
     return graph.to_dict(), 200, {"Content-Type": "application/json"}
 
 
-def remove(name):
+def update(name, body):
+    """Handler for PUT /graphs/{name}."""
     graph_service = _get_graph_service()
-    graph_service.remove_graph(name)
-    return (
-        f"Graph {name} removed successfully",
-        200,
-        {"Content-Type": "application/json"},
-    )
+    graph = _get_existing_graph(graph_service, name)
+
+    graph_descriptor = _get_graph_descriptor(graph_service, body)
+    if graph_descriptor.get("id") != name:
+        raise ValueError(f"The descriptor is not the one of graph {name}")
+    return _enqueue(UPDATE, name, graph.project, {"descriptor": graph_descriptor})
+
+
+def remove(name):
+    _get_existing_graph(_get_graph_service(), name)
+    return _enqueue(REMOVE, name)
 
 
 def start(name):
-    graph_service = _get_graph_service()
-    graph_service.start_graph(name)
-    return (
-        f"Graph {name} start triggered successfully",
-        200,
-        {"Content-Type": "application/json"},
-    )
+    _get_existing_graph(_get_graph_service(), name)
+    return _enqueue(START, name)
 
 
 def stop(name):
-    graph_service = _get_graph_service()
-    graph_service.stop_graph(name)
-    return (
-        f"Graph {name} stop triggered successfully",
-        200,
-        {"Content-Type": "application/json"},
-    )
+    _get_existing_graph(_get_graph_service(), name)
+    return _enqueue(STOP, name)
 
 
 def placement(name):
-    graph_service = _get_graph_service()
-    graph_service.start_graph(name)
-    graph_service.trigger_placement(name)
-    return f"Placement of graph {name} triggered", 200
+    _get_existing_graph(_get_graph_service(), name)
+    return _enqueue(PLACEMENT, name)
 
 
 def alert(body):
@@ -0,0 +1,30 @@
+from smo_core.services import JobService
+from smo_web.util import get_db_session
+
+
+def _get_job_or_raise(job_service: JobService, job_id: int):
+    job = job_service.get_job(job_id)
+    if not job:
+        raise ValueError(f"Job {job_id} not found")
+    return job
+
+
+def get_jobs(graph=None, status=None):
+    """Handler for GET /jobs."""
+    job_service = JobService(get_db_session())
+    jobs = job_service.list_jobs(graph_name=graph or "", status=status or "")
+    return [job.to_dict() for job in jobs], 200, {"Content-Type": "application/json"}
+
+
+def get_job(job_id):
+    """Handler for GET /jobs/{job_id}: status and progress of a job."""
+    job = _get_job_or_raise(JobService(get_db_session()), job_id)
+    return job.to_dict(), 200, {"Content-Type": "application/json"}
+
+
+def retry(job_id):
+    """Handler for POST /jobs/{job_id}/retry: runs a failed job again."""
+    job_service = JobService(get_db_session())
+    _get_job_or_raise(job_service, job_id)
+    job = job_service.retry(job_id)
+    return job.to_dict(), 202, {"Location": f"/jobs/{job.id}"}
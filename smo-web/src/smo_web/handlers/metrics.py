@@ -0,0 +1,15 @@
+from smo_core.utils.trigger_metrics import render_trigger_metrics
+from smo_web.util import get_db_session
+
+
+def get_metrics():
+    """
+    Handler for GET /metrics: the latency of the deployments of triggered
+    conditional services, in the Prometheus text format.
+
+    The metrics are read from the DB, so that they include the services
+    deployed by other processes (e.g. `smo-cli graph triggers`).
+    """
+    with get_db_session() as db_session:
+        metrics = render_trigger_metrics(db_session)
+    return metrics, 200, {"Content-Type": "text/plain; version=0.0.4"}
@@ -6,8 +6,14 @@ from dishka import Provider, Scope, provide
 from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
-from smo_core.helpers import GrafanaHelper, KarmadaHelper, PrometheusHelper
-from smo_core.models.base import Base
+from smo_core.helpers import (
+    AsyncKarmadaHelper,
+    AsyncPrometheusHelper,
+    GrafanaHelper,
+    KarmadaHelper,
+    PrometheusHelper,
+)
+from smo_core.models import init_db
 from smo_core.services.cluster_service import ClusterService
 from smo_core.services.graph_service import GraphService
 from smo_core.services.scaler_service import ScalerService
@@ -24,6 +30,7 @@ CONFIG = {
     "karmada_kubeconfig": "/Users/fermigier/.kube/karmada-apiserver.config",
     "prometheus_host": "http://localhost:9090",
     "scaling": {"interval_seconds": 30},
+    "artifact_cache": {"enabled": True},
     "db": {
         "url": f"sqlite:///{SMO_DIR}/smo.db",
     },
@@ -45,7 +52,7 @@ class DbProvider(Provider):
     @provide(scope=Scope.REQUEST)
     def get_db_engine(self, config: Config) -> Engine:
         engine = create_engine(config.get("db.url"))
-        Base.metadata.create_all(engine)
+        init_db(engine)
         return engine
 
     @provide(scope=Scope.REQUEST)
@@ -73,8 +80,19 @@ class InfraProvider(Provider):
         return PrometheusHelper(
             config.get("prometheus_host"),
             time_window=str(config.get("scaling.interval_seconds")),
+            reload_window=float(config.get("prometheus_reload_window", 1.0)),
         )
 
+    @provide
+    def get_async_karmada(self, karmada: KarmadaHelper) -> AsyncKarmadaHelper:
+        return AsyncKarmadaHelper(karmada)
+
+    @provide
+    def get_async_prometheus(
+        self, prometheus: PrometheusHelper
+    ) -> AsyncPrometheusHelper:
+        return AsyncPrometheusHelper(prometheus)
+
     @provide
     def get_grafana(self, config: Config) -> GrafanaHelper:
         return GrafanaHelper(
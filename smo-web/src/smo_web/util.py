@@ -1,5 +1,6 @@
 from smo_core.context import SmoCoreContext
 from smo_core.helpers import GrafanaHelper, KarmadaHelper, PrometheusHelper
+from smo_core.services import ClusterInventorySync, JobWorker
 
 from .config import config
 from .database import DbManager
@@ -27,3 +28,47 @@ def get_db_session():
     db_manager = DbManager(config)
     session_factory = db_manager.get_session_factory()
     return session_factory()
+
+
+def start_job_worker() -> JobWorker | None:
+    """
+    Starts the workers running the queued graph jobs in this process, unless
+    they are disabled (`jobs.workers` set to 0).
+    """
+    workers = config["SMO_CORE_CONFIG"].get("jobs", {}).get("workers", 4)
+    if workers <= 0:
+        return None
+    context = get_core_context()
+    db_manager = DbManager(config)
+    db_manager.init_db()
+    worker = JobWorker(
+        karmada_helper=context.karmada,
+        grafana_helper=context.grafana,
+        prom_helper=context.prometheus,
+        config=context.config,
+        session_factory=db_manager.get_session_factory(),
+        workers=workers,
+    )
+    worker.start()
+    return worker
+
+
+def start_cluster_sync() -> ClusterInventorySync | None:
+    """
+    Starts the background sync of the cluster table with Karmada, which
+    `GET /clusters` and the placement of graphs read, unless it is disabled
+    (`cluster_sync.enabled` set to False).
+    """
+    if not config["SMO_CORE_CONFIG"].get("cluster_sync", {}).get("enabled", True):
+        return None
+    context = get_core_context()
+    db_manager = DbManager(config)
+    db_manager.init_db()
+    cluster_sync = ClusterInventorySync(
+        context.karmada,
+        context.grafana,
+        context.config,
+        db_manager.get_session_factory(),
+    )
+    cluster_sync.start()
+    return cluster_sync